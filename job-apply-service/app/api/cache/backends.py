@@ -0,0 +1,97 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+import redis.asyncio as redis
+
+
+class CacheBackend(ABC):
+    """Storage backend for cached values. Values must be JSON serializable."""
+
+    evictions: int = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value that expires after `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value if present."""
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process cache bounded to `max_size` entries with TTL and LRU eviction."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared across replicas through Redis.
+
+    Expiry is delegated to Redis key TTLs; size-bound eviction is governed by the
+    server's `maxmemory-policy` (e.g. `allkeys-lru`), so evictions are not counted here.
+    """
+
+    def __init__(self, client: redis.Redis, key_prefix: str = "job-apply:"):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.evictions = 0
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "job-apply:") -> "RedisCacheBackend":
+        return cls(redis.from_url(url), key_prefix)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.key_prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self.client.set(self.key_prefix + key, json.dumps(value), px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.key_prefix + key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,136 @@
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+
+from app.api.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.api.utils.metrics import CACHE_LOOKUPS
+from config import config
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobDetailsCache:
+    """
+    Cache for job details fetched from the job listing service.
+
+    Found jobs are kept for `ttl` seconds and 404s for `negative_ttl` seconds, so
+    repeated lookups of popular or missing jobs skip the HTTP call. Jobs stored
+    with an ETag are kept for up to `stale_ttl` seconds after they go stale so
+    they can be revalidated with a conditional request. Backend errors are
+    logged and treated as misses so a cache outage never fails an apply.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float, negative_ttl: float, stale_ttl: float = 0):
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @staticmethod
+    def _key(job_id: int) -> str:
+        return f"job:{job_id}"
+
+    async def get(self, job_id: int) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a job.
+
+        Returns:
+            (hit, job_data) where job_data is None for a cached 404.
+        """
+        hit, job_data, _ = await self.lookup(job_id)
+        return hit, job_data if hit else None
+
+    async def lookup(self, job_id: int) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Look up a job, including stale copies that can still be revalidated.
+
+        Returns:
+            (hit, job_data, etag). On a miss, job_data and etag describe the
+            stale copy if one is still held, otherwise both are None.
+        """
+        try:
+            entry = await self.backend.get(self._key(job_id))
+        except Exception as e:
+            logger.error(f"Job cache read failed for job ID {job_id}: {str(e)}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            CACHE_LOOKUPS.labels("job_details", "miss").inc()
+            return False, None, None
+
+        fresh_until = entry.get("fresh_until")
+        if fresh_until is not None and fresh_until <= time.time():
+            self.misses += 1
+            CACHE_LOOKUPS.labels("job_details", "stale").inc()
+            return False, entry.get("data"), entry.get("etag")
+
+        self.hits += 1
+        CACHE_LOOKUPS.labels("job_details", "hit").inc()
+        return True, entry.get("data"), entry.get("etag")
+
+    async def set(self, job_id: int, job_data: Dict[str, Any], etag: Optional[str] = None) -> None:
+        if not etag:
+            await self._store(job_id, {"data": job_data}, self.ttl)
+            return
+        # Wall-clock freshness so entries shared through Redis agree across replicas
+        entry = {"data": job_data, "etag": etag, "fresh_until": time.time() + self.ttl}
+        await self._store(job_id, entry, max(self.ttl, self.stale_ttl))
+
+    async def revalidate(self, job_id: int, job_data: Dict[str, Any], etag: str) -> None:
+        """Mark a stale copy as fresh again after the origin answered 304 Not Modified."""
+        self.revalidated += 1
+        CACHE_LOOKUPS.labels("job_details", "revalidated").inc()
+        await self.set(job_id, job_data, etag)
+
+    async def set_not_found(self, job_id: int) -> None:
+        await self._store(job_id, {"data": None}, self.negative_ttl)
+
+    async def invalidate(self, job_id: int) -> None:
+        try:
+            await self.backend.delete(self._key(job_id))
+        except Exception as e:
+            logger.error(f"Job cache invalidation failed for job ID {job_id}: {str(e)}")
+
+    async def _store(self, job_id: int, entry: Dict[str, Any], ttl: float) -> None:
+        try:
+            await self.backend.set(self._key(job_id), entry, ttl)
+        except Exception as e:
+            logger.error(f"Job cache write failed for job ID {job_id}: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.backend.evictions,
+        }
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def create_job_details_cache() -> JobDetailsCache:
+    """Build the job details cache using the backend selected in `Config`."""
+    if config.JOB_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend.from_url(config.REDIS_URL)
+    else:
+        backend = InMemoryCacheBackend(max_size=config.JOB_CACHE_MAX_SIZE)
+
+    return JobDetailsCache(
+        backend,
+        ttl=config.JOB_CACHE_TTL,
+        negative_ttl=config.JOB_CACHE_NEGATIVE_TTL,
+        stale_ttl=config.JOB_CACHE_STALE_TTL,
+    )
+
+
+def get_job_details_cache(request: Request) -> JobDetailsCache:
+    """Return the job details cache created in the app lifespan."""
+    return request.app.state.job_cache
@@ -1,8 +1,9 @@
 """ The database module
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
+from app.api.db.pool import engine_options
 from config import BASE_DIR, config
 
 DB_HOST = config.DB_HOST
@@ -18,48 +19,46 @@ def get_db_engine(test_mode: bool = False):
         # For SQLite, use a file in the project root
         if test_mode:
             # Use a test-specific database file
-            DATABASE_URL = f"sqlite:///{BASE_DIR}/test.db"
+            DATABASE_URL = f"sqlite+aiosqlite:///{BASE_DIR}/test.db"
         else:
             # Check for DATABASE_URL in config (from environment variables)
             if hasattr(config, 'database_url') and config.database_url:
                 DATABASE_URL = config.database_url
             else:
-                DATABASE_URL = f"sqlite:///{BASE_DIR}/db.sqlite3"
+                DATABASE_URL = f"sqlite+aiosqlite:///{BASE_DIR}/db.sqlite3"
 
         # Always use check_same_thread=False for SQLite
-        return create_engine(
+        return create_async_engine(
             DATABASE_URL, connect_args={"check_same_thread": False}
         )
     elif DB_TYPE == "postgresql":
         # For PostgreSQL, construct the connection string from components
         DATABASE_URL = (
-            f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_HOST}:{DB_PORT}/{POSTGRES_DB}"
+            f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_HOST}:{DB_PORT}/{POSTGRES_DB}"
         )
-        return create_engine(DATABASE_URL)
+        return create_async_engine(DATABASE_URL, **engine_options(config))
     else:
         # Default to SQLite if DB_TYPE is not recognized
-        DATABASE_URL = f"sqlite:///{BASE_DIR}/db.sqlite3"
-        return create_engine(
+        DATABASE_URL = f"sqlite+aiosqlite:///{BASE_DIR}/db.sqlite3"
+        return create_async_engine(
             DATABASE_URL, connect_args={"check_same_thread": False}
         )
 
 
 engine = get_db_engine()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-db_session = scoped_session(SessionLocal)
+# expire_on_commit=False keeps attributes loaded after commit, avoiding implicit
+# lazy loads that would need to await the database outside the session.
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
-def create_database():
-    return Base.metadata.create_all(bind=engine)
+async def create_database():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def get_db():
-    db = db_session()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
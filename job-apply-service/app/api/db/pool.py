@@ -0,0 +1,117 @@
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.api.utils.metrics import DB_POOL_CHECKOUT, DB_POOL_TIMEOUTS
+
+
+class PoolMetrics:
+    """
+    Counters for database connection checkouts.
+
+    The wait covers everything `Pool.connect()` does before handing out a
+    connection: queueing for a free slot, opening a new connection and the
+    pre-ping round-trip. Checkouts run in SQLAlchemy's greenlet bridge, so the
+    counters are guarded by a lock rather than relying on the event loop. Waits
+    are also exported as the `db_pool_checkout_seconds` Prometheus histogram.
+    """
+
+    def __init__(self, name: str = "primary"):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        if timed_out:
+            DB_POOL_TIMEOUTS.labels(self.name).inc()
+        else:
+            DB_POOL_CHECKOUT.labels(self.name).observe(wait)
+
+    def stats(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """Checkout counters plus the current occupancy of `pool` when it is a queue pool."""
+        with self._lock:
+            attempts = self._checkouts + self._timeouts
+            stats = {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._wait_total / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._checkouts = 0
+            self._timeouts = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+
+
+pool_metrics = PoolMetrics()
+
+
+def timed_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    Subclass a SQLAlchemy pool so every checkout is timed into `metrics`.
+
+    The metrics live on the class, so pools recreated by `engine.dispose()`
+    keep reporting to the same counters.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except PoolTimeoutError:
+            metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.record(time.perf_counter() - start)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect, "metrics": metrics})
+
+
+def engine_options(settings: Any, metrics: PoolMetrics = pool_metrics) -> Dict[str, Any]:
+    """
+    Keyword arguments for `create_async_engine` built from the `DB_POOL_*` settings.
+
+    Behind PgBouncer in transaction mode PgBouncer does the pooling, and
+    consecutive statements may land on different server connections, so
+    asyncpg's prepared statement caches are disabled and statement names are
+    made unique to avoid "prepared statement already exists" errors.
+    """
+    if settings.DB_PGBOUNCER:
+        return {
+            "poolclass": timed_pool_class(NullPool, metrics),
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            },
+        }
+    return {
+        "poolclass": timed_pool_class(AsyncAdaptedQueuePool, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
@@ -0,0 +1,86 @@
+from typing import Dict, Sequence
+
+import brotli
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class BrotliResponder(IdentityResponder):
+    """Streams the response body through a brotli compressor."""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip based on `Accept-Encoding`.
+
+    Encodings are tried in `algorithms` order and the first one the client
+    accepts (with a non-zero q-value) wins. Bodies smaller than `minimum_size`
+    and responses that already carry a `Content-Encoding` are sent as is.
+    Streaming responses are compressed chunk by chunk.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            algorithms: Sequence[str] = ("br", "gzip"),
+            minimum_size: int = 500,
+            gzip_level: int = 6,
+            brotli_quality: int = 4
+    ) -> None:
+        self.app = app
+        self.algorithms = list(algorithms)
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = parse_accept_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        algorithm = next((name for name in self.algorithms if accepted.get(name, 0) > 0), None)
+
+        if algorithm == "br":
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif algorithm == "gzip":
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each encoding in an `Accept-Encoding` header to its q-value."""
+    accepted = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    if "*" in accepted:
+        for name in ("br", "gzip"):
+            accepted.setdefault(name, accepted["*"])
+    return accepted
@@ -1,7 +1,7 @@
-from fastapi.responses import JSONResponse
+from app.api.utils.orjson_response import ORJSONResponse
 
 def error_response(status_code, message):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status_code": status_code,
@@ -1,8 +1,25 @@
+import httpx
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.services.jobs import JobApplicationService
 from app.api.db.database import get_db
+from app.api.utils.http_client import get_http_client
+from app.api.utils.resilience import ResiliencePolicy, get_job_listing_policy
+from app.api.utils.single_flight import SingleFlight, get_job_details_flight
+from app.api.cache.job_details import JobDetailsCache, get_job_details_cache
 
-def get_service(db: Session = Depends(get_db)) -> JobApplicationService:
-    return JobApplicationService(db)
+def get_service(
+        db: AsyncSession = Depends(get_db),
+        http_client: httpx.AsyncClient = Depends(get_http_client),
+        job_cache: JobDetailsCache = Depends(get_job_details_cache),
+        job_details_flight: SingleFlight = Depends(get_job_details_flight),
+        job_listing_policy: ResiliencePolicy = Depends(get_job_listing_policy)
+) -> JobApplicationService:
+    return JobApplicationService(
+        db,
+        http_client,
+        job_cache=job_cache,
+        job_details_flight=job_details_flight,
+        job_listing_policy=job_listing_policy
+    )
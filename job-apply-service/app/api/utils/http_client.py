@@ -0,0 +1,33 @@
+import httpx
+from fastapi import Request
+
+from config import config
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP client shared by all requests for the app's lifetime.
+
+    Connections to the job listing service are kept alive and reused instead of
+    being opened per request. Pool size, keep-alive, HTTP/2 and per-phase
+    timeouts come from `Config`.
+    """
+    return httpx.AsyncClient(
+        http2=config.HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=config.HTTP_CONNECT_TIMEOUT,
+            read=config.HTTP_READ_TIMEOUT,
+            write=config.HTTP_WRITE_TIMEOUT,
+            pool=config.HTTP_POOL_TIMEOUT,
+        ),
+    )
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Return the shared HTTP client created in the app lifespan."""
+    return request.app.state.http_client
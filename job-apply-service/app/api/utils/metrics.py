@@ -0,0 +1,116 @@
+import os
+import time
+
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR (set in
+# gunicorn.conf.py) and /metrics aggregates them; otherwise the default registry is used.
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route", "status"]
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served", ["method"], multiprocess_mode="livesum"
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "Database statement execution time", ["operation"],
+    buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, float("inf"))
+)
+DB_POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds", "Time spent checking out a pooled database connection", ["pool"],
+    buckets=(.0005, .001, .005, .01, .05, .1, .5, 1, 5, float("inf"))
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Checkouts that timed out waiting for a pooled connection", ["pool"]
+)
+OUTBOUND_LATENCY = Histogram(
+    "http_client_request_duration_seconds", "Outbound HTTP call latency", ["service", "status"]
+)
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls_total", "Calls that started the work (leader) or joined one in flight (coalesced)",
+    ["group", "outcome"]
+)
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Job details cache lookups", ["cache", "result"])
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)", ["service"],
+    multiprocess_mode="max"
+)
+CIRCUIT_BREAKER_REJECTIONS = Counter(
+    "circuit_breaker_rejections_total", "Calls failed fast by an open circuit breaker", ["service"]
+)
+OUTBOUND_RETRIES = Counter(
+    "http_client_retries_total", "Outbound retries, by whether the retry budget allowed them", ["service", "outcome"]
+)
+OUTBOUND_HEDGES = Counter(
+    "http_client_hedged_requests_total", "Hedged outbound requests sent, won or denied by the retry budget",
+    ["service", "outcome"]
+)
+
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+class MetricsMiddleware:
+    """
+    Record latency and in-flight requests for every HTTP request.
+
+    Requests are labelled by route template (e.g. `/api/v1/jobs/{application_id}`)
+    rather than the raw path to keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_PROGRESS.labels(method).dec()
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(method, route.path if route else "unmatched", status).observe(
+                time.perf_counter() - start
+            )
+
+
+def metrics_response() -> Response:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        body = generate_latest(registry)
+    else:
+        body = generate_latest()
+    return Response(body, media_type=CONTENT_TYPE_LATEST)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.metrics_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "metrics_start", None)
+    if start is None:
+        return
+    operation = statement.lstrip()[:6].upper()
+    if operation not in SQL_OPERATIONS:
+        operation = "OTHER"
+    DB_QUERY_LATENCY.labels(operation).observe(time.perf_counter() - start)
@@ -0,0 +1,20 @@
+from typing import Any
+
+import orjson
+from fastapi import responses
+
+
+class ORJSONResponse(responses.ORJSONResponse):
+    """
+    FastAPI's orjson response with datetimes encoded as UTC with a `Z` suffix.
+
+    Datetimes, UUIDs and dataclasses are encoded natively, so envelopes can be
+    built straight from ORM attributes without a pydantic `mode="json"` pass.
+    Naive datetimes (SQLite returns `applied_at` without an offset) are taken to
+    be UTC, which is how the database stores them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        )
@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(applied_at: datetime, application_id: int) -> str:
+    """
+    Encode the keyset position of the last application on a page into an opaque cursor.
+
+    Args:
+        applied_at: Timestamp of the last application returned
+        application_id: ID of the last application returned
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([applied_at.isoformat(), application_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        (applied_at, application_id) keyset position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        applied_at, application_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(applied_at), int(application_id)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,349 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from fastapi import Request
+
+from app.api.utils.metrics import (
+    CIRCUIT_BREAKER_REJECTIONS,
+    CIRCUIT_BREAKER_STATE,
+    OUTBOUND_HEDGES,
+    OUTBOUND_RETRIES,
+)
+from config import config
+
+# Statuses that mean the dependency (or a proxy in front of it) is temporarily unable to answer
+RETRYABLE_STATUSES = {502, 503, 504}
+
+
+class DependencyUnavailableError(Exception):
+    """A downstream service failed, timed out or is being failed fast by its circuit breaker."""
+
+    def __init__(self, service: str, reason: str, retry_after: Optional[float] = None):
+        super().__init__(f"{service} unavailable: {reason}")
+        self.service = service
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency keeps failing.
+
+    The circuit opens after `failure_threshold` consecutive failed calls and
+    rejects calls for `reset_timeout` seconds. It then lets a single probe
+    through (half-open): success closes the circuit, failure opens it again.
+    """
+
+    CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, service: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.service = service
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probing = False
+        CIRCUIT_BREAKER_STATE.labels(service).set(0)
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._transition(self.HALF_OPEN)
+        if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._probing):
+            self.rejected += 1
+            CIRCUIT_BREAKER_REJECTIONS.labels(self.service).inc()
+            return False
+        if self.state == self.HALF_OPEN:
+            self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probing = False
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(self.OPEN)
+
+    def release(self) -> None:
+        """Forget a call that ended without an outcome (e.g. the caller was cancelled)."""
+        self._probing = False
+
+    def retry_after(self) -> float:
+        """
+        Seconds a rejected caller should wait before trying again.
+
+        While open this is the time until the next probe; while half-open with
+        a probe in flight the outcome is imminent, so callers are told to wait
+        a second rather than nothing.
+        """
+        if self.state != self.OPEN:
+            return 1.0
+        return max(1.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        CIRCUIT_BREAKER_STATE.labels(self.service).set(self._STATE_VALUES[state])
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures, "rejected": self.rejected}
+
+
+class RetryBudget:
+    """
+    Cap retries and hedged requests at a fraction of calls.
+
+    Every call deposits `ratio` tokens and every retry or hedge withdraws one,
+    so a struggling dependency sees at most `ratio` extra load instead of a
+    retry storm. `min_per_second` tokens also accrue over time so that a
+    quiet worker can still retry. The balance is capped at `max_tokens`.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.exhausted = 0
+        self._updated = time.monotonic()
+
+    def deposit(self) -> None:
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {"tokens": round(self.tokens, 2), "exhausted": self.exhausted}
+
+
+class ResiliencePolicy:
+    """
+    Deadline, jittered retries, hedging and a circuit breaker for one dependency.
+
+    `call(send)` runs `send` (one HTTP attempt, which must be safe to repeat)
+    until it returns an accepted response (by default any status below 500).
+    Connection errors, timeouts and 502/503/504 responses are retried up to
+    `max_retries` times with full jitter backoff, as long as the retry budget
+    allows. With a `hedge_delay`, an attempt still pending after that many
+    seconds is raced against a second request and the first good response
+    wins. The whole call is bound by `deadline` and each attempt by
+    `attempt_timeout`, which defaults to an equal share of the deadline left
+    after the worst-case backoff so a slow attempt is retried instead of using
+    up the deadline. Anything short of an accepted response raises
+    `DependencyUnavailableError`, so callers can tell an outage from a 404.
+    """
+
+    def __init__(
+            self,
+            service: str,
+            breaker: Optional[CircuitBreaker] = None,
+            budget: Optional[RetryBudget] = None,
+            max_retries: int = 0,
+            backoff: float = 0.05,
+            backoff_max: float = 1.0,
+            deadline: Optional[float] = None,
+            hedge_delay: float = 0.0,
+            attempt_timeout: Optional[float] = None
+    ):
+        self.service = service
+        self.breaker = breaker
+        self.budget = budget
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.hedge_delay = hedge_delay
+        if attempt_timeout is None and deadline is not None:
+            attempt_timeout = (deadline - self.max_backoff()) / (max_retries + 1)
+        if attempt_timeout is not None and attempt_timeout <= 0:
+            raise ValueError(f"{service}: deadline {deadline}s leaves no time for {max_retries + 1} attempts")
+        self.attempt_timeout = attempt_timeout
+
+    def max_backoff(self) -> float:
+        """Longest total time spent sleeping between attempts."""
+        return sum(min(self.backoff_max, self.backoff * 2 ** attempt) for attempt in range(1, self.max_retries + 1))
+
+    async def call(
+            self,
+            send: Callable[[], Awaitable[httpx.Response]],
+            accept: Optional[Callable[[httpx.Response], bool]] = None
+    ) -> httpx.Response:
+        """
+        Send the request with retries and return the first accepted response.
+
+        `accept` decides which responses below 500 are usable; any other status
+        fails the call and counts against the circuit breaker.
+        """
+        if self.breaker is not None and not self.breaker.allow():
+            raise DependencyUnavailableError(self.service, "circuit open", self.breaker.retry_after())
+        if self.budget is not None:
+            self.budget.deposit()
+
+        try:
+            response = await asyncio.wait_for(self._call_with_retries(send, accept), self.deadline)
+        except asyncio.TimeoutError:
+            self._record(success=False)
+            raise DependencyUnavailableError(self.service, f"no response within {self.deadline}s")
+        except DependencyUnavailableError:
+            self._record(success=False)
+            raise
+        except asyncio.CancelledError:
+            if self.breaker is not None:
+                self.breaker.release()
+            raise
+        self._record(success=True)
+        return response
+
+    async def _call_with_retries(
+            self,
+            send: Callable[[], Awaitable[httpx.Response]],
+            accept: Optional[Callable[[httpx.Response], bool]]
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                response = await asyncio.wait_for(self._attempt(send, accept), self.attempt_timeout)
+                if self._accepted(response, accept):
+                    return response
+                failure, retryable = f"HTTP {response.status_code}", response.status_code in RETRYABLE_STATUSES
+                if response.status_code == 429:
+                    retry_after = _retry_after_header(response)
+            except asyncio.TimeoutError:
+                failure, retryable = f"no response within {self.attempt_timeout:.2f}s", True
+            except httpx.TransportError as e:
+                failure, retryable = str(e) or type(e).__name__, True
+            except Exception as e:
+                failure, retryable = str(e) or type(e).__name__, False
+
+            if not retryable or attempt >= self.max_retries:
+                raise DependencyUnavailableError(self.service, failure, retry_after)
+            if self.budget is not None and not self.budget.withdraw():
+                OUTBOUND_RETRIES.labels(self.service, "budget_exhausted").inc()
+                raise DependencyUnavailableError(self.service, f"{failure} (retry budget exhausted)")
+            OUTBOUND_RETRIES.labels(self.service, "retried").inc()
+            attempt += 1
+            await asyncio.sleep(random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt)))
+
+    async def _attempt(
+            self,
+            send: Callable[[], Awaitable[httpx.Response]],
+            accept: Optional[Callable[[httpx.Response], bool]]
+    ) -> httpx.Response:
+        if self.hedge_delay <= 0:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if done:
+                return primary.result()
+            if self.budget is not None and not self.budget.withdraw():
+                OUTBOUND_HEDGES.labels(self.service, "budget_exhausted").inc()
+                return await primary
+            OUTBOUND_HEDGES.labels(self.service, "sent").inc()
+            hedge = asyncio.ensure_future(send())
+            tasks.add(hedge)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and self._accepted(task.result(), accept):
+                        if task is hedge:
+                            OUTBOUND_HEDGES.labels(self.service, "won").inc()
+                        return task.result()
+            # Both attempts failed; report the original one
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    def _accepted(response: httpx.Response, accept: Optional[Callable[[httpx.Response], bool]]) -> bool:
+        return response.status_code < 500 and (accept is None or accept(response))
+
+    def _record(self, success: bool) -> None:
+        if self.breaker is None:
+            return
+        if success:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "circuit": self.breaker.stats() if self.breaker is not None else None,
+            "retry_budget": self.budget.stats() if self.budget is not None else None,
+        }
+
+
+def _retry_after_header(response: httpx.Response) -> Optional[float]:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
+def create_job_listing_policy() -> ResiliencePolicy:
+    """
+    Build the per-worker resilience policy for calls to the job listing service from `Config`.
+
+    Raises:
+        ValueError: If `JOB_LISTING_ATTEMPT_TIMEOUT` for every attempt does not fit in `JOB_LISTING_DEADLINE`.
+    """
+    policy = ResiliencePolicy(
+        "job-listing",
+        breaker=CircuitBreaker(
+            "job-listing",
+            failure_threshold=config.JOB_LISTING_BREAKER_FAILURES,
+            reset_timeout=config.JOB_LISTING_BREAKER_RESET_TIMEOUT,
+        ),
+        budget=RetryBudget(
+            ratio=config.JOB_LISTING_RETRY_BUDGET_RATIO,
+            min_per_second=config.JOB_LISTING_RETRY_BUDGET_MIN_PER_SECOND,
+        ),
+        max_retries=config.JOB_LISTING_MAX_RETRIES,
+        backoff=config.JOB_LISTING_RETRY_BACKOFF,
+        backoff_max=config.JOB_LISTING_RETRY_BACKOFF_MAX,
+        deadline=config.JOB_LISTING_DEADLINE,
+        hedge_delay=config.JOB_LISTING_HEDGE_DELAY,
+        attempt_timeout=config.JOB_LISTING_ATTEMPT_TIMEOUT or None,
+    )
+    attempts = policy.max_retries + 1
+    if config.JOB_LISTING_ATTEMPT_TIMEOUT and policy.attempt_timeout * attempts + policy.max_backoff() > policy.deadline:
+        raise ValueError(
+            f"JOB_LISTING_DEADLINE ({policy.deadline}s) is shorter than {attempts} attempts of "
+            f"JOB_LISTING_ATTEMPT_TIMEOUT ({policy.attempt_timeout}s) plus backoff; retries would never run"
+        )
+    return policy
+
+
+def get_job_listing_policy(request: Request) -> ResiliencePolicy:
+    """Return the job listing resilience policy created in the app lifespan."""
+    return request.app.state.job_listing_policy
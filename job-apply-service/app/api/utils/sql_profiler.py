@@ -0,0 +1,136 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar("sql_profile", default=None)
+
+
+class QueryProfile:
+    """
+    Statements executed while serving one request.
+
+    Statements are grouped by their SQL text; bound parameters are not part of
+    the text, so the same statement run for many different rows (the classic
+    N+1 lazy load) shows up as one statement with a high count.
+    """
+
+    def __init__(self, slowest: int = 3, repeat_threshold: int = 5):
+        self.slowest_limit = slowest
+        self.repeat_threshold = repeat_threshold
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Dict[str, Tuple[int, float]] = {}
+        self.slowest: List[Tuple[str, float]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        count, total = self.statements.get(statement, (0, 0.0))
+        self.statements[statement] = (count + 1, total + duration)
+        if len(self.slowest) < self.slowest_limit or duration > self.slowest[-1][1]:
+            self.slowest.append((statement, duration))
+            self.slowest.sort(key=lambda item: item[1], reverse=True)
+            del self.slowest[self.slowest_limit:]
+
+    def repeated(self) -> List[Tuple[str, int, float]]:
+        """Statements executed at least `repeat_threshold` times, most frequent first."""
+        return sorted(
+            ((statement, count, total) for statement, (count, total) in self.statements.items()
+             if count >= self.repeat_threshold),
+            key=lambda item: item[1], reverse=True
+        )
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers summarising the profile."""
+        headers = {
+            "Server-Timing": f'db;dur={self.total_time * 1000:.2f};desc="{self.count} queries"',
+            "X-DB-Query-Count": str(self.count),
+        }
+        repeated = self.repeated()
+        if repeated:
+            headers["X-DB-Repeated-Queries"] = str(len(repeated))
+        return headers
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_time * 1000, 2),
+            "slowest": [
+                {"statement": _shorten(statement), "ms": round(duration * 1000, 2)}
+                for statement, duration in self.slowest
+            ],
+            "repeated": [
+                {"statement": _shorten(statement), "count": count, "ms": round(total * 1000, 2)}
+                for statement, count, total in self.repeated()
+            ],
+        }
+
+
+class SQLProfilerMiddleware:
+    """
+    Profile the SQL issued by each request.
+
+    Adds `Server-Timing`, `X-DB-Query-Count` and (when a statement repeats at
+    least `repeat_threshold` times) `X-DB-Repeated-Queries` headers, and logs
+    one JSON line per request once it completes. Requests with repeated
+    statements are logged as warnings. Queries run after the response has
+    started (e.g. while streaming) are logged but not in the headers.
+    """
+
+    def __init__(self, app: ASGIApp, slowest: int = 3, repeat_threshold: int = 5) -> None:
+        self.app = app
+        self.slowest = slowest
+        self.repeat_threshold = repeat_threshold
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(self.slowest, self.repeat_threshold)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).update(profile.headers())
+            await send(message)
+
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            summary = {"method": scope["method"], "path": scope["path"], "status": status, **profile.summary()}
+            level = logging.WARNING if summary["repeated"] else logging.INFO
+            logger.log(level, f"SQL profile {json.dumps(summary)}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        context.profile_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    start = getattr(context, "profile_start", None)
+    if profile is not None and start is not None:
+        profile.record(statement, time.perf_counter() - start)
+
+
+def _shorten(statement: str, limit: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
@@ -1,12 +1,15 @@
-from fastapi.responses import JSONResponse
+from app.api.utils.orjson_response import ORJSONResponse
 
-def success_response(status_code, message, data):
-    return JSONResponse(
+def success_response(status_code, message, data, pagination=None):
+    content = {
+        "status_code": status_code,
+        "success": True,
+        "message": message,
+        "data": data
+    }
+    if pagination is not None:
+        content["pagination"] = pagination
+    return ORJSONResponse(
         status_code=status_code,
-        content={
-            "status_code": status_code,
-            "success": True,
-            "message": message,
-            "data": data
-        }
+        content=content
     )
\ No newline at end of file
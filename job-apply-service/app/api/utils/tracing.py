@@ -0,0 +1,149 @@
+import functools
+from typing import Any, Callable, Optional
+
+from opentelemetry import trace
+from opentelemetry.propagate import extract
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import config
+
+SERVICE_NAME = "job-apply-service"
+
+# Spans are no-ops until configure_tracing() installs a provider
+tracer = trace.get_tracer(SERVICE_NAME)
+
+
+def configure_tracing() -> Optional[TracerProvider]:
+    """
+    Install the global tracer provider selected by `TRACING_EXPORTER`.
+
+    `console` prints spans to stdout and `file` appends one JSON span per line
+    to `TRACING_FILE`, so traces can be inspected without a collector; `otlp`
+    sends them to the collector named by the standard `OTEL_EXPORTER_OTLP_*`
+    variables. Returns None when tracing is disabled.
+    """
+    exporter = _exporter(config.TRACING_EXPORTER)
+    if exporter is None:
+        return None
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(config.TRACING_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    instrument_sqlalchemy()
+    return provider
+
+
+def instrument_sqlalchemy() -> None:
+    """Give each SQL statement run inside a sampled span its own child span."""
+    if not event.contains(Engine, "before_cursor_execute", _start_sql_span):
+        event.listen(Engine, "before_cursor_execute", _start_sql_span)
+        event.listen(Engine, "after_cursor_execute", _end_sql_span)
+        event.listen(Engine, "handle_error", _fail_sql_span)
+
+
+def _exporter(name: str) -> Optional[SpanExporter]:
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return ConsoleSpanExporter(
+            out=open(config.TRACING_FILE, "a"), formatter=lambda span: span.to_json(indent=None) + "\n"
+        )
+    if name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise RuntimeError(
+                "TRACING_EXPORTER=otlp requires `pip install opentelemetry-exporter-otlp-proto-http`"
+            ) from e
+        return OTLPSpanExporter()
+    return None
+
+
+class TracingMiddleware:
+    """
+    Open a server span for every HTTP request.
+
+    The span continues the trace from an incoming W3C `traceparent` header and
+    is named after the route template once routing has matched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}", context=extract(carrier), kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Wrap an async function in a span named after it (or `name`)."""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with tracer.start_as_current_span(span_name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _start_sql_span(conn, cursor, statement, parameters, context_, executemany):
+    if not trace.get_current_span().is_recording():
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context_.trace_span = tracer.start_span(
+        operation, kind=SpanKind.CLIENT,
+        attributes={"db.system": conn.dialect.name, "db.statement": statement[:1000]},
+    )
+
+
+def _end_sql_span(conn, cursor, statement, parameters, context_, executemany):
+    span = getattr(context_, "trace_span", None)
+    if span is not None:
+        span.end()
+        context_.trace_span = None
+
+
+def _fail_sql_span(exception_context):
+    span = getattr(exception_context.execution_context, "trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        exception_context.execution_context.trace_span = None
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -8,6 +8,15 @@ Base = declarative_base()
 class JobApplication(Base):
     """Job Application model"""
     __tablename__ = "job_applications"
+    __table_args__ = (
+        Index("uq_job_applications_user_id_job_id", "user_id", "job_id", unique=True),
+        # Covers the "my applications" listing so it can be served by an index-only scan
+        Index(
+            "ix_job_applications_user_id_applied_at_id",
+            "user_id", "applied_at", "id",
+            postgresql_include=["job_id", "title", "company", "location", "salary"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, nullable=False, index=True)
@@ -1,12 +1,23 @@
 import logging
-from fastapi import APIRouter, Depends, status
+import math
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
 
 
 from app.api.v1.services.jobs import JobApplicationService
-from app.api.v1.schemas.jobs import ApplyJobSchema, JobApplicationResponse, JobApplicationDeleteResponse
+from app.api.v1.schemas.jobs import (
+    ApplyJobSchema,
+    JobApplicationResponse,
+    JobApplicationSummaryResponse,
+    JobApplicationDeleteResponse,
+    serialize_application,
+    serialize_application_summary
+)
 from app.api.utils.get_service_class import get_service
 from app.api.utils.get_current_user import get_current_user
 from app.api.utils.error_response import error_response
+from app.api.utils.resilience import DependencyUnavailableError
 from app.api.utils.success_response import success_response
 
 logger = logging.getLogger(__name__)
@@ -35,6 +46,7 @@ async def apply_for_job(
             - HTTP_201_CREATED with success message and application data if job is successfully applied for.
             - HTTP_404_NOT_FOUND if the job does not exist.
             - HTTP_400_BAD_REQUEST for validation errors.
+            - HTTP_503_SERVICE_UNAVAILABLE if the job listing service is down or its circuit is open.
             - HTTP_500_INTERNAL_SERVER_ERROR for unexpected server errors.
     """
     try:
@@ -49,18 +61,84 @@ async def apply_for_job(
         if not applied_job:
             return error_response(status.HTTP_404_NOT_FOUND, "Job not found")
 
-        validated_data = JobApplicationResponse.model_validate(applied_job).model_dump(mode="json")
-        return success_response(status.HTTP_201_CREATED, "Job application submitted successfully", validated_data)
+        return success_response(
+            status.HTTP_201_CREATED,
+            "Job application submitted successfully",
+            serialize_application(applied_job)
+        )
 
     except ValueError as e:
         logger.warning(f"Validation error applying for job: {str(e)}")
         return error_response(status.HTTP_400_BAD_REQUEST, str(e))
 
+    except DependencyUnavailableError as e:
+        logger.warning(f"Job listing service unavailable applying for job: {str(e)}")
+        response = error_response(
+            status.HTTP_503_SERVICE_UNAVAILABLE, "Job listing service is unavailable, please try again later"
+        )
+        if e.retry_after:
+            response.headers["Retry-After"] = str(math.ceil(e.retry_after))
+        return response
+
     except Exception as e:
         logger.error(f"API error applying for job: {str(e)}")
         return error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to apply for job")
 
 
+@router.get("", status_code=status.HTTP_200_OK, response_model=List[JobApplicationSummaryResponse])
+async def list_applied_jobs(
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    company: Optional[str] = Query(None),
+    job_id: Optional[int] = Query(None),
+    service: JobApplicationService = Depends(get_service),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    List the authenticated user's job applications.
+
+    Applications are returned newest first using keyset pagination. Pass the
+    `next_cursor` from the response's `pagination` block as `cursor` to fetch
+    the next page.
+
+    Args:
+        limit (int): Maximum number of applications per page.
+        cursor (str): Cursor of the page to fetch.
+        company (str): Only return applications to this company.
+        job_id (int): Only return applications to this job.
+        service (JobApplicationService): Dependency that handles listing logic.
+        current_user (dict): Dictionary containing authenticated user's information (`user_id`).
+
+    Returns:
+        JSONResponse:
+            - HTTP_200_OK with a page of applications and pagination info.
+            - HTTP_400_BAD_REQUEST if the cursor is invalid.
+            - HTTP_500_INTERNAL_SERVER_ERROR for unexpected server errors.
+    """
+    try:
+        logger.info(f"API request to list job applications for user {current_user['user_id']}")
+
+        applications, next_cursor = await service.list_applied_jobs(
+            current_user["user_id"],
+            limit=limit,
+            cursor=cursor,
+            company=company,
+            job_id=job_id
+        )
+
+        data = [serialize_application_summary(application) for application in applications]
+        pagination = {"next_cursor": next_cursor, "has_more": next_cursor is not None}
+        return success_response(status.HTTP_200_OK, "Job applications fetched successfully", data, pagination)
+
+    except ValueError as e:
+        logger.warning(f"Invalid query listing job applications: {str(e)}")
+        return error_response(status.HTTP_400_BAD_REQUEST, str(e))
+
+    except Exception as e:
+        logger.error(f"API error listing job applications: {str(e)}")
+        return error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to fetch job applications")
+
+
 @router.delete("/{application_id}", status_code=status.HTTP_200_OK, response_model=JobApplicationDeleteResponse)
 async def delete_applied_job(
     application_id: int,
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 
+from app.api.utils.serializers import attribute_serializer
+
 
 class ApplyJobSchema(BaseModel):
     """Schema for applying to a job"""
@@ -25,6 +27,25 @@ class JobApplicationResponse(BaseModel):
         from_attributes = True
 
 
+class JobApplicationSummaryResponse(BaseModel):
+    """Response schema for an application in the user's applications list"""
+    id: int
+    job_id: int
+    title: str
+    company: str
+    location: Optional[str] = None
+    salary: Optional[float] = None
+    applied_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# Direct ORM-to-dict paths for the response envelopes, skipping pydantic validation
+serialize_application = attribute_serializer(JobApplicationResponse)
+serialize_application_summary = attribute_serializer(JobApplicationSummaryResponse)
+
+
 class JobApplicationDeleteResponse(BaseModel):
     status: str
     message: str
\ No newline at end of file
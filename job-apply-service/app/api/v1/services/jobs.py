@@ -1,8 +1,22 @@
 import logging
-import httpx
-from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+import time
 
+import httpx
+from opentelemetry.propagate import inject
+from opentelemetry.trace import SpanKind
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.api.cache.job_details import JobDetailsCache
+from app.api.utils.metrics import OUTBOUND_LATENCY
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.api.utils.resilience import DependencyUnavailableError, ResiliencePolicy
+from app.api.utils import tracing
+from app.api.utils.single_flight import SingleFlight
 from app.api.v1.models.jobs import JobApplication
 from app.api.v1.schemas.jobs import ApplyJobSchema
 from config import config
@@ -14,46 +28,127 @@ logger = logging.getLogger(__name__)
 class JobApplicationService:
     """Service for job application operations"""
 
-    def __init__(self, db: Session, flask_service_url: str = config.JOB_LISTING_BASE_URL):
+    def __init__(
+            self,
+            db: AsyncSession,
+            http_client: httpx.AsyncClient,
+            flask_service_url: str = config.JOB_LISTING_BASE_URL,
+            job_cache: Optional[JobDetailsCache] = None,
+            job_details_flight: Optional[SingleFlight] = None,
+            job_listing_policy: Optional[ResiliencePolicy] = None
+    ):
         self.db = db
+        self.http_client = http_client
         self.flask_service_url = flask_service_url
+        self.job_cache = job_cache
+        self.job_details_flight = job_details_flight
+        # Without a shared policy every lookup is a single attempt with no circuit breaker
+        self.job_listing_policy = job_listing_policy or ResiliencePolicy("job-listing")
+
+
+    def _insert(self, table):
+        """Return a dialect-specific INSERT construct that supports ON CONFLICT."""
+        if self.db.bind.dialect.name == "sqlite":
+            return sqlite_insert(table)
+        return postgresql_insert(table)
 
 
+    @tracing.traced()
     async def get_job_details(self, job_id: int) -> Optional[Dict[str, Any]]:
         """
         Fetch job details from Flask microservice.
 
+        Found jobs and 404s are served from the job cache when one is configured.
+        Stale cached jobs are revalidated with `If-None-Match`, so an unchanged
+        job costs an empty 304 instead of a full response. Concurrent cache
+        misses for the same job share a single HTTP request.
+
         Args:
             job_id: ID of the job to fetch
 
         Returns:
             Job details dictionary or None if not found
-        """
-        try:
-            logger.info(f"Fetching job details for job ID: {job_id} from Flask services")
-
-            print(f"{self.flask_service_url}/api/v1/jobs/{job_id}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.flask_service_url}/api/v1/jobs/{job_id}")
-
-                if response.status_code == 200:
-                    response_json = response.json()
-                    job_data = response_json.get("data")
-                    logger.info(f"Successfully fetched job details for job ID: {job_id}")
-                    return job_data
-                elif response.status_code == 404:
-                    logger.warning(f"Job with ID {job_id} not found in Flask services")
-                    return None
-                else:
-                    logger.error(f"Failed to fetch job details: HTTP {response.status_code}")
-                    return None
+        Raises:
+            DependencyUnavailableError: The job listing service failed, timed out
+                or its circuit is open, and no stale copy of the job is cached
+        """
+        stale_data, etag = None, None
+        if self.job_cache is not None:
+            hit, job_data, etag = await self.job_cache.lookup(job_id)
+            if hit:
+                logger.info(f"Job details for job ID: {job_id} served from cache")
+                return job_data
+            stale_data = job_data
+
+        fetch = lambda: self._fetch_job_details(job_id, stale_data, etag)
+        if self.job_details_flight is not None:
+            return await self.job_details_flight.do(job_id, fetch)
+        return await fetch()
+
+
+    async def _fetch_job_details(
+            self,
+            job_id: int,
+            stale_data: Optional[Dict[str, Any]] = None,
+            etag: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Request job details from the Flask microservice and populate the cache."""
+        logger.info(f"Fetching job details for job ID: {job_id} from Flask services")
+        conditional = bool(stale_data and etag)
+
+        async def send() -> httpx.Response:
+            headers = {"If-None-Match": etag} if conditional else {}
+            start = time.perf_counter()
+            with tracing.tracer.start_as_current_span(
+                    "GET /api/v1/jobs/{job_id}", kind=SpanKind.CLIENT,
+                    attributes={"http.request.method": "GET", "job.id": job_id, "http.conditional": conditional}
+            ) as span:
+                # W3C traceparent so the job listing service continues this trace
+                inject(headers)
+                try:
+                    response = await self.http_client.get(
+                        f"{self.flask_service_url}/api/v1/jobs/{job_id}", headers=headers
+                    )
+                except Exception:
+                    OUTBOUND_LATENCY.labels("job-listing", "error").observe(time.perf_counter() - start)
+                    raise
+                span.set_attribute("http.response.status_code", response.status_code)
+            OUTBOUND_LATENCY.labels("job-listing", response.status_code).observe(time.perf_counter() - start)
+            return response
+
+        def accept(response: httpx.Response) -> bool:
+            # Anything else (429, 401/403, a 304 nobody asked for) means the lookup failed
+            return response.status_code in (200, 404) or (conditional and response.status_code == 304)
 
-        except Exception as e:
+        try:
+            response = await self.job_listing_policy.call(send, accept)
+        except DependencyUnavailableError as e:
+            if stale_data is not None:
+                logger.warning(f"Serving stale job details for job ID: {job_id}: {str(e)}")
+                return stale_data
             logger.error(f"Error fetching job details for job ID {job_id}: {str(e)}")
+            raise
+
+        if response.status_code == 304:
+            logger.info(f"Job details for job ID: {job_id} not modified")
+            await self.job_cache.revalidate(job_id, stale_data, etag)
+            return stale_data
+        elif response.status_code == 200:
+            response_json = response.json()
+            job_data = response_json.get("data")
+            logger.info(f"Successfully fetched job details for job ID: {job_id}")
+            if self.job_cache is not None and job_data:
+                await self.job_cache.set(job_id, job_data, response.headers.get("ETag"))
+            return job_data
+        else:
+            logger.warning(f"Job with ID {job_id} not found in Flask services")
+            if self.job_cache is not None:
+                await self.job_cache.set_not_found(job_id)
             return None
 
 
+    @tracing.traced()
     async def apply_job(self, job_data: ApplyJobSchema, user_id: int, user_email: str) -> Optional[JobApplication]:
         """
         Apply for a job by fetching details from Flask services.
@@ -65,55 +160,58 @@ class JobApplicationService:
 
         Returns:
             Created job application or None if job not found
+
+        Raises:
+            DependencyUnavailableError: Job details could not be fetched
         """
         try:
             logger.info(f"User {user_id} ({user_email}) applying for job ID: {job_data.job_id}")
 
-            # Check if user already applied for this job
-            existing_application = self.db.query(JobApplication).filter(
-                JobApplication.job_id == job_data.job_id,
-                JobApplication.user_id == user_id
-            ).first()
-
-            if existing_application:
-                logger.warning(f"User {user_id} already applied for job ID: {job_data.job_id}")
-                raise ValueError("You have already applied for this job")
-
             # Fetch job details from Flask services
             job_details = await self.get_job_details(job_data.job_id)
             if not job_details:
                 logger.warning(f"Job with ID {job_data.job_id} not found")
                 return None
 
-            # Create job application with fetched details
-            db_job = JobApplication(
-                job_id=job_data.job_id,
-                user_id=user_id,
-                user_email=user_email,
-                title=job_details.get('title'),
-                description=job_details.get('description'),
-                company=job_details.get('company'),
-                location=job_details.get('location'),
-                salary=job_details.get('salary')
+            # Insert the application in one round-trip; the unique (user_id, job_id)
+            # index turns a duplicate into a no-op that returns no row.
+            stmt = (
+                self._insert(JobApplication)
+                .values(
+                    job_id=job_data.job_id,
+                    user_id=user_id,
+                    user_email=user_email,
+                    title=job_details.get('title'),
+                    description=job_details.get('description'),
+                    company=job_details.get('company'),
+                    location=job_details.get('location'),
+                    salary=job_details.get('salary')
+                )
+                .on_conflict_do_nothing(index_elements=["user_id", "job_id"])
+                .returning(JobApplication)
             )
+            result = await self.db.execute(stmt)
+            db_job = result.scalars().first()
+            await self.db.commit()
 
-            self.db.add(db_job)
-            self.db.commit()
-            self.db.refresh(db_job)
+            if db_job is None:
+                logger.warning(f"User {user_id} already applied for job ID: {job_data.job_id}")
+                raise ValueError("You have already applied for this job")
 
             logger.info(f"Successfully applied for job with application ID: {db_job.id} for user {user_id}")
             return db_job
 
-        except ValueError:
-            # Re-raise validation errors
+        except (ValueError, DependencyUnavailableError):
+            # Re-raise validation errors and job listing outages; nothing was written yet for the latter
             raise
         except Exception as e:
             logger.error(f"Failed to apply for job for user {user_id}: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             raise
 
 
-    def get_applied_job(self, application_id: int, user_id: int) -> Optional[JobApplication]:
+    @tracing.traced()
+    async def get_applied_job(self, application_id: int, user_id: int) -> Optional[JobApplication]:
         """
         Get applied job by application ID for specific user.
 
@@ -125,10 +223,13 @@ class JobApplicationService:
             Job application if found and belongs to user
         """
         logger.debug(f"Getting job application with ID: {application_id} for user {user_id}")
-        application = self.db.query(JobApplication).filter(
-            JobApplication.id == application_id,
-            JobApplication.user_id == user_id
-        ).first()
+        result = await self.db.execute(
+            select(JobApplication).where(
+                JobApplication.id == application_id,
+                JobApplication.user_id == user_id
+            )
+        )
+        application = result.scalars().first()
 
         if not application:
             logger.warning(f"Job application with ID {application_id} not found for user {user_id}")
@@ -136,6 +237,80 @@ class JobApplicationService:
         return application
 
 
+    @tracing.traced()
+    async def list_applied_jobs(
+            self,
+            user_id: int,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            company: Optional[str] = None,
+            job_id: Optional[int] = None
+    ) -> Tuple[List[JobApplication], Optional[str]]:
+        """
+        List a user's job applications, newest first, using keyset pagination.
+
+        Only the summary columns are loaded so the query can be answered from the
+        (user_id, applied_at, id) covering index.
+
+        Args:
+            user_id: User whose applications are listed
+            limit: Maximum number of applications to return
+            cursor: Cursor returned with the previous page
+            company: Only return applications to this company
+            job_id: Only return applications to this job
+
+        Returns:
+            Tuple of (applications, next page cursor or None)
+
+        Raises:
+            ValueError: If the cursor or limit is invalid
+        """
+        if limit is None:
+            limit = config.APPLICATIONS_DEFAULT_PAGE_SIZE
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        limit = min(limit, config.APPLICATIONS_MAX_PAGE_SIZE)
+
+        query = (
+            select(JobApplication)
+            .options(load_only(
+                JobApplication.job_id,
+                JobApplication.title,
+                JobApplication.company,
+                JobApplication.location,
+                JobApplication.salary,
+                JobApplication.applied_at
+            ))
+            .where(JobApplication.user_id == user_id)
+        )
+        if company:
+            query = query.where(JobApplication.company == company)
+        if job_id is not None:
+            query = query.where(JobApplication.job_id == job_id)
+        if cursor:
+            applied_at, last_id = decode_cursor(cursor)
+            query = query.where(or_(
+                JobApplication.applied_at < applied_at,
+                and_(JobApplication.applied_at == applied_at, JobApplication.id < last_id)
+            ))
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(
+            query.order_by(JobApplication.applied_at.desc(), JobApplication.id.desc()).limit(limit + 1)
+        )
+        applications = list(result.scalars().all())
+
+        next_cursor = None
+        if len(applications) > limit:
+            applications = applications[:limit]
+            last = applications[-1]
+            next_cursor = encode_cursor(last.applied_at, last.id)
+
+        logger.info(f"Retrieved {len(applications)} job applications for user {user_id}")
+        return applications, next_cursor
+
+
+    @tracing.traced()
     async def delete_applied_job(self, application_id: int, user_id: int) -> bool:
         """
         Delete applied job for specific user.
@@ -150,18 +325,18 @@ class JobApplicationService:
         try:
             logger.info(f"User {user_id} deleting job application with ID: {application_id}")
 
-            db_application = self.get_applied_job(application_id, user_id)
+            db_application = await self.get_applied_job(application_id, user_id)
             if not db_application:
                 return False
 
-            self.db.delete(db_application)
-            self.db.commit()
+            await self.db.delete(db_application)
+            await self.db.commit()
 
             logger.info(f"Successfully deleted job application with ID: {application_id} for user {user_id}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to delete job application {application_id} for user {user_id}: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             raise
 
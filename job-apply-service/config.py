@@ -21,8 +21,76 @@ class Config:
     DB_PORT = os.getenv("DB_PORT", "5432")
     POSTGRES_DB = os.getenv("POSTGRES_DB", "your-postgres-db-name")
 
+    # Connection pool per worker process; pre-ping replaces connections dropped by a Postgres restart.
+    # Set DB_PGBOUNCER when connecting through PgBouncer in transaction mode to let it do the pooling.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() in ("true", "1", "yes")
+    DB_PGBOUNCER: bool = os.getenv("DB_PGBOUNCER", "False").lower() in ("true", "1", "yes")
+
     JOB_LISTING_BASE_URL = os.getenv("JOB_LISTING_BASE_URL", "http://localhost:8080")
 
+    # Keyset pagination for a user's applications
+    APPLICATIONS_DEFAULT_PAGE_SIZE: int = int(os.getenv("APPLICATIONS_DEFAULT_PAGE_SIZE", 20))
+    APPLICATIONS_MAX_PAGE_SIZE: int = int(os.getenv("APPLICATIONS_MAX_PAGE_SIZE", 100))
+
+    # Shared HTTP client used for calls to the job listing service
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "False").lower() in ("true", "1", "yes")
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", 2.0))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", 5.0))
+    HTTP_WRITE_TIMEOUT: float = float(os.getenv("HTTP_WRITE_TIMEOUT", 5.0))
+    HTTP_POOL_TIMEOUT: float = float(os.getenv("HTTP_POOL_TIMEOUT", 2.0))
+
+    # Calls to the job listing service: JOB_LISTING_DEADLINE bounds a whole lookup including retries and
+    # ATTEMPT_TIMEOUT each attempt (0 splits what the deadline leaves after backoff evenly between the
+    # MAX_RETRIES + 1 attempts; an explicit value must fit that many times). Connection errors, attempt
+    # timeouts and 502/503/504 are retried with jittered backoff while the retry budget (RATIO of calls
+    # + MIN_PER_SECOND) allows; the circuit opens after BREAKER_FAILURES failed lookups for
+    # BREAKER_RESET_TIMEOUT seconds. A HEDGE_DELAY above 0 sends a second request when the first has not
+    # answered after that many seconds.
+    JOB_LISTING_DEADLINE: float = float(os.getenv("JOB_LISTING_DEADLINE", 5.0))
+    JOB_LISTING_MAX_RETRIES: int = int(os.getenv("JOB_LISTING_MAX_RETRIES", 2))
+    JOB_LISTING_RETRY_BACKOFF: float = float(os.getenv("JOB_LISTING_RETRY_BACKOFF", 0.05))
+    JOB_LISTING_RETRY_BACKOFF_MAX: float = float(os.getenv("JOB_LISTING_RETRY_BACKOFF_MAX", 1.0))
+    JOB_LISTING_RETRY_BUDGET_RATIO: float = float(os.getenv("JOB_LISTING_RETRY_BUDGET_RATIO", 0.2))
+    JOB_LISTING_RETRY_BUDGET_MIN_PER_SECOND: float = float(os.getenv("JOB_LISTING_RETRY_BUDGET_MIN_PER_SECOND", 1.0))
+    JOB_LISTING_BREAKER_FAILURES: int = int(os.getenv("JOB_LISTING_BREAKER_FAILURES", 5))
+    JOB_LISTING_BREAKER_RESET_TIMEOUT: float = float(os.getenv("JOB_LISTING_BREAKER_RESET_TIMEOUT", 30))
+    JOB_LISTING_HEDGE_DELAY: float = float(os.getenv("JOB_LISTING_HEDGE_DELAY", 0))
+    JOB_LISTING_ATTEMPT_TIMEOUT: float = float(os.getenv("JOB_LISTING_ATTEMPT_TIMEOUT", 0))
+
+    # Job details cache ("memory" per process, or "redis" shared across replicas)
+    JOB_CACHE_BACKEND = os.getenv("JOB_CACHE_BACKEND", "memory")
+    JOB_CACHE_MAX_SIZE: int = int(os.getenv("JOB_CACHE_MAX_SIZE", 1024))
+    JOB_CACHE_TTL: float = float(os.getenv("JOB_CACHE_TTL", 60))
+    JOB_CACHE_NEGATIVE_TTL: float = float(os.getenv("JOB_CACHE_NEGATIVE_TTL", 10))
+    # How long stale jobs are kept for ETag revalidation (If-None-Match) after JOB_CACHE_TTL
+    JOB_CACHE_STALE_TTL: float = float(os.getenv("JOB_CACHE_STALE_TTL", 600))
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Response compression: encodings by preference; bodies below COMPRESSION_MIN_SIZE bytes are sent as is
+    COMPRESSION_ALGORITHMS = os.getenv("COMPRESSION_ALGORITHMS", "br,gzip").split(",")
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", 500))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+
+
+    # Opt-in per-request SQL profiling: query count, DB time and slowest statements in response
+    # headers and a log line; statements run SQL_PROFILING_REPEAT_THRESHOLD+ times are flagged as N+1
+    SQL_PROFILING: bool = os.getenv("SQL_PROFILING", "False").lower() in ("true", "1", "yes")
+    SQL_PROFILING_SLOWEST: int = int(os.getenv("SQL_PROFILING_SLOWEST", 3))
+    SQL_PROFILING_REPEAT_THRESHOLD: int = int(os.getenv("SQL_PROFILING_REPEAT_THRESHOLD", 5))
+
+    # Distributed tracing: "none", "console", "file" (JSON lines in TRACING_FILE) or "otlp"
+    TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none")
+    TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv("TRACING_SAMPLE_RATIO", 1.0))
+
 
 # Initialize config object
 config = Config()
\ No newline at end of file
@@ -1,9 +1,39 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import config
 from app.api import router as api_router
+from app.api.db.database import engine
+from app.api.db.pool import pool_metrics
+from app.api.utils.compression import CompressionMiddleware
+from app.api.utils.http_client import create_http_client
+from app.api.utils.metrics import MetricsMiddleware, metrics_response
+from app.api.utils.orjson_response import ORJSONResponse
+from app.api.utils.resilience import create_job_listing_policy
+from app.api.utils.sql_profiler import SQLProfilerMiddleware
+from app.api.utils.tracing import TracingMiddleware, configure_tracing
+from app.api.cache.job_details import create_job_details_cache
+from app.api.utils.single_flight import SingleFlight
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client per worker so connections to the job listing service are reused
+    app.state.http_client = create_http_client()
+    app.state.job_cache = create_job_details_cache()
+    app.state.job_details_flight = SingleFlight("job-details")
+    # Circuit breaker and retry budget are per worker, like the client they guard
+    app.state.job_listing_policy = create_job_listing_policy()
+    tracer_provider = configure_tracing()
+    yield
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
+    await app.state.job_cache.close()
+    await app.state.http_client.aclose()
+
 
 app = FastAPI(
     title="Job Application API",
@@ -11,6 +41,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -21,6 +53,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    algorithms=config.COMPRESSION_ALGORITHMS,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+)
+
+if config.SQL_PROFILING:
+    app.add_middleware(
+        SQLProfilerMiddleware,
+        slowest=config.SQL_PROFILING_SLOWEST,
+        repeat_threshold=config.SQL_PROFILING_REPEAT_THRESHOLD,
+    )
+
+if config.TRACING_EXPORTER != "none":
+    app.add_middleware(TracingMiddleware)
+
+# Added last so it is outermost and times the full request, including compression
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router)
 
 @app.get("/")
@@ -33,8 +86,18 @@ def read_root():
 
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+def health_check(request: Request):
+    return {
+        "status": "healthy",
+        "db_pool": pool_metrics.stats(engine.pool),
+        "job_listing": request.app.state.job_listing_policy.stats(),
+        "job_details_flight": request.app.state.job_details_flight.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""add unique user job index
+
+Revision ID: 5d2a8f3c1b7e
+Revises: cf9124686faa
+Create Date: 2026-10-17 10:04:12.583210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a8f3c1b7e'
+down_revision: Union[str, None] = 'cf9124686faa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the earliest application when duplicates already exist
+    op.execute(
+        """
+        DELETE FROM job_applications a
+        USING job_applications b
+        WHERE a.user_id = b.user_id
+          AND a.job_id = b.job_id
+          AND a.id > b.id
+        """
+    )
+    op.create_index('uq_job_applications_user_id_job_id', 'job_applications', ['user_id', 'job_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_job_applications_user_id_job_id', table_name='job_applications')
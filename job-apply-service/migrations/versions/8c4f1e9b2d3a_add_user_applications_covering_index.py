@@ -0,0 +1,34 @@
+"""add user applications covering index
+
+Revision ID: 8c4f1e9b2d3a
+Revises: 5d2a8f3c1b7e
+Create Date: 2026-10-17 10:41:55.917302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f1e9b2d3a'
+down_revision: Union[str, None] = '5d2a8f3c1b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_applications_user_id_applied_at_id',
+        'job_applications',
+        ['user_id', 'applied_at', 'id'],
+        unique=False,
+        postgresql_include=['job_id', 'title', 'company', 'location', 'salary'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_user_id_applied_at_id', table_name='job_applications')
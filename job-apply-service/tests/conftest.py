@@ -1,5 +1,9 @@
 import httpx
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.models.jobs import Base
 
 
 @pytest.fixture
@@ -10,4 +14,17 @@ def anyio_backend():
 async def async_client():
     # Setup for async HTTP client testing
     async with httpx.AsyncClient() as client:
-        yield client
\ No newline at end of file
+        yield client
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Async session bound to a fresh in-memory SQLite database"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
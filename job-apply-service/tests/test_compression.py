@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.utils.compression import CompressionMiddleware, parse_accept_encoding
+from app.api.utils.success_response import success_response
+
+
+class TestCompressionMiddleware:
+    """Test cases for the brotli/gzip compression middleware"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        @app.get("/large")
+        async def large():
+            data = [{"id": i, "title": "Software Engineer", "company": "TechCorp"} for i in range(100)]
+            return success_response(200, "ok", data)
+
+        @app.get("/small")
+        async def small():
+            return success_response(200, "ok", None)
+
+        @app.get("/stream")
+        async def stream():
+            async def lines():
+                for i in range(100):
+                    yield f'{{"id": {i}, "title": "Software Engineer"}}\n'.encode()
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        return TestClient(app)
+
+    def test_prefers_brotli(self, client):
+        """Test br is chosen when accepted"""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert len(response.json()["data"]) == 100
+
+    def test_falls_back_to_gzip(self, client):
+        """Test gzip is used when br is refused"""
+        response = client.get("/large", headers={"Accept-Encoding": "br;q=0, gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 100
+
+    def test_identity_when_nothing_accepted(self, client):
+        """Test responses are not compressed without a supported encoding"""
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_skips_small_bodies(self, client):
+        """Test bodies under the minimum size are sent as is"""
+        response = client.get("/small", headers={"Accept-Encoding": "br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json()["message"] == "ok"
+
+    def test_streams_brotli(self, client):
+        """Test streaming responses are compressed chunk by chunk"""
+        response = client.get("/stream", headers={"Accept-Encoding": "br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert "content-length" not in response.headers
+        assert len(response.text.splitlines()) == 100
+
+    def test_parse_accept_encoding(self):
+        """Test q-values and wildcards are honored"""
+        assert parse_accept_encoding("gzip;q=0.5, br") == {"gzip": 0.5, "br": 1.0}
+        assert parse_accept_encoding("*;q=0.1") == {"*": 0.1, "br": 0.1, "gzip": 0.1}
+        assert parse_accept_encoding("") == {}
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from app.api.db.pool import PoolMetrics, engine_options, timed_pool_class
+
+
+def make_settings(**overrides):
+    settings = {
+        "DB_POOL_SIZE": 5,
+        "DB_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 10.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+        "DB_PGBOUNCER": False,
+    }
+    settings.update(overrides)
+    return SimpleNamespace(**settings)
+
+
+class TestEngineOptions:
+    """Test cases for building async engine options from config"""
+
+    def test_queue_pool_settings(self):
+        """Test pool size, overflow, timeout, recycle and pre-ping come from config"""
+        options = engine_options(make_settings(DB_POOL_SIZE=8, DB_POOL_TIMEOUT=2.5))
+
+        assert issubclass(options.pop("poolclass"), AsyncAdaptedQueuePool)
+        assert options == {
+            "pool_size": 8,
+            "max_overflow": 10,
+            "pool_timeout": 2.5,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        }
+
+    def test_pgbouncer_disables_prepared_statement_caches(self):
+        """Test PgBouncer mode drops the local pool and asyncpg statement caching"""
+        options = engine_options(make_settings(DB_PGBOUNCER=True))
+
+        assert issubclass(options["poolclass"], NullPool)
+        connect_args = options["connect_args"]
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+
+
+class TestPoolMetrics:
+    """Test cases for connection checkout metrics"""
+
+    @pytest.mark.asyncio
+    async def test_records_checkouts_and_timeouts(self):
+        """Test checkouts and pool timeouts are counted with the pool usage"""
+        metrics = PoolMetrics()
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=timed_pool_class(AsyncAdaptedQueuePool, metrics),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01,
+        )
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert metrics.stats(engine.pool)["checked_out"] == 1
+
+                with pytest.raises(PoolTimeoutError):
+                    async with engine.connect():
+                        pass
+
+            stats = metrics.stats(engine.pool)
+            assert stats["checkouts"] == 1
+            assert stats["timeouts"] == 1
+            assert stats["checked_out"] == 0
+            assert stats["max_wait_ms"] >= 10
+        finally:
+            await engine.dispose()
@@ -0,0 +1,41 @@
+import os
+import runpy
+from unittest.mock import patch
+
+import pytest
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gunicorn.conf.py")
+
+
+def load_config(**env):
+    with patch.dict(os.environ, env):
+        return runpy.run_path(CONFIG_PATH)
+
+
+class TestGunicornConfig:
+    """Test cases for the production gunicorn settings"""
+
+    @pytest.fixture
+    def config(self):
+        return load_config()
+
+    def test_defaults(self, config):
+        """Test uvicorn workers with recycling and graceful shutdown are used by default"""
+        assert config["worker_class"] == "uvicorn.workers.UvicornWorker"
+        assert config["workers"] >= 1
+        assert config["max_requests"] == 1000
+        assert config["graceful_timeout"] == 30
+        assert config["bind"] == "0.0.0.0:8000"
+        assert config["forwarded_allow_ips"] == "127.0.0.1,::1"
+
+    def test_container_limits_size_workers(self):
+        """Test one worker per CPU of the container limit, capped by its memory limit"""
+        with patch("os.sched_getaffinity", return_value=set(range(16))):
+            config = load_config(CONTAINER_CPU_LIMIT="4", CONTAINER_MEMORY_LIMIT=str(512 * 1024 * 1024))
+
+        assert config["cpu_limit"] == 4
+        assert config["workers"] == 2
+
+    def test_web_concurrency_override(self):
+        """Test WEB_CONCURRENCY overrides the computed worker count"""
+        assert load_config(WEB_CONCURRENCY="3")["workers"] == 3
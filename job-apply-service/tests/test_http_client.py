@@ -0,0 +1,34 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.utils.http_client import create_http_client
+
+
+class TestHttpClient:
+    """Test cases for the shared HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_create_http_client_uses_config(self, monkeypatch):
+        """Test pool limits and per-phase timeouts come from config"""
+        monkeypatch.setattr("app.api.utils.http_client.config.HTTP_MAX_CONNECTIONS", 7)
+        monkeypatch.setattr("app.api.utils.http_client.config.HTTP_CONNECT_TIMEOUT", 1.5)
+        monkeypatch.setattr("app.api.utils.http_client.config.HTTP_READ_TIMEOUT", 3.0)
+
+        client = create_http_client()
+        try:
+            assert client.timeout == httpx.Timeout(connect=1.5, read=3.0, write=5.0, pool=2.0)
+            assert client._transport._pool._max_connections == 7
+        finally:
+            await client.aclose()
+
+    def test_lifespan_manages_shared_client(self):
+        """Test the app creates one client at startup and closes it at shutdown"""
+        from main import app
+
+        with TestClient(app):
+            client = app.state.http_client
+            assert isinstance(client, httpx.AsyncClient)
+            assert not client.is_closed
+
+        assert client.is_closed
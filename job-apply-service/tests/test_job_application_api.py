@@ -1,10 +1,15 @@
+import json
+from datetime import datetime, timezone
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from fastapi import status
 
+from app.api.utils.resilience import DependencyUnavailableError
+from app.api.utils.success_response import success_response
 from app.api.v1.services.jobs import JobApplicationService
 from app.api.v1.models.jobs import JobApplication
-from app.api.v1.schemas.jobs import ApplyJobSchema
+from app.api.v1.schemas.jobs import ApplyJobSchema, JobApplicationResponse, serialize_application
 
 
 class TestJobApplicationAPI:
@@ -46,26 +51,40 @@ class TestJobApplicationAPI:
 
         # Patch the response functions where they're imported in the routes module
         with patch('app.api.v1.routes.jobs.success_response') as mock_success:
-            with patch('app.api.v1.routes.jobs.JobApplicationResponse') as mock_response:
-                mock_response.model_validate.return_value.model_dump.return_value = {
-                    "id": 1,
-                    "job_id": 1,
-                    "title": "Software Engineer"
-                }
-                mock_success.return_value = {"status": "success"}
-
-                # Import the function after patching
-                from app.api.v1.routes.jobs import apply_for_job
-                result = await apply_for_job(job_data, mock_service, mock_current_user)
-
-                mock_service.apply_job.assert_called_once_with(
-                    job_data, 1, "test@example.com"
-                )
-                mock_success.assert_called_once_with(
-                    status.HTTP_201_CREATED,
-                    "Job application submitted successfully",
-                    {"id": 1, "job_id": 1, "title": "Software Engineer"}
-                )
+            mock_success.return_value = {"status": "success"}
+
+            # Import the function after patching
+            from app.api.v1.routes.jobs import apply_for_job
+            result = await apply_for_job(job_data, mock_service, mock_current_user)
+
+            mock_service.apply_job.assert_called_once_with(
+                job_data, 1, "test@example.com"
+            )
+            args = mock_success.call_args[0]
+            assert args[0] == status.HTTP_201_CREATED
+            assert args[1] == "Job application submitted successfully"
+            assert list(args[2]) == list(JobApplicationResponse.model_fields)
+            assert args[2]["title"] == "Software Engineer"
+
+    def test_envelope_matches_pydantic_json(self):
+        """Test the direct ORM path encodes like the pydantic model would"""
+        application = JobApplication(
+            id=1, job_id=2, user_id=3, user_email="test@example.com", title="Software Engineer",
+            description=None, company="TechCorp", location="Remote", salary=100000.0,
+            applied_at=datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+        )
+
+        response = success_response(status.HTTP_201_CREATED, "ok", serialize_application(application))
+
+        expected = JobApplicationResponse.model_validate(application).model_dump(mode="json")
+        assert json.loads(response.body)["data"] == expected
+        assert b'"applied_at":"2025-01-02T03:04:05.000678Z"' in response.body
+
+    def test_envelope_encodes_naive_datetimes_as_utc(self):
+        """Test naive datetimes (as returned by SQLite) get the same `Z` suffix"""
+        response = success_response(status.HTTP_200_OK, "ok", {"applied_at": datetime(2025, 1, 2, 3, 4, 5)})
+
+        assert json.loads(response.body)["data"] == {"applied_at": "2025-01-02T03:04:05Z"}
 
     @pytest.mark.asyncio
     async def test_apply_for_job_not_found(self, mock_service, mock_current_user):
@@ -99,6 +118,21 @@ class TestJobApplicationAPI:
                 status.HTTP_400_BAD_REQUEST, "Already applied"
             )
 
+    @pytest.mark.asyncio
+    async def test_apply_for_job_listing_unavailable(self, mock_service, mock_current_user):
+        """Test an unavailable job listing service returns 503 instead of 404"""
+        job_data = ApplyJobSchema(job_id=1)
+        mock_service.apply_job = AsyncMock(
+            side_effect=DependencyUnavailableError("job-listing", "circuit open", retry_after=12.5)
+        )
+
+        from app.api.v1.routes.jobs import apply_for_job
+        response = await apply_for_job(job_data, mock_service, mock_current_user)
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "13"
+        assert json.loads(response.body)["success"] is False
+
     @pytest.mark.asyncio
     async def test_apply_for_job_server_error(self, mock_service, mock_current_user):
         """Test job application with server error"""
@@ -115,6 +149,45 @@ class TestJobApplicationAPI:
                 status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to apply for job"
             )
 
+    @pytest.mark.asyncio
+    async def test_list_applied_jobs_success(self, mock_service, mock_current_user):
+        """Test listing the user's job applications"""
+        application = JobApplication(
+            id=1, job_id=1, title="Software Engineer", company="TechCorp", salary=100000.0
+        )
+        mock_service.list_applied_jobs = AsyncMock(return_value=([application], "next"))
+
+        with patch('app.api.v1.routes.jobs.success_response') as mock_success:
+            from app.api.v1.routes.jobs import list_applied_jobs
+            await list_applied_jobs(
+                limit=10, cursor="abc", company="TechCorp", job_id=None,
+                service=mock_service, current_user=mock_current_user
+            )
+
+            mock_service.list_applied_jobs.assert_called_once_with(
+                1, limit=10, cursor="abc", company="TechCorp", job_id=None
+            )
+            args = mock_success.call_args[0]
+            assert args[0] == status.HTTP_200_OK
+            assert args[1] == "Job applications fetched successfully"
+            assert args[2][0]["id"] == 1
+            assert "description" not in args[2][0]
+            assert args[3] == {"next_cursor": "next", "has_more": True}
+
+    @pytest.mark.asyncio
+    async def test_list_applied_jobs_invalid_cursor(self, mock_service, mock_current_user):
+        """Test listing with an invalid cursor"""
+        mock_service.list_applied_jobs = AsyncMock(side_effect=ValueError("Invalid cursor"))
+
+        with patch('app.api.v1.routes.jobs.error_response') as mock_error:
+            from app.api.v1.routes.jobs import list_applied_jobs
+            await list_applied_jobs(
+                limit=None, cursor="bad", company=None, job_id=None,
+                service=mock_service, current_user=mock_current_user
+            )
+
+            mock_error.assert_called_once_with(status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+
     @pytest.mark.asyncio
     async def test_delete_applied_job_success(self, mock_service, mock_current_user):
         """Test successful job application deletion"""
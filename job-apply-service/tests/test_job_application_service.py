@@ -1,8 +1,15 @@
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-from sqlalchemy.orm import Session
-from httpx import Response
-
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from httpx import AsyncClient, ConnectError, Response
+
+from app.api.cache.backends import InMemoryCacheBackend
+from app.api.cache.job_details import JobDetailsCache
+from app.api.utils.resilience import DependencyUnavailableError
+from app.api.utils.single_flight import SingleFlight
 from app.api.v1.services.jobs import JobApplicationService
 from app.api.v1.models.jobs import JobApplication
 from app.api.v1.schemas.jobs import ApplyJobSchema
@@ -13,13 +20,37 @@ class TestJobApplicationService:
 
     @pytest.fixture
     def mock_db(self):
-        """Mock database session"""
-        return Mock(spec=Session)
+        """Mock async database session"""
+        db = Mock(spec=AsyncSession)
+        db.execute = AsyncMock()
+        db.commit = AsyncMock()
+        db.refresh = AsyncMock()
+        db.rollback = AsyncMock()
+        db.delete = AsyncMock()
+        db.bind = Mock()
+        db.bind.dialect.name = "postgresql"
+        return db
+
+    @staticmethod
+    def set_query_result(mock_db, value):
+        """Make `execute(...).scalars().first()` return `value`"""
+        result = Mock()
+        result.scalars.return_value.first.return_value = value
+        mock_db.execute.return_value = result
+
+    @pytest.fixture
+    def mock_http_client(self):
+        """Mock shared HTTP client"""
+        return Mock(spec=AsyncClient)
 
     @pytest.fixture
-    def service(self, mock_db):
+    def service(self, mock_db, mock_http_client):
         """Create JobApplicationService instance with mocked dependencies"""
-        return JobApplicationService(db=mock_db, flask_service_url="http://test-flask-service")
+        return JobApplicationService(
+            db=mock_db,
+            http_client=mock_http_client,
+            flask_service_url="http://test-flask-service"
+        )
 
     @pytest.fixture
     def sample_job_data(self):
@@ -39,145 +70,288 @@ class TestJobApplicationService:
         return ApplyJobSchema(job_id=1)
 
     @pytest.mark.asyncio
-    async def test_get_job_details_success(self, service, sample_job_data):
+    async def test_get_job_details_success(self, service, mock_http_client, sample_job_data):
         """Test successful job details fetch"""
         # Mock HTTP response
         mock_response = Mock(spec=Response)
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": sample_job_data}
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-
-            result = await service.get_job_details(1)
+        result = await service.get_job_details(1)
 
-            assert result == sample_job_data
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once_with(
-                "http://test-flask-service/api/v1/jobs/1"
-            )
+        assert result == sample_job_data
+        mock_http_client.get.assert_called_once_with(
+            "http://test-flask-service/api/v1/jobs/1", headers={}
+        )
 
     @pytest.mark.asyncio
-    async def test_get_job_details_not_found(self, service):
+    async def test_get_job_details_not_found(self, service, mock_http_client):
         """Test job details fetch when job not found"""
         mock_response = Mock(spec=Response)
         mock_response.status_code = 404
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        result = await service.get_job_details(999)
 
-            result = await service.get_job_details(999)
-
-            assert result is None
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_job_details_server_error(self, service):
-        """Test job details fetch with server error"""
+    async def test_get_job_details_server_error(self, service, mock_http_client):
+        """Test a server error is reported as the service being unavailable, not as a missing job"""
         mock_response = Mock(spec=Response)
         mock_response.status_code = 500
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+        with pytest.raises(DependencyUnavailableError, match="HTTP 500"):
+            await service.get_job_details(1)
 
-            result = await service.get_job_details(1)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [429, 401, 403, 304])
+    async def test_get_job_details_unexpected_status(self, service, mock_http_client, status_code):
+        """Test statuses other than 200/404 (or 304 to a revalidation) are failures, not a missing job"""
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = status_code
+        mock_response.headers = {}
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
-            assert result is None
+        with pytest.raises(DependencyUnavailableError, match=f"HTTP {status_code}"):
+            await service.get_job_details(1)
 
     @pytest.mark.asyncio
-    async def test_get_job_details_exception(self, service):
+    async def test_get_job_details_exception(self, service, mock_http_client):
         """Test job details fetch with network exception"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Network error")
+        mock_http_client.get = AsyncMock(side_effect=Exception("Network error"))
+
+        with pytest.raises(DependencyUnavailableError, match="Network error"):
+            await service.get_job_details(1)
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_reuses_shared_client(self, service, mock_http_client, sample_job_data):
+        """Test repeated fetches go through the injected client without opening new ones"""
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": sample_job_data}
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            await service.get_job_details(1)
+            await service.get_job_details(2)
+
+            mock_client_class.assert_not_called()
+        assert mock_http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_uses_cache(self, mock_db, mock_http_client, sample_job_data):
+        """Test found jobs and 404s are served from the cache on repeat lookups"""
+        job_cache = JobDetailsCache(InMemoryCacheBackend(), ttl=60, negative_ttl=5)
+        service = JobApplicationService(
+            db=mock_db,
+            http_client=mock_http_client,
+            flask_service_url="http://test-flask-service",
+            job_cache=job_cache
+        )
+        found = Mock(spec=Response)
+        found.status_code = 200
+        found.headers = {}
+        found.json.return_value = {"data": sample_job_data}
+        not_found = Mock(spec=Response)
+        not_found.status_code = 404
+        mock_http_client.get = AsyncMock(side_effect=[found, not_found])
+
+        assert await service.get_job_details(1) == sample_job_data
+        assert await service.get_job_details(1) == sample_job_data
+        assert await service.get_job_details(999) is None
+        assert await service.get_job_details(999) is None
+
+        assert mock_http_client.get.await_count == 2
+        assert job_cache.stats() == {"hits": 2, "misses": 2, "revalidated": 0, "evictions": 0}
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_revalidates_stale_jobs(
+            self, mock_db, mock_http_client, sample_job_data, monkeypatch
+    ):
+        """Test stale cached jobs are revalidated with If-None-Match and reused on 304"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.cache.job_details.time.time", lambda: now[0])
+        job_cache = JobDetailsCache(InMemoryCacheBackend(), ttl=60, negative_ttl=5, stale_ttl=600)
+        service = JobApplicationService(
+            db=mock_db,
+            http_client=mock_http_client,
+            flask_service_url="http://test-flask-service",
+            job_cache=job_cache
+        )
+        found = Mock(spec=Response)
+        found.status_code = 200
+        found.headers = {"ETag": '"v1"'}
+        found.json.return_value = {"data": sample_job_data}
+        not_modified = Mock(spec=Response)
+        not_modified.status_code = 304
+        mock_http_client.get = AsyncMock(side_effect=[found, not_modified])
+
+        assert await service.get_job_details(1) == sample_job_data
+        now[0] += 61
+        assert await service.get_job_details(1) == sample_job_data
+        assert await service.get_job_details(1) == sample_job_data
+
+        assert mock_http_client.get.await_count == 2
+        assert mock_http_client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert not_modified.json.call_count == 0
+        assert job_cache.stats()["revalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_serves_stale_job_when_unavailable(
+            self, mock_db, mock_http_client, sample_job_data, monkeypatch
+    ):
+        """Test a stale cached job is returned while the job listing service is down"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.cache.job_details.time.time", lambda: now[0])
+        job_cache = JobDetailsCache(InMemoryCacheBackend(), ttl=60, negative_ttl=5, stale_ttl=600)
+        service = JobApplicationService(
+            db=mock_db,
+            http_client=mock_http_client,
+            flask_service_url="http://test-flask-service",
+            job_cache=job_cache
+        )
+        found = Mock(spec=Response)
+        found.status_code = 200
+        found.headers = {"ETag": '"v1"'}
+        found.json.return_value = {"data": sample_job_data}
+        mock_http_client.get = AsyncMock(side_effect=[found, ConnectError("refused")])
+
+        assert await service.get_job_details(1) == sample_job_data
+        now[0] += 61
+        assert await service.get_job_details(1) == sample_job_data
+
+        assert mock_http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_does_not_cache_server_errors(self, mock_db, mock_http_client):
+        """Test 5xx responses are not cached"""
+        job_cache = JobDetailsCache(InMemoryCacheBackend(), ttl=60, negative_ttl=5)
+        service = JobApplicationService(
+            db=mock_db,
+            http_client=mock_http_client,
+            flask_service_url="http://test-flask-service",
+            job_cache=job_cache
+        )
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 500
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            with pytest.raises(DependencyUnavailableError):
+                await service.get_job_details(1)
+
+        assert mock_http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_job_details_coalesces_concurrent_fetches(self, mock_db, mock_http_client, sample_job_data):
+        """Test concurrent lookups for the same job share one HTTP request"""
+        flight = SingleFlight()
+        services = [
+            JobApplicationService(
+                db=mock_db,
+                http_client=mock_http_client,
+                flask_service_url="http://test-flask-service",
+                job_details_flight=flight
             )
+            for _ in range(5)
+        ]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": sample_job_data}
 
-            result = await service.get_job_details(1)
+        async def slow_get(url, headers=None):
+            await asyncio.sleep(0.01)
+            return mock_response
 
-            assert result is None
+        mock_http_client.get = AsyncMock(side_effect=slow_get)
+
+        results = await asyncio.gather(*(service.get_job_details(1) for service in services))
+
+        assert results == [sample_job_data] * 5
+        assert mock_http_client.get.await_count == 1
+        assert flight.stats()["coalesced"] == 4
 
     @pytest.mark.asyncio
     async def test_apply_job_success(self, service, mock_db, sample_apply_schema, sample_job_data):
         """Test successful job application"""
-        # Mock no existing application
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        created = JobApplication(id=1, job_id=1, user_id=1, user_email="test@example.com")
+        self.set_query_result(mock_db, created)
 
         # Mock job details fetch
         with patch.object(service, 'get_job_details', return_value=sample_job_data):
-            # Mock database operations
-            mock_db.add = Mock()
-            mock_db.commit = Mock()
-            mock_db.refresh = Mock()
-
             result = await service.apply_job(sample_apply_schema, user_id=1, user_email="test@example.com")
 
-            # Verify database operations
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
-            mock_db.refresh.assert_called_once()
+            assert result is created
+            # A single INSERT ... ON CONFLICT DO NOTHING RETURNING statement
+            mock_db.execute.assert_awaited_once()
+            mock_db.commit.assert_awaited_once()
 
-            # Verify the job application was created with correct data
-            added_job = mock_db.add.call_args[0][0]
-            assert isinstance(added_job, JobApplication)
-            assert added_job.job_id == 1
-            assert added_job.user_id == 1
-            assert added_job.user_email == "test@example.com"
-            assert added_job.title == sample_job_data["title"]
-            assert added_job.company == sample_job_data["company"]
+            stmt = mock_db.execute.call_args[0][0]
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            sql = str(compiled)
+            assert "ON CONFLICT (user_id, job_id) DO NOTHING" in sql
+            assert "RETURNING" in sql
+            assert compiled.params["user_email"] == "test@example.com"
+            assert compiled.params["title"] == sample_job_data["title"]
+            assert compiled.params["company"] == sample_job_data["company"]
 
     @pytest.mark.asyncio
-    async def test_apply_job_already_applied(self, service, mock_db, sample_apply_schema):
+    async def test_apply_job_already_applied(self, service, mock_db, sample_apply_schema, sample_job_data):
         """Test applying for job when already applied"""
-        # Mock existing application
-        existing_app = JobApplication(job_id=1, user_id=1)
-        mock_db.query.return_value.filter.return_value.first.return_value = existing_app
+        # The conflicting insert returns no row
+        self.set_query_result(mock_db, None)
+
+        with patch.object(service, 'get_job_details', return_value=sample_job_data):
+            with pytest.raises(ValueError, match="You have already applied for this job"):
+                await service.apply_job(sample_apply_schema, user_id=1, user_email="test@example.com")
 
-        with pytest.raises(ValueError, match="You have already applied for this job"):
-            await service.apply_job(sample_apply_schema, user_id=1, user_email="test@example.com")
+        mock_db.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_apply_job_not_found(self, service, mock_db, sample_apply_schema):
         """Test applying for non-existent job"""
-        # Mock no existing application
-        mock_db.query.return_value.filter.return_value.first.return_value = None
-
         # Mock job not found
         with patch.object(service, 'get_job_details', return_value=None):
             result = await service.apply_job(sample_apply_schema, user_id=1, user_email="test@example.com")
 
             assert result is None
+            mock_db.execute.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_apply_job_database_error(self, service, mock_db, sample_apply_schema, sample_job_data):
         """Test job application with database error"""
-        # Mock no existing application
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.set_query_result(mock_db, None)
 
         # Mock job details fetch
         with patch.object(service, 'get_job_details', return_value=sample_job_data):
             # Mock database error
-            mock_db.add = Mock()
-            mock_db.commit = Mock(side_effect=Exception("Database error"))
-            mock_db.rollback = Mock()
+            mock_db.commit.side_effect = Exception("Database error")
 
             with pytest.raises(Exception, match="Database error"):
                 await service.apply_job(sample_apply_schema, user_id=1, user_email="test@example.com")
 
-            mock_db.rollback.assert_called_once()
+            mock_db.rollback.assert_awaited_once()
 
-    def test_get_applied_job_success(self, service, mock_db):
+    @pytest.mark.asyncio
+    async def test_get_applied_job_success(self, service, mock_db):
         """Test successful retrieval of applied job"""
         mock_application = JobApplication(id=1, job_id=1, user_id=1)
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_application
+        self.set_query_result(mock_db, mock_application)
 
-        result = service.get_applied_job(application_id=1, user_id=1)
+        result = await service.get_applied_job(application_id=1, user_id=1)
 
         assert result == mock_application
-        mock_db.query.assert_called_once_with(JobApplication)
+        mock_db.execute.assert_awaited_once()
 
-    def test_get_applied_job_not_found(self, service, mock_db):
+    @pytest.mark.asyncio
+    async def test_get_applied_job_not_found(self, service, mock_db):
         """Test retrieval of non-existent applied job"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.set_query_result(mock_db, None)
 
-        result = service.get_applied_job(application_id=999, user_id=1)
+        result = await service.get_applied_job(application_id=999, user_id=1)
 
         assert result is None
 
@@ -186,20 +360,17 @@ class TestJobApplicationService:
         """Test successful deletion of applied job"""
         mock_application = JobApplication(id=1, job_id=1, user_id=1)
 
-        with patch.object(service, 'get_applied_job', return_value=mock_application):
-            mock_db.delete = Mock()
-            mock_db.commit = Mock()
-
+        with patch.object(service, 'get_applied_job', AsyncMock(return_value=mock_application)):
             result = await service.delete_applied_job(application_id=1, user_id=1)
 
             assert result is True
-            mock_db.delete.assert_called_once_with(mock_application)
-            mock_db.commit.assert_called_once()
+            mock_db.delete.assert_awaited_once_with(mock_application)
+            mock_db.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_delete_applied_job_not_found(self, service, mock_db):
         """Test deletion of non-existent applied job"""
-        with patch.object(service, 'get_applied_job', return_value=None):
+        with patch.object(service, 'get_applied_job', AsyncMock(return_value=None)):
             result = await service.delete_applied_job(application_id=999, user_id=1)
 
             assert result is False
@@ -209,12 +380,10 @@ class TestJobApplicationService:
         """Test job application deletion with database error"""
         mock_application = JobApplication(id=1, job_id=1, user_id=1)
 
-        with patch.object(service, 'get_applied_job', return_value=mock_application):
-            mock_db.delete = Mock()
-            mock_db.commit = Mock(side_effect=Exception("Database error"))
-            mock_db.rollback = Mock()
+        with patch.object(service, 'get_applied_job', AsyncMock(return_value=mock_application)):
+            mock_db.commit.side_effect = Exception("Database error")
 
             with pytest.raises(Exception, match="Database error"):
                 await service.delete_applied_job(application_id=1, user_id=1)
 
-            mock_db.rollback.assert_called_once()
+            mock_db.rollback.assert_awaited_once()
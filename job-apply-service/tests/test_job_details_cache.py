@@ -0,0 +1,136 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.api.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.api.cache.job_details import JobDetailsCache
+
+
+class FakeRedis:
+    """Minimal stand-in for redis.asyncio.Redis"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, px=None):
+        self.store[key] = value
+        self.ttls[key] = px
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+class TestInMemoryCacheBackend:
+    """Test cases for the in-process LRU + TTL backend"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full"""
+        backend = InMemoryCacheBackend(max_size=2)
+        await backend.set("a", 1, ttl=60)
+        await backend.set("b", 2, ttl=60)
+        await backend.get("a")
+        await backend.set("c", 3, ttl=60)
+
+        assert await backend.get("a") == 1
+        assert await backend.get("b") is None
+        assert await backend.get("c") == 3
+        assert backend.evictions == 1
+        assert len(backend) == 2
+
+    @pytest.mark.asyncio
+    async def test_expires_entries(self, monkeypatch):
+        """Test entries are dropped after their TTL"""
+        now = [100.0]
+        monkeypatch.setattr("app.api.cache.backends.time.monotonic", lambda: now[0])
+        backend = InMemoryCacheBackend()
+        await backend.set("a", 1, ttl=5)
+
+        assert await backend.get("a") == 1
+        now[0] = 105.0
+        assert await backend.get("a") is None
+        assert backend.evictions == 1
+
+
+class TestRedisCacheBackend:
+    """Test cases for the Redis backend"""
+
+    @pytest.mark.asyncio
+    async def test_round_trips_json_with_ttl(self):
+        """Test values are stored as JSON under the prefix with a millisecond TTL"""
+        client = FakeRedis()
+        backend = RedisCacheBackend(client, key_prefix="test:")
+        await backend.set("job:1", {"data": {"id": 1}}, ttl=1.5)
+
+        assert client.ttls["test:job:1"] == 1500
+        assert await backend.get("job:1") == {"data": {"id": 1}}
+
+        await backend.delete("job:1")
+        assert await backend.get("job:1") is None
+
+
+class TestJobDetailsCache:
+    """Test cases for JobDetailsCache"""
+
+    @pytest.fixture
+    def cache(self):
+        return JobDetailsCache(InMemoryCacheBackend(max_size=10), ttl=60, negative_ttl=5)
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counters(self, cache):
+        """Test hits and misses are counted"""
+        assert await cache.get(1) == (False, None)
+        await cache.set(1, {"id": 1, "title": "Engineer"})
+        assert await cache.get(1) == (True, {"id": 1, "title": "Engineer"})
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 0, "evictions": 0}
+
+    @pytest.mark.asyncio
+    async def test_negative_caching(self, cache):
+        """Test a cached 404 is a hit with no data"""
+        await cache.set_not_found(999)
+
+        assert await cache.get(999) == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, cache):
+        """Test invalidated jobs are fetched again"""
+        await cache.set(1, {"id": 1})
+        await cache.invalidate(1)
+
+        assert await cache.get(1) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_are_misses(self):
+        """Test backend failures do not propagate"""
+        backend = Mock(spec=CacheBackend)
+        backend.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        backend.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = JobDetailsCache(backend, ttl=60, negative_ttl=5)
+
+        await cache.set(1, {"id": 1})
+        assert await cache.get(1) == (False, None)
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_kept_for_revalidation(self, monkeypatch):
+        """Test jobs with an ETag are kept as stale copies after their TTL"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.cache.job_details.time.time", lambda: now[0])
+        cache = JobDetailsCache(InMemoryCacheBackend(), ttl=60, negative_ttl=5, stale_ttl=600)
+        await cache.set(1, {"id": 1}, etag='"v1"')
+
+        assert await cache.lookup(1) == (True, {"id": 1}, '"v1"')
+        now[0] += 61
+        assert await cache.get(1) == (False, None)
+        assert await cache.lookup(1) == (False, {"id": 1}, '"v1"')
+
+        await cache.revalidate(1, {"id": 1}, '"v1"')
+        assert await cache.get(1) == (True, {"id": 1})
+        assert cache.revalidated == 1
@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.cache.backends import InMemoryCacheBackend
+from app.api.cache.job_details import JobDetailsCache
+from app.api.utils.metrics import MetricsMiddleware, metrics_response
+from app.api.utils.resilience import DependencyUnavailableError
+from app.api.v1.services.jobs import JobApplicationService
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetricsMiddleware:
+    """Test cases for request metrics and the /metrics endpoint"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            if item_id == 0:
+                raise HTTPException(status_code=404, detail="Not found")
+            return {"id": item_id}
+
+        @app.get("/metrics")
+        def metrics():
+            return metrics_response()
+
+        return TestClient(app)
+
+    def test_latency_is_labelled_by_route_template_and_status(self, client):
+        """Test requests are counted under their route template, not the raw path"""
+        ok = dict(method="GET", route="/items/{item_id}", status="200")
+        missing = dict(method="GET", route="/items/{item_id}", status="404")
+        before_ok = sample("http_request_duration_seconds_count", **ok)
+        before_missing = sample("http_request_duration_seconds_count", **missing)
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/items/0")
+
+        assert sample("http_request_duration_seconds_count", **ok) == before_ok + 2
+        assert sample("http_request_duration_seconds_count", **missing) == before_missing + 1
+        assert sample("http_requests_in_progress", method="GET") == 0
+
+    def test_unmatched_paths_share_one_label(self, client):
+        """Test unknown paths do not create a label per path"""
+        labels = dict(method="GET", route="unmatched", status="404")
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        client.get("/nope/1")
+        client.get("/nope/2")
+
+        assert sample("http_request_duration_seconds_count", **labels) == before + 2
+
+    def test_metrics_endpoint(self, client):
+        """Test /metrics serves the Prometheus text format"""
+        client.get("/items/1")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "http_request_duration_seconds_bucket" in response.text
+
+
+class TestServiceMetrics:
+    """Test cases for outbound call and cache metrics"""
+
+    @pytest.mark.asyncio
+    async def test_job_details_fetch_is_timed_and_cache_counted(self):
+        """Test the job listing call is timed by status and cache lookups are counted"""
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = {"data": {"id": 1, "title": "Engineer"}}
+        http_client = Mock()
+        http_client.get = AsyncMock(return_value=response)
+        cache = JobDetailsCache(InMemoryCacheBackend(max_size=10), ttl=60, negative_ttl=10)
+        service = JobApplicationService(db=Mock(), http_client=http_client, job_cache=cache)
+        calls = sample("http_client_request_duration_seconds_count", service="job-listing", status="200")
+        misses = sample("cache_lookups_total", cache="job_details", result="miss")
+        hits = sample("cache_lookups_total", cache="job_details", result="hit")
+
+        await service.get_job_details(1)
+        await service.get_job_details(1)
+
+        assert sample("http_client_request_duration_seconds_count", service="job-listing", status="200") == calls + 1
+        assert sample("cache_lookups_total", cache="job_details", result="miss") == misses + 1
+        assert sample("cache_lookups_total", cache="job_details", result="hit") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_timed_as_error(self):
+        """Test network errors are recorded with an error status"""
+        http_client = Mock()
+        http_client.get = AsyncMock(side_effect=Exception("Network error"))
+        service = JobApplicationService(db=Mock(), http_client=http_client)
+        before = sample("http_client_request_duration_seconds_count", service="job-listing", status="error")
+
+        with pytest.raises(DependencyUnavailableError):
+            await service.get_job_details(1)
+
+        assert sample("http_client_request_duration_seconds_count", service="job-listing", status="error") == before + 1
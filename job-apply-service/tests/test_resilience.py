@@ -0,0 +1,250 @@
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import Mock
+
+from app.api.utils.resilience import (
+    CircuitBreaker,
+    DependencyUnavailableError,
+    ResiliencePolicy,
+    RetryBudget,
+    create_job_listing_policy,
+)
+
+
+def response(status_code, headers=None):
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = status_code
+    mock_response.headers = headers or {}
+    return mock_response
+
+
+def scripted(*outcomes, delays=None):
+    """Return a `send` that yields `outcomes` in order; exceptions are raised"""
+    calls = []
+
+    async def send():
+        index = len(calls)
+        calls.append(index)
+        if delays:
+            await asyncio.sleep(delays[index])
+        outcome = outcomes[index]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    send.calls = calls
+    return send
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit breaker state machine"""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens at the threshold and rejects calls"""
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert 0 < breaker.retry_after() <= 30
+        assert breaker.stats()["rejected"] == 1
+
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures count towards opening"""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_one_probe(self, monkeypatch):
+        """Test a single probe after the reset timeout decides the next state"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.utils.resilience.time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+
+        now[0] += 10
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        now[0] += 10
+        assert breaker.allow()
+        assert not breaker.allow()
+        assert breaker.retry_after() >= 1
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+
+class TestRetryBudget:
+    """Test cases for the retry budget"""
+
+    def test_retries_are_capped_by_deposits(self, monkeypatch):
+        """Test withdrawals beyond the balance are refused until calls deposit more"""
+        monkeypatch.setattr("app.api.utils.resilience.time.monotonic", lambda: 1000.0)
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=1)
+
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert budget.stats() == {"tokens": 0, "exhausted": 1}
+
+    def test_tokens_accrue_over_time(self, monkeypatch):
+        """Test the minimum rate refills the balance without traffic"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.utils.resilience.time.monotonic", lambda: now[0])
+        budget = RetryBudget(ratio=0, min_per_second=1, max_tokens=2)
+        assert budget.withdraw() and budget.withdraw()
+        assert not budget.withdraw()
+
+        now[0] += 1
+        assert budget.withdraw()
+
+
+class TestResiliencePolicy:
+    """Test cases for retries, hedging, deadlines and fail-fast calls"""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self):
+        """Test connection errors and 503s are retried until a response arrives"""
+        policy = ResiliencePolicy("test", budget=RetryBudget(), max_retries=2, backoff=0)
+        send = scripted(httpx.ConnectError("refused"), response(503), response(200))
+
+        result = await policy.call(send)
+
+        assert result.status_code == 200
+        assert len(send.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Test the last failure is raised as DependencyUnavailableError"""
+        policy = ResiliencePolicy("test", max_retries=1, backoff=0)
+        send = scripted(response(502), response(504))
+
+        with pytest.raises(DependencyUnavailableError, match="HTTP 504"):
+            await policy.call(send)
+        assert len(send.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors_or_500(self):
+        """Test 4xx responses pass through and 500s fail without a retry"""
+        policy = ResiliencePolicy("test", max_retries=2, backoff=0)
+
+        assert (await policy.call(scripted(response(404)))).status_code == 404
+        send = scripted(response(500))
+        with pytest.raises(DependencyUnavailableError):
+            await policy.call(send)
+        assert len(send.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_stops_retries(self):
+        """Test no retry is sent when the budget is empty"""
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=0)
+        policy = ResiliencePolicy("test", budget=budget, max_retries=2, backoff=0)
+        send = scripted(httpx.ReadTimeout("slow"), response(200))
+
+        with pytest.raises(DependencyUnavailableError, match="retry budget exhausted"):
+            await policy.call(send)
+        assert len(send.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test calls are rejected without being sent once the circuit opens"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+        policy = ResiliencePolicy("test", breaker=breaker)
+        with pytest.raises(DependencyUnavailableError):
+            await policy.call(scripted(httpx.ConnectError("refused")))
+
+        send = scripted(response(200))
+        with pytest.raises(DependencyUnavailableError, match="circuit open") as exc_info:
+            await policy.call(send)
+
+        assert send.calls == []
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_rejected_statuses_fail_and_open_the_circuit(self):
+        """Test a response `accept` refuses is a non-retried failure carrying Retry-After from a 429"""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+        policy = ResiliencePolicy("test", breaker=breaker, max_retries=2, backoff=0)
+        send = scripted(response(429, {"Retry-After": "7"}))
+
+        with pytest.raises(DependencyUnavailableError, match="HTTP 429") as exc_info:
+            await policy.call(send, accept=lambda r: r.status_code in (200, 404))
+
+        assert len(send.calls) == 1
+        assert exc_info.value.retry_after == 7
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_slow_attempt_is_retried_within_the_deadline(self):
+        """Test an attempt that exceeds its share of the deadline is cut off and retried"""
+        policy = ResiliencePolicy("test", budget=RetryBudget(), max_retries=1, backoff=0, deadline=0.2)
+        send = scripted(response(200), response(200), delays=[1, 0])
+
+        assert policy.attempt_timeout == pytest.approx(0.1)
+        assert (await policy.call(send)).status_code == 200
+        assert len(send.calls) == 2
+
+    def test_attempt_timeout_leaves_room_for_backoff(self):
+        """Test the derived attempt timeout splits the deadline left after the longest backoff"""
+        policy = ResiliencePolicy("test", max_retries=2, backoff=0.05, backoff_max=1.0, deadline=5.0)
+
+        assert policy.max_backoff() == pytest.approx(0.3)
+        assert policy.attempt_timeout == pytest.approx(4.7 / 3)
+
+    def test_attempt_timeouts_must_fit_the_deadline(self, monkeypatch):
+        """Test startup fails when explicit attempt timeouts would use up the deadline"""
+        monkeypatch.setattr("app.api.utils.resilience.config.JOB_LISTING_DEADLINE", 5.0)
+        monkeypatch.setattr("app.api.utils.resilience.config.JOB_LISTING_MAX_RETRIES", 2)
+        monkeypatch.setattr("app.api.utils.resilience.config.JOB_LISTING_ATTEMPT_TIMEOUT", 5.0)
+
+        with pytest.raises(ValueError, match="JOB_LISTING_DEADLINE"):
+            create_job_listing_policy()
+
+        monkeypatch.setattr("app.api.utils.resilience.config.JOB_LISTING_ATTEMPT_TIMEOUT", 1.5)
+        assert create_job_listing_policy().attempt_timeout == 1.5
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_the_whole_call(self):
+        """Test a hanging dependency is cut off at the deadline and counted as a failure"""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+        policy = ResiliencePolicy("test", breaker=breaker, deadline=0.01)
+
+        with pytest.raises(DependencyUnavailableError, match="no response within"):
+            await policy.call(scripted(response(200), delays=[1]))
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_when_first_is_slow(self):
+        """Test a second request is sent after the hedge delay and the faster one is used"""
+        fast = response(200)
+        policy = ResiliencePolicy("test", budget=RetryBudget(), hedge_delay=0.01)
+        send = scripted(response(200), fast, delays=[1, 0])
+
+        assert await policy.call(send) is fast
+        assert len(send.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_first_answers_in_time(self):
+        """Test fast responses do not trigger a hedged request"""
+        policy = ResiliencePolicy("test", hedge_delay=0.5)
+        send = scripted(response(200))
+
+        await policy.call(send)
+
+        assert len(send.calls) == 1
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.utils.single_flight import SingleFlight
+
+
+def sample(outcome):
+    return REGISTRY.get_sample_value("single_flight_calls_total", {"group": "test", "outcome": outcome}) or 0
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight request coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test callers for the same key get the result of a single call"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        executions = 0
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            return {"id": 1}
+
+        callers = [asyncio.create_task(flight.do(1, fetch)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert executions == 1
+        assert results == [{"id": 1}] * 10
+        assert flight.stats() == {"in_flight": 0, "calls": 1, "coalesced": 9}
+
+    @pytest.mark.asyncio
+    async def test_callers_are_counted_by_outcome(self):
+        """Test the leader and coalesced callers are exported as Prometheus counters"""
+        flight = SingleFlight("test")
+        leaders, coalesced = sample("leader"), sample("coalesced")
+
+        async def fetch():
+            await asyncio.sleep(0)
+            return "ok"
+
+        await asyncio.gather(flight.do(1, fetch), flight.do(1, fetch))
+
+        assert sample("leader") == leaders + 1
+        assert sample("coalesced") == coalesced + 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self):
+        """Test calls for different keys are not coalesced"""
+        flight = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(flight.do(1, lambda: fetch(1)), flight.do(2, lambda: fetch(2)))
+
+        assert results == [1, 2]
+        assert flight.stats()["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_key_released(self):
+        """Test a failure reaches every waiter and the next call starts fresh"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.do(1, fail), flight.do(1, fail), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def succeed():
+            return "ok"
+
+        assert await flight.do(1, succeed) == "ok"
+        assert flight.stats() == {"in_flight": 0, "calls": 2, "coalesced": 1}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling the first caller leaves the shared call running"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do(1, fetch))
+        second = asyncio.create_task(flight.do(1, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
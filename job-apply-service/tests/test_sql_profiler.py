@@ -0,0 +1,72 @@
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.utils.sql_profiler import QueryProfile, SQLProfilerMiddleware
+
+
+class TestSQLProfilerMiddleware:
+    """Test cases for per-request SQL profiling"""
+
+    @pytest.fixture
+    def client(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        app = FastAPI()
+        app.add_middleware(SQLProfilerMiddleware, repeat_threshold=5)
+
+        @app.get("/one")
+        async def one():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return {}
+
+        @app.get("/n-plus-one")
+        async def n_plus_one():
+            async with engine.connect() as conn:
+                for job_id in range(6):
+                    await conn.execute(text("SELECT :id"), {"id": job_id})
+            return {}
+
+        with TestClient(app) as client:
+            yield client
+
+    def test_headers_report_query_count_and_time(self, client):
+        """Test the response carries the number of queries and DB time"""
+        response = client.get("/one")
+
+        assert response.headers["X-DB-Query-Count"] == "1"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert "X-DB-Repeated-Queries" not in response.headers
+
+    def test_repeated_statements_are_flagged(self, client, caplog):
+        """Test a statement run once per row is reported as N+1"""
+        with caplog.at_level(logging.INFO, logger="app.api.utils.sql_profiler"):
+            response = client.get("/n-plus-one")
+
+        assert response.headers["X-DB-Query-Count"] == "6"
+        assert response.headers["X-DB-Repeated-Queries"] == "1"
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        summary = json.loads(record.getMessage().removeprefix("SQL profile "))
+        assert summary["path"] == "/n-plus-one"
+        assert summary["status"] == 200
+        assert summary["repeated"] == [{"statement": "SELECT ?", "count": 6, "ms": summary["repeated"][0]["ms"]}]
+
+
+class TestQueryProfile:
+    """Test cases for the query profile"""
+
+    def test_keeps_slowest_statements(self):
+        """Test only the slowest statements are kept, slowest first"""
+        profile = QueryProfile(slowest=2, repeat_threshold=3)
+        for statement, duration in [("a", 0.01), ("b", 0.05), ("c", 0.02), ("d", 0.001)]:
+            profile.record(statement, duration)
+
+        assert [statement for statement, _ in profile.slowest] == ["b", "c"]
+        assert profile.count == 4
+        assert profile.repeated() == []
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.utils import tracing
+from app.api.v1.services.jobs import JobApplicationService
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+class TestTracing:
+    """Test cases for request, service, SQL and outbound call spans"""
+
+    @pytest.fixture
+    def exporter(self, monkeypatch):
+        """Record spans with a local provider instead of installing a global one"""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        monkeypatch.setattr(tracing, "tracer", provider.get_tracer(tracing.SERVICE_NAME))
+        tracing.instrument_sqlalchemy()
+        return exporter
+
+    @pytest.fixture
+    def http_client(self):
+        response = Mock(status_code=200, headers={})
+        response.json.return_value = {"data": {"id": 7, "title": "Engineer"}}
+        http_client = Mock()
+        http_client.get = AsyncMock(return_value=response)
+        return http_client
+
+    @pytest.fixture
+    def client(self, http_client):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        app = FastAPI()
+        app.add_middleware(tracing.TracingMiddleware)
+
+        @app.get("/jobs/{job_id}")
+        async def job(job_id: int):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            service = JobApplicationService(db=Mock(), http_client=http_client)
+            return await service.get_job_details(job_id)
+
+        with TestClient(app) as client:
+            yield client
+
+    def finished_spans(self, exporter):
+        return {span.name: span for span in exporter.get_finished_spans()}
+
+    def test_spans_cover_route_service_sql_and_outbound_call(self, exporter, client):
+        """Test one trace links the route, service method, SQL and job listing call"""
+        response = client.get("/jobs/7", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"})
+
+        assert response.status_code == 200
+        spans = self.finished_spans(exporter)
+        server = spans["GET /jobs/{job_id}"]
+        service = spans["JobApplicationService.get_job_details"]
+        outbound = spans["GET /api/v1/jobs/{job_id}"]
+        query = spans["SELECT"]
+
+        assert {format(span.context.trace_id, "032x") for span in spans.values()} == {TRACE_ID}
+        assert server.kind == SpanKind.SERVER
+        assert server.attributes["http.route"] == "/jobs/{job_id}"
+        assert query.parent.span_id == server.context.span_id
+        assert service.parent.span_id == server.context.span_id
+        assert outbound.parent.span_id == service.context.span_id
+        assert outbound.attributes["http.response.status_code"] == 200
+
+    def test_traceparent_is_sent_to_job_listing_service(self, exporter, client, http_client):
+        """Test the outbound call carries the client span as W3C traceparent"""
+        client.get("/jobs/7")
+
+        headers = http_client.get.call_args.kwargs["headers"]
+        outbound = self.finished_spans(exporter)["GET /api/v1/jobs/{job_id}"]
+        context = outbound.context
+        assert headers["traceparent"] == (
+            f"00-{context.trace_id:032x}-{context.span_id:016x}-{context.trace_flags:02x}"
+        )
@@ -2,15 +2,29 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 
 from app.api.db import db
+from app.api.db.pool import engine_options, pool_metrics, replica_pool_metrics
+from app.api.db.replica import REPLICA_BIND, replica_router, set_last_write_cookie
+from app.api.utils.json_provider import OrjsonProvider
+from app.api.utils.metrics import init_metrics
+from app.api.utils.sql_profiler import init_sql_profiler
+from app.api.utils.tracing import init_tracing
 from config import Config, config
-from app.extensions import mail, ma, migrate
+from app.extensions import compress, mail, ma, migrate
 
 from app.api.v1.routes import jobs
+from app.api.v1.services.jobs import response_cache
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config)
     app.config.from_object(Config)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+    replica_uri = app.config["SQLALCHEMY_REPLICA_URI"]
+    if replica_uri:
+        app.config["SQLALCHEMY_BINDS"] = {
+            REPLICA_BIND: {"url": replica_uri, **engine_options(app.config, replica_pool_metrics, replica_uri)}
+        }
 
     # Initialize CORS
     CORS(app, resources={r"/*": {"origins": "*"}})
@@ -20,17 +34,30 @@ def create_app():
     mail.init_app(app)
     ma.init_app(app)
     migrate.init_app(app, db)
+    compress.init_app(app)
 
     # Register Flask blueprints
     app.register_blueprint(jobs.bp)
+    app.after_request(set_last_write_cookie)
+    init_metrics(app)
+    init_sql_profiler(app)
+    init_tracing(app)
 
     # Health check endpoint
     @app.route('/api', methods=['GET'])
     def api_check():
-        return jsonify({
+        health = {
             'message': 'API is running...',
             'version': '1.0.0',
-            'status': 'healthy'
-        }), 200
+            'status': 'healthy',
+            'cache': response_cache.stats(),
+            'db_pool': pool_metrics.stats(db.engine.pool)
+        }
+        if REPLICA_BIND in db.engines:
+            health['db_replica'] = {
+                **replica_router.stats(),
+                'pool': replica_pool_metrics.stats(db.engines[REPLICA_BIND].pool)
+            }
+        return jsonify(health), 200
 
     return app
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import redis
+
+
+class CacheBackend(ABC):
+    """Storage backend for cached values. Values must be JSON serializable."""
+
+    evictions = 0
+
+    @abstractmethod
+    def get(self, key):
+        """Return the cached value or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """Store a value that expires after `ttl` seconds."""
+
+    @abstractmethod
+    def add(self, key, value, ttl):
+        """Store a value only if the key is missing or expired. Returns True if it was stored."""
+
+    @abstractmethod
+    def delete(self, *keys):
+        """Remove values if present."""
+
+    @abstractmethod
+    def incr(self, key, amount=1):
+        """Atomically add `amount` to a counter that never expires and return the new value."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every value owned by this backend."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Per-process cache bounded to `max_size` entries with TTL and LRU eviction.
+
+    Safe to share between the threads of one worker. Invalidation only reaches
+    the current process; use the Redis backend when running several workers.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def add(self, key, value, ttl):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def incr(self, key, amount=1):
+        # Counters live outside the LRU so they are never evicted
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            return self._counters[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def _store(self, key, value, ttl):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every worker and replica through Redis.
+
+    Expiry is delegated to Redis key TTLs; size-bound eviction is governed by the
+    server's `maxmemory-policy` (e.g. `allkeys-lru`), so evictions are not counted here.
+    """
+
+    def __init__(self, client, key_prefix="job-listing:"):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.evictions = 0
+
+    @classmethod
+    def from_url(cls, url, key_prefix="job-listing:"):
+        return cls(redis.Redis.from_url(url), key_prefix)
+
+    def get(self, key):
+        raw = self.client.get(self.key_prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.key_prefix + key, json.dumps(value), px=int(ttl * 1000))
+
+    def add(self, key, value, ttl):
+        return bool(self.client.set(self.key_prefix + key, json.dumps(value), px=int(ttl * 1000), nx=True))
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*(self.key_prefix + key for key in keys))
+
+    def incr(self, key, amount=1):
+        return self.client.incr(self.key_prefix + key, amount)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.key_prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
@@ -0,0 +1,163 @@
+import json
+import logging
+
+from app.api.cache.backends import InMemoryCacheBackend, RedisCacheBackend
+from app.api.utils.metrics import CACHE_LOOKUPS
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class JobResponseCache:
+    """
+    Cache for serialized job read results.
+
+    Single jobs are cached by ID when created or read and are removed when
+    that job is updated or deleted. List results (pages, facets) are cached by kind and normalized
+    query under a generation number; every write bumps the generation, so all
+    cached lists go stale at once without scanning keys. Results computed from
+    reads that started before a write are never stored.
+    Backend errors are logged and treated as misses so a cache outage never
+    fails a request.
+    """
+
+    GENERATION_KEY = "jobs:generation"
+
+    def __init__(self, backend, ttl):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get_job(self, job_id):
+        """Return the cached entry for a job or None."""
+        return self._get(self._job_key(job_id))
+
+    def set_job(self, job_id, value):
+        """Store the cached entry for a job that was just created."""
+        self._set(self._job_key(job_id), value, self.ttl)
+
+    def fill_job(self, job_id, value, generation, ttl=None):
+        """
+        Cache a job read from the database after `generation()` returned `generation`.
+
+        The entry lives for `ttl` seconds (defaults to the cache TTL). Nothing is
+        stored if a job was written since (the read may predate it) or if an entry
+        already exists, so a slow read never replaces a newer entry. Writers bump
+        the generation before touching job keys, so an entry added while a write
+        was in progress is dropped again.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or generation is None or self.generation() != generation:
+            return
+        key = self._job_key(job_id)
+        try:
+            if self.backend.add(key, value, ttl) and self.generation() != generation:
+                self.backend.delete(key)
+        except Exception as e:
+            logger.error(f"Job cache write failed for {key}: {str(e)}")
+
+    def invalidate_jobs(self, *job_ids):
+        """Drop the given jobs and every cached list."""
+        self.invalidate_lists()
+        try:
+            self.backend.delete(*(self._job_key(job_id) for job_id in job_ids))
+        except Exception as e:
+            logger.error(f"Job cache invalidation failed for job IDs {job_ids}: {str(e)}")
+
+    def get_list(self, kind, params):
+        """
+        Look up the cached result of a list query.
+
+        Returns:
+            tuple: (cached result or None, generation to pass to `set_list`).
+        """
+        generation = self.generation()
+        if generation is None:
+            self.misses += 1
+            CACHE_LOOKUPS.labels("jobs", "miss").inc()
+            return None, None
+        return self._get(self._list_key(kind, params, generation)), generation
+
+    def set_list(self, kind, params, value, generation, ttl=None):
+        """
+        Store the result of a list query for `ttl` seconds (defaults to the cache TTL).
+
+        `generation` is the one `get_list` returned before the result was
+        computed. The result is dropped if a job was written since, as it may
+        not include that write.
+        """
+        if generation is None or self.generation() != generation:
+            return
+        self._set(self._list_key(kind, params, generation), value, self.ttl if ttl is None else ttl)
+
+    def invalidate_lists(self):
+        """Make every cached list result stale."""
+        try:
+            self.backend.incr(self.GENERATION_KEY)
+        except Exception as e:
+            logger.error(f"Job cache list invalidation failed: {str(e)}")
+
+    def generation(self):
+        """Return the current write generation, or None if the backend is unavailable."""
+        try:
+            return self.backend.incr(self.GENERATION_KEY, 0)
+        except Exception as e:
+            logger.error(f"Job cache generation read failed: {str(e)}")
+            return None
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.backend.evictions,
+        }
+
+    def clear(self):
+        try:
+            self.backend.clear()
+        except Exception as e:
+            logger.error(f"Job cache clear failed: {str(e)}")
+
+    @staticmethod
+    def _job_key(job_id):
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _list_key(kind, params, generation):
+        query = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{kind}:{generation}:{query}"
+
+    def _get(self, key):
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Job cache read failed for {key}: {str(e)}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+            CACHE_LOOKUPS.labels("jobs", "miss").inc()
+        else:
+            self.hits += 1
+            CACHE_LOOKUPS.labels("jobs", "hit").inc()
+        return value
+
+    def _set(self, key, value, ttl):
+        if ttl <= 0:
+            return
+        try:
+            self.backend.set(key, value, ttl)
+        except Exception as e:
+            logger.error(f"Job cache write failed for {key}: {str(e)}")
+
+
+def create_response_cache():
+    """Build the job response cache using the backend selected in `Config`."""
+    if config.JOBS_CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend.from_url(config.REDIS_URL)
+    else:
+        backend = InMemoryCacheBackend(max_size=config.JOBS_CACHE_MAX_SIZE)
+    return JobResponseCache(backend, ttl=config.JOBS_CACHE_TTL)
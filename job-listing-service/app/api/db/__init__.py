@@ -1,4 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 
-# Initialize the SQLAlchemy instance
-db = SQLAlchemy()
\ No newline at end of file
+from app.api.db.replica import RoutingSession
+
+# Initialize the SQLAlchemy instance; reads in read_replica() blocks can use the "replica" bind
+db = SQLAlchemy(session_options={"class_": RoutingSession})
\ No newline at end of file
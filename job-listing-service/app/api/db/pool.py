@@ -0,0 +1,134 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.api.utils.metrics import DB_POOL_CHECKOUT, DB_POOL_TIMEOUTS
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters for database connection checkouts.
+
+    The wait covers everything `Pool.connect()` does before handing out a
+    connection: queueing for a free slot, opening a new connection and the
+    pre-ping round-trip. Waits are also exported as the `db_pool_checkout_seconds`
+    Prometheus histogram, labelled with the pool `name`.
+    """
+
+    def __init__(self, name="primary"):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, wait, timed_out=False):
+        """
+        Record one checkout attempt.
+
+        Args:
+            wait (float): Seconds spent in `Pool.connect()`.
+            timed_out (bool): True if the pool timed out waiting for a connection.
+        """
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        if timed_out:
+            DB_POOL_TIMEOUTS.labels(self.name).inc()
+        else:
+            DB_POOL_CHECKOUT.labels(self.name).observe(wait)
+
+    def stats(self, pool=None):
+        """
+        Snapshot of the checkout counters and, if given, the pool's occupancy.
+
+        Args:
+            pool (Pool, optional): Pool whose current size and usage to include.
+
+        Returns:
+            dict: Checkouts, timeouts, average/max wait in milliseconds and pool usage.
+        """
+        with self._lock:
+            attempts = self._checkouts + self._timeouts
+            stats = {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._wait_total / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            })
+        return stats
+
+    def reset(self):
+        """Zero all counters."""
+        with self._lock:
+            self._checkouts = 0
+            self._timeouts = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+
+
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics("replica")
+
+
+def timed_pool_class(base, metrics):
+    """
+    Subclass a SQLAlchemy pool so every checkout is timed into `metrics`.
+
+    The metrics live on the class, so pools recreated by `engine.dispose()`
+    keep reporting to the same counters.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except PoolTimeoutError:
+            metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.record(time.perf_counter() - start)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect, "metrics": metrics})
+
+
+def engine_options(config, metrics=pool_metrics, url=None):
+    """
+    Build `SQLALCHEMY_ENGINE_OPTIONS` from the `DB_POOL_*` settings.
+
+    Behind PgBouncer in transaction mode PgBouncer does the pooling, so each
+    checkout opens a fresh connection to it instead of holding a local pool.
+    SQLite keeps SQLAlchemy's default pool.
+
+    Args:
+        config (Mapping): Application config.
+        metrics (PoolMetrics): Where to record checkout waits.
+        url (str, optional): Database URL the options are for. Defaults to
+            `SQLALCHEMY_DATABASE_URI`.
+
+    Returns:
+        dict: Keyword arguments for `create_engine`.
+    """
+    if (url or config["SQLALCHEMY_DATABASE_URI"]).startswith("sqlite"):
+        return {}
+    if config["DB_PGBOUNCER"]:
+        return {"poolclass": timed_pool_class(NullPool, metrics)}
+    return {
+        "poolclass": timed_pool_class(QueuePool, metrics),
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+REPLICA_BIND = "replica"
+LAST_WRITE_COOKIE = "jobs_last_write"
+
+# Seconds since the last transaction replayed on a Postgres standby; 0 when it has
+# replayed everything it received (an idle primary would otherwise look lagged)
+POSTGRES_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaRouter:
+    """
+    Decides whether reads may go to the read replica.
+
+    Replica lag is measured at most every `check_interval` seconds; while it is
+    above `max_lag` (or the replica cannot be reached) reads fall back to the
+    primary.
+    """
+
+    def __init__(self, max_lag, check_interval):
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag = None
+        self.healthy = True
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def usable(self, engine):
+        """
+        Return True if reads may use `engine`, refreshing its lag when due.
+
+        Only one thread measures the lag at a time; the others use the last result.
+        """
+        if time.monotonic() - self._checked_at >= self.check_interval and self._lock.acquire(blocking=False):
+            try:
+                self._check(engine)
+            finally:
+                self._lock.release()
+        return self.healthy
+
+    def _check(self, engine):
+        try:
+            if engine.dialect.name == "postgresql":
+                with engine.connect() as conn:
+                    self.lag = float(conn.execute(POSTGRES_LAG_QUERY).scalar_one())
+            else:
+                self.lag = 0.0
+            healthy = self.lag <= self.max_lag
+            if not healthy:
+                logger.warning(f"Read replica is {self.lag:.1f}s behind, reading from the primary")
+        except Exception as e:
+            logger.error(f"Read replica lag check failed: {str(e)}")
+            self.lag = None
+            healthy = False
+        self.healthy = healthy
+        self._checked_at = time.monotonic()
+
+    def record(self, replica):
+        if replica:
+            self.replica_reads += 1
+        else:
+            self.primary_reads += 1
+
+    def stats(self):
+        return {
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+    def reset(self):
+        self.lag = None
+        self.healthy = True
+        self._checked_at = float("-inf")
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+
+replica_router = ReplicaRouter(config.DB_REPLICA_MAX_LAG, config.DB_REPLICA_LAG_CHECK_INTERVAL)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads inside `read_replica()` to the `replica` bind.
+
+    Flushes and INSERT/UPDATE/DELETE statements always use the primary, and
+    mark the session so the commit is remembered for read-your-writes. Reads
+    actually sent to the replica are flagged for `used_replica()`.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or (clause is not None and not getattr(clause, "is_select", False)):
+                self.info["wrote"] = True
+            elif clause is not None and self.info.get("read_replica"):
+                engine = self._db.engines.get(REPLICA_BIND)
+                if engine is not None:
+                    usable = replica_router.usable(engine)
+                    replica_router.record(usable)
+                    if usable:
+                        self.info["used_replica"] = True
+                        return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_write(session):
+    if session.info.pop("wrote", False) and has_request_context():
+        g.last_write = time.time()
+
+
+@contextmanager
+def read_replica():
+    """
+    Send the reads made inside the block to the read replica, if one is configured.
+
+    Requests from a client that wrote within `DB_READ_YOUR_WRITES_WINDOW`
+    seconds (tracked by the `jobs_last_write` cookie) keep reading from the
+    primary so they see their own changes. Can also be used as a decorator.
+    """
+    from app.api.db import db
+
+    session = db.session()
+    previous = session.info.get("read_replica", False)
+    previous_used = session.info.pop("used_replica", False)
+    session.info["read_replica"] = not _recently_wrote()
+    try:
+        yield
+    finally:
+        session.info["read_replica"] = previous
+        session.info["used_replica"] = session.info.get("used_replica", False) or previous_used
+
+
+def used_replica():
+    """
+    Return True if a read in the current `read_replica()` block went to the replica.
+
+    The replica may not have replayed recent writes yet, so results read from
+    it must not be cached where they would outlive the lag.
+    """
+    from app.api.db import db
+
+    return db.session().info.get("used_replica", False)
+
+
+def _recently_wrote():
+    if not has_request_context():
+        return False
+    last_write = g.get("last_write")
+    if last_write is None:
+        try:
+            last_write = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+        except ValueError:
+            return False
+    return time.time() - last_write < config.DB_READ_YOUR_WRITES_WINDOW
+
+
+def set_last_write_cookie(response):
+    """`after_request` hook that pins the client to the primary after a write."""
+    last_write = g.get("last_write")
+    if last_write is not None:
+        response.set_cookie(
+            LAST_WRITE_COOKIE, f"{last_write:.3f}",
+            max_age=int(config.DB_READ_YOUR_WRITES_WINDOW) or 1, httponly=True, samesite="Lax"
+        )
+    return response
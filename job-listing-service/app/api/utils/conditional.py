@@ -0,0 +1,67 @@
+import hashlib
+from datetime import timezone
+
+from flask import request
+from werkzeug.http import http_date
+
+
+def make_etag(*parts):
+    """
+    Build a strong ETag from the given version parts.
+
+    Args:
+        *parts: Values identifying the representation (e.g. a resource name and
+            the version string returned by the service).
+
+    Returns:
+        str: Unquoted ETag value.
+    """
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Check the request's conditional headers against the current validators.
+
+    `If-None-Match` takes precedence; `If-Modified-Since` is only consulted when
+    the client did not send an entity tag (RFC 9110, section 13.2.2).
+
+    Args:
+        etag (str): Current unquoted ETag.
+        last_modified (datetime, optional): Naive UTC modification time.
+
+    Returns:
+        bool: True if the client's copy is still current.
+    """
+    if request.if_none_match:
+        if request.if_none_match.star_tag:
+            return True
+        # Flask-Compress appends ":<encoding>" to the ETag of compressed responses
+        tags = request.if_none_match.as_set(include_weak=True)
+        return etag in {tag.rsplit(":", 1)[0] for tag in tags}
+    if request.if_modified_since and last_modified is not None:
+        return _to_http_precision(last_modified) <= request.if_modified_since
+    return False
+
+
+def cache_headers(etag, last_modified=None):
+    """
+    Validator headers to send with a 200 or 304 response.
+
+    `Cache-Control: no-cache` lets clients store the response but makes them
+    revalidate before reusing it.
+    """
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(_to_http_precision(last_modified))
+    return headers
+
+
+def not_modified_response(etag, last_modified=None):
+    """Build an empty 304 Not Modified response carrying the validators."""
+    return "", 304, cache_headers(etag, last_modified)
+
+
+def _to_http_precision(value):
+    # HTTP dates have one-second resolution and timestamps are stored as naive UTC
+    return value.replace(microsecond=0, tzinfo=timezone.utc)
@@ -0,0 +1,29 @@
+import csv
+import io
+
+import orjson
+
+
+def to_ndjson(rows):
+    """Encode dicts as newline-delimited JSON, one line per row."""
+    for row in rows:
+        yield orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def to_csv(rows, fieldnames):
+    """Encode dicts as CSV lines, starting with a header row."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    writer.writeheader()
+    yield _drain(buffer)
+    for row in rows:
+        writer.writerow(row)
+        yield _drain(buffer)
+
+
+def _drain(buffer):
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return value
@@ -0,0 +1,88 @@
+import os
+import time
+
+from flask import Response, g, request
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR (set in
+# gunicorn.conf.py) and /metrics aggregates them; otherwise the default registry is used.
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route", "status"]
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served", ["method"], multiprocess_mode="livesum"
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "Database statement execution time", ["operation"],
+    buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, float("inf"))
+)
+DB_POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds", "Time spent checking out a pooled database connection", ["pool"],
+    buckets=(.0005, .001, .005, .01, .05, .1, .5, 1, 5, float("inf"))
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Checkouts that timed out waiting for a pooled connection", ["pool"]
+)
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Response cache lookups", ["cache", "result"])
+
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+def init_metrics(app):
+    """
+    Record request latency and in-flight requests for every route and expose `GET /metrics`.
+
+    Requests are labelled by URL rule (e.g. `/api/v1/jobs/<int:job_id>`) rather
+    than the raw path to keep label cardinality bounded.
+    """
+    app.before_request(_start_timer)
+    app.after_request(_observe_request)
+    app.teardown_request(_finish_request)
+    app.add_url_rule("/metrics", "metrics", metrics_view, methods=["GET"])
+
+
+def metrics_view():
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        body = generate_latest(registry)
+    else:
+        body = generate_latest()
+    return Response(body, content_type=CONTENT_TYPE_LATEST)
+
+
+def _start_timer():
+    g.metrics_start = time.perf_counter()
+    REQUESTS_IN_PROGRESS.labels(request.method).inc()
+
+
+def _observe_request(response):
+    start = g.get("metrics_start")
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUEST_LATENCY.labels(request.method, route, response.status_code).observe(time.perf_counter() - start)
+    return response
+
+
+def _finish_request(exc):
+    if g.pop("metrics_start", None) is not None:
+        REQUESTS_IN_PROGRESS.labels(request.method).dec()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.metrics_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "metrics_start", None)
+    if start is None:
+        return
+    operation = statement.lstrip()[:6].upper()
+    if operation not in SQL_OPERATIONS:
+        operation = "OTHER"
+    DB_QUERY_LATENCY.labels(operation).observe(time.perf_counter() - start)
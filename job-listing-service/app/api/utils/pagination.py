@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at, job_id):
+    """
+    Encode the keyset position of the last job on a page into an opaque cursor.
+
+    Args:
+        created_at (datetime): Creation timestamp of the last job returned.
+        job_id (int): ID of the last job returned.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    return _encode([created_at.isoformat(), job_id])
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+
+    Returns:
+        tuple: (created_at, job_id) keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        created_at, job_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(job_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_rank_cursor(rank, job_id):
+    """
+    Encode the keyset position of the last search result on a page.
+
+    Args:
+        rank (float): Relevance rank of the last result returned.
+        job_id (int): ID of the last result returned.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    return _encode([rank, job_id])
+
+
+def decode_rank_cursor(cursor):
+    """
+    Decode a cursor produced by `encode_rank_cursor`.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+
+    Returns:
+        tuple: (rank, job_id) keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        rank, job_id = _decode(cursor)
+        return float(rank), int(job_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _encode(values):
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
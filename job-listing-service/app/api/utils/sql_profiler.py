@@ -0,0 +1,133 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from flask import current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_current_profile = ContextVar("sql_profile", default=None)
+
+
+class QueryProfile:
+    """
+    Statements executed while serving one request.
+
+    Statements are grouped by their SQL text; bound parameters are not part of
+    the text, so the same statement run for many different rows (the classic
+    N+1 lazy load) shows up as one statement with a high count.
+    """
+
+    def __init__(self, slowest=3, repeat_threshold=5):
+        self.slowest_limit = slowest
+        self.repeat_threshold = repeat_threshold
+        self.count = 0
+        self.total_time = 0.0
+        self.statements = {}
+        self.slowest = []
+
+    def record(self, statement, duration):
+        self.count += 1
+        self.total_time += duration
+        count, total = self.statements.get(statement, (0, 0.0))
+        self.statements[statement] = (count + 1, total + duration)
+        if len(self.slowest) < self.slowest_limit or duration > self.slowest[-1][1]:
+            self.slowest.append((statement, duration))
+            self.slowest.sort(key=lambda item: item[1], reverse=True)
+            del self.slowest[self.slowest_limit:]
+
+    def repeated(self):
+        """Statements executed at least `repeat_threshold` times, most frequent first."""
+        return sorted(
+            ((statement, count, total) for statement, (count, total) in self.statements.items()
+             if count >= self.repeat_threshold),
+            key=lambda item: item[1], reverse=True
+        )
+
+    def headers(self):
+        """Response headers summarising the profile."""
+        headers = {
+            "Server-Timing": f'db;dur={self.total_time * 1000:.2f};desc="{self.count} queries"',
+            "X-DB-Query-Count": str(self.count),
+        }
+        repeated = self.repeated()
+        if repeated:
+            headers["X-DB-Repeated-Queries"] = str(len(repeated))
+        return headers
+
+    def summary(self):
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_time * 1000, 2),
+            "slowest": [
+                {"statement": _shorten(statement), "ms": round(duration * 1000, 2)}
+                for statement, duration in self.slowest
+            ],
+            "repeated": [
+                {"statement": _shorten(statement), "count": count, "ms": round(total * 1000, 2)}
+                for statement, count, total in self.repeated()
+            ],
+        }
+
+
+def init_sql_profiler(app):
+    """
+    Profile the SQL issued by each request when `SQL_PROFILING` is enabled.
+
+    Adds `Server-Timing`, `X-DB-Query-Count` and (when a statement repeats at
+    least `SQL_PROFILING_REPEAT_THRESHOLD` times) `X-DB-Repeated-Queries`
+    headers, and logs one JSON line per request. Requests with repeated
+    statements are logged as warnings.
+    """
+    if not app.config.get("SQL_PROFILING"):
+        return
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    app.teardown_request(_reset_profile)
+
+
+def _start_profile():
+    profile = QueryProfile(current_app.config["SQL_PROFILING_SLOWEST"],
+                           current_app.config["SQL_PROFILING_REPEAT_THRESHOLD"])
+    g.sql_profile_token = _current_profile.set(profile)
+
+
+def _finish_profile(response):
+    profile = _current_profile.get()
+    if profile is None:
+        return response
+    response.headers.update(profile.headers())
+    summary = {"method": request.method, "path": request.path, "status": response.status_code,
+               **profile.summary()}
+    level = logging.WARNING if summary["repeated"] else logging.INFO
+    logger.log(level, f"SQL profile {json.dumps(summary)}")
+    return response
+
+
+def _reset_profile(exc):
+    token = g.pop("sql_profile_token", None)
+    if token is not None:
+        _current_profile.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None:
+        context.profile_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    start = getattr(context, "profile_start", None)
+    if profile is not None and start is not None:
+        profile.record(statement, time.perf_counter() - start)
+
+
+def _shorten(statement, limit=200):
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
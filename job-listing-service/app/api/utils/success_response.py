@@ -1,8 +1,11 @@
-def success_response(status_code, message, data):
-    return {
+def success_response(status_code, message, data, pagination=None):
+    response = {
         "status_code": status_code,
         "success": True,
         "message": message,
         "data": data
-    }, status_code
+    }
+    if pagination is not None:
+        response["pagination"] = pagination
+    return response, status_code
 
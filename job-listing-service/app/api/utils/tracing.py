@@ -0,0 +1,133 @@
+from flask import g, request
+from opentelemetry import context, trace
+from opentelemetry.propagate import extract
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SERVICE_NAME = "job-listing-service"
+
+# Spans are no-ops until init_tracing() installs a provider
+tracer = trace.get_tracer(SERVICE_NAME)
+
+
+def init_tracing(app):
+    """
+    Trace every request and the SQL it runs when `TRACING_EXPORTER` is set.
+
+    Requests continue the trace from an incoming W3C `traceparent` header, so
+    calls from the job apply service show up as children of its spans.
+    `console` prints spans to stdout and `file` appends one JSON span per line
+    to `TRACING_FILE`, for inspecting traces without a collector; `otlp` sends
+    them to the collector named by the standard `OTEL_EXPORTER_OTLP_*` variables.
+
+    Args:
+        app (Flask): Application to instrument.
+
+    Returns:
+        TracerProvider: The installed provider, or None when tracing is disabled.
+    """
+    exporter = _exporter(app.config["TRACING_EXPORTER"], app.config["TRACING_FILE"])
+    if exporter is None:
+        return None
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(app.config["TRACING_SAMPLE_RATIO"])),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    instrument_app(app)
+    return provider
+
+
+def instrument_app(app):
+    """
+    Open a span for every request of `app` and for each SQL statement it runs.
+
+    Args:
+        app (Flask): Application to instrument.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _start_sql_span):
+        event.listen(Engine, "before_cursor_execute", _start_sql_span)
+        event.listen(Engine, "after_cursor_execute", _end_sql_span)
+        event.listen(Engine, "handle_error", _fail_sql_span)
+    app.before_request(_start_request_span)
+    app.after_request(_record_response)
+    app.teardown_request(_end_request_span)
+
+
+def _exporter(name, path):
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return ConsoleSpanExporter(out=open(path, "a"), formatter=lambda span: span.to_json(indent=None) + "\n")
+    if name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise RuntimeError(
+                "TRACING_EXPORTER=otlp requires `pip install opentelemetry-exporter-otlp-proto-http`"
+            ) from e
+        return OTLPSpanExporter()
+    return None
+
+
+def _start_request_span():
+    route = request.url_rule.rule if request.url_rule else request.path
+    span = tracer.start_span(
+        f"{request.method} {route}", context=extract(request.headers), kind=SpanKind.SERVER,
+        attributes={"http.request.method": request.method, "url.path": request.path, "http.route": route},
+    )
+    g.trace_span = span
+    g.trace_token = context.attach(trace.set_span_in_context(span))
+
+
+def _record_response(response):
+    span = g.get("trace_span")
+    if span is not None:
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+    return response
+
+
+def _end_request_span(exc):
+    span = g.pop("trace_span", None)
+    if span is None:
+        return
+    if exc is not None:
+        span.record_exception(exc)
+        span.set_status(Status(StatusCode.ERROR))
+    span.end()
+    context.detach(g.pop("trace_token"))
+
+
+def _start_sql_span(conn, cursor, statement, parameters, context_, executemany):
+    if not trace.get_current_span().is_recording():
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    context_.trace_span = tracer.start_span(
+        operation, kind=SpanKind.CLIENT,
+        attributes={"db.system": conn.dialect.name, "db.statement": statement[:1000]},
+    )
+
+
+def _end_sql_span(conn, cursor, statement, parameters, context_, executemany):
+    span = getattr(context_, "trace_span", None)
+    if span is not None:
+        span.end()
+        context_.trace_span = None
+
+
+def _fail_sql_span(exception_context):
+    span = getattr(exception_context.execution_context, "trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        exception_context.execution_context.trace_span = None
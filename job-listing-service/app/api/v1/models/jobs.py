@@ -1,19 +1,67 @@
 from datetime import datetime
 
+from sqlalchemy import DDL, event
+
 from app.api.db import db
 
 
 class Job(db.Model):
     __tablename__ = 'jobs'
+    __table_args__ = (
+        db.Index('ix_jobs_created_at_id', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    company = db.Column(db.String(255), nullable=False)
-    location = db.Column(db.String(255), nullable=True)
+    company = db.Column(db.String(255), nullable=False, index=True)
+    location = db.Column(db.String(255), nullable=True, index=True)
     salary = db.Column(db.Float, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self):
         return f"<Job {self.title}>"
+
+
+# Full-text search over title and description. Postgres uses a generated,
+# weighted tsvector column with a GIN index; SQLite (local runs and tests) uses
+# an external-content FTS5 table kept in sync by triggers. Existing Postgres
+# databases get the same DDL from the Alembic migration.
+POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE jobs ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_jobs_search_vector ON jobs USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE jobs_fts USING fts5(title, description, content='jobs', content_rowid='id')",
+    """
+    CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_fts_au AFTER UPDATE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(Job.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Job.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(Job.__table__, 'after_drop', DDL("DROP TABLE IF EXISTS jobs_fts").execute_if(dialect='sqlite'))
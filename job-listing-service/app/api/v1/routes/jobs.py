@@ -1,9 +1,13 @@
-from flask import Blueprint, request
+from datetime import datetime
+from flask import Blueprint, Response, request, stream_with_context
 from marshmallow import ValidationError
 import logging
 
+from app.api.utils.conditional import cache_headers, is_not_modified, make_etag, not_modified_response
 from app.api.utils.error_response import error_response
+from app.api.utils.export import to_csv, to_ndjson
 from app.api.utils.success_response import success_response
+from app.api.v1.schemas.jobs import JOB_FIELDS, JobSchema
 from app.api.v1.services.jobs import JobService
 
 bp = Blueprint('jobs', __name__, url_prefix="/api/v1/jobs")
@@ -43,45 +47,380 @@ def create_job():
 @bp.route('', methods=['GET'])
 def list_jobs():
     """
-    List all jobs.
+    List jobs, one page at a time.
 
-    Fetches and returns a list of all available jobs.
+    Returns jobs newest first using keyset pagination. Pass the `next_cursor`
+    from the response's `pagination` block as `cursor` to fetch the next page.
+
+    Responses carry an `ETag` for the page. Clients sending it back in
+    `If-None-Match` get a `304 Not Modified` without a body; while the page is
+    cached this costs no query at all. There is no `Last-Modified`: removing a
+    job from the page does not move any `updated_at` forward, so only the ETag,
+    which covers the job ids, can tell the pages apart.
+
+    When `ids` is given, the listing is replaced by a batch lookup of those jobs
+    (see `batch_get_jobs`).
 
     Args:
-        None
+        ids (str, query): Comma-separated job IDs to fetch in one request.
+        limit (int, query): Maximum number of jobs per page.
+        cursor (str, query): Cursor of the page to fetch.
+        company (str, query): Filter by company.
+        location (str, query): Filter by location.
+        min_salary (float, query): Minimum salary (inclusive).
+        max_salary (float, query): Maximum salary (inclusive).
+        fields (str, query): Comma-separated fields to return, e.g. `id,title,company`.
 
     Returns:
         JSON response:
-            - 200 OK with a list of jobs.
+            - 200 OK with a page of jobs and pagination info.
+            - 304 Not Modified if the client's copy of the page is current.
+            - 400 Bad Request if query parameters are invalid.
             - 500 Internal Server Error for unexpected issues.
     """
+    if request.args.get('ids') is not None:
+        return _batch_get_jobs(request.args.get('ids').split(','))
+
+    params = dict(
+        limit=request.args.get('limit', type=int),
+        cursor=request.args.get('cursor'),
+        company=request.args.get('company'),
+        location=request.args.get('location'),
+        min_salary=request.args.get('min_salary', type=float),
+        max_salary=request.args.get('max_salary', type=float)
+    )
     try:
-        jobs = JobService.get_all_jobs()
-        return success_response(200, "Jobs fetched successfully", jobs)
+        fields = _parse_fields(request.args.get('fields'))
+        jobs, next_cursor, version = JobService.get_all_jobs(**params, fields=fields)
+        etag = make_etag('jobs', version, fields)
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+
+        pagination = {"next_cursor": next_cursor, "has_more": next_cursor is not None}
+        return (*success_response(200, "Jobs fetched successfully", jobs, pagination),
+                cache_headers(etag))
+    except ValueError as e:
+        logger.warning(f"Invalid query while listing jobs: {str(e)}")
+        return error_response(400, str(e))
     except Exception as e:
         logger.critical(f"Unexpected error while listing jobs: {str(e)}")
         return error_response(500, "An unexpected error occurred")
 
 
+@bp.route('/search', methods=['GET'])
+def search_jobs():
+    """
+    Full-text search over job titles and descriptions.
+
+    Results are ranked by relevance and paginated with a cursor. Pass the
+    `next_cursor` from the response's `pagination` block as `cursor` to fetch
+    the next page.
+
+    Args:
+        q (str, query): Search terms.
+        limit (int, query): Maximum number of jobs per page.
+        cursor (str, query): Cursor of the page to fetch.
+
+    Returns:
+        JSON response:
+            - 200 OK with a page of matching jobs and pagination info.
+            - 400 Bad Request if `q` is missing or parameters are invalid.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    try:
+        jobs, next_cursor = JobService.search_jobs(
+            request.args.get('q'),
+            limit=request.args.get('limit', type=int),
+            cursor=request.args.get('cursor')
+        )
+        pagination = {"next_cursor": next_cursor, "has_more": next_cursor is not None}
+        return success_response(200, "Jobs fetched successfully", jobs, pagination)
+    except ValueError as e:
+        logger.warning(f"Invalid search query: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while searching jobs: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+@bp.route('/facets', methods=['GET'])
+def job_facets():
+    """
+    Get facet counts for the job catalog.
+
+    Returns job counts per company and per location and a salary histogram,
+    computed in the database for the jobs matching the optional filters.
+
+    Args:
+        company (str, query): Filter by company.
+        location (str, query): Filter by location.
+        min_salary (float, query): Minimum salary (inclusive).
+        max_salary (float, query): Maximum salary (inclusive).
+
+    Returns:
+        JSON response:
+            - 200 OK with the facet counts.
+            - 400 Bad Request if the filters are invalid.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    try:
+        facets = JobService.get_facets(
+            company=request.args.get('company'),
+            location=request.args.get('location'),
+            min_salary=request.args.get('min_salary', type=float),
+            max_salary=request.args.get('max_salary', type=float)
+        )
+        return success_response(200, "Job facets fetched successfully", facets)
+    except ValueError as e:
+        logger.warning(f"Invalid query while fetching job facets: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while fetching job facets: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+@bp.route('/batch', methods=['POST'])
+def batch_get_jobs():
+    """
+    Fetch several jobs by ID in one request.
+
+    Resolves all IDs with a single database query. Jobs are returned in the
+    order requested and IDs that do not exist are reported in `missing_ids`.
+
+    Args:
+        JSON body (dict): {"ids": [1, 2, 3]}
+
+    Returns:
+        JSON response:
+            - 200 OK with the jobs found and the missing IDs.
+            - 400 Bad Request if the IDs are missing, invalid or too many.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    data = request.get_json(silent=True) or {}
+    ids = data.get('ids')
+    if not isinstance(ids, list):
+        return error_response(400, "ids must be a list of integers")
+    return _batch_get_jobs(ids)
+
+
+def _parse_fields(raw_fields):
+    if raw_fields is None:
+        return None
+    fields = [field.strip() for field in raw_fields.split(',') if field.strip()]
+    unknown = sorted(set(fields) - set(JOB_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # Same projection, same ETag and cache entry, whatever the order or repeats in the query
+    return tuple(name for name in JOB_FIELDS if name in fields) or None
+
+
+def _batch_get_jobs(raw_ids):
+    try:
+        job_ids = [int(job_id) for job_id in raw_ids]
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid job ids in batch request: {raw_ids}")
+        return error_response(400, "ids must be a list of integers")
+
+    try:
+        jobs, missing_ids = JobService.get_jobs_by_ids(job_ids)
+        return success_response(200, "Jobs fetched successfully", {
+            "jobs": jobs,
+            "missing_ids": missing_ids
+        })
+    except ValueError as e:
+        logger.warning(f"Invalid batch job request: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while fetching jobs by id: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+@bp.route('/bulk', methods=['POST'])
+def bulk_create_jobs():
+    """
+    Create many jobs in one request.
+
+    Args:
+        JSON body (list): Job payloads, each validated like `create_job`.
+
+    Returns:
+        JSON response with one result per item:
+            - 201 Created if every job was created.
+            - 207 Multi-Status if some items were invalid or failed.
+            - 400 Bad Request if the body is not a non-empty list or is too large.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return error_response(400, "Request body must be a list of jobs")
+
+    try:
+        results = JobService.bulk_create_jobs(items)
+        return _bulk_response(results, "created", 201, "Jobs created")
+    except ValueError as e:
+        logger.warning(f"Invalid bulk create request: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while bulk creating jobs: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+@bp.route('/bulk', methods=['PATCH'])
+def bulk_update_jobs():
+    """
+    Partially update many jobs in one request.
+
+    Args:
+        JSON body (list): Payloads of the form {"id": 1, "salary": 90000}.
+
+    Returns:
+        JSON response with one result per item:
+            - 200 OK if every job was updated.
+            - 207 Multi-Status if some items were invalid, missing or failed.
+            - 400 Bad Request if the body is not a non-empty list or is too large.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return error_response(400, "Request body must be a list of job updates")
+
+    try:
+        results = JobService.bulk_update_jobs(items)
+        return _bulk_response(results, "updated", 200, "Jobs updated")
+    except ValueError as e:
+        logger.warning(f"Invalid bulk update request: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while bulk updating jobs: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+@bp.route('/bulk', methods=['DELETE'])
+def bulk_delete_jobs():
+    """
+    Delete many jobs by ID in one request.
+
+    Args:
+        JSON body (dict): {"ids": [1, 2, 3]}
+
+    Returns:
+        JSON response with one result per ID:
+            - 200 OK if every job was deleted.
+            - 207 Multi-Status if some IDs were not found or failed.
+            - 400 Bad Request if the IDs are missing, invalid or too many.
+            - 500 Internal Server Error for unexpected issues.
+    """
+    data = request.get_json(silent=True) or {}
+    ids = data.get('ids')
+    # bool is a subclass of int, but `true` is not a job id
+    if not isinstance(ids, list) or not all(
+            isinstance(job_id, int) and not isinstance(job_id, bool) for job_id in ids):
+        return error_response(400, "ids must be a list of integers")
+
+    try:
+        results = JobService.bulk_delete_jobs(ids)
+        return _bulk_response(results, "deleted", 200, "Jobs deleted")
+    except ValueError as e:
+        logger.warning(f"Invalid bulk delete request: {str(e)}")
+        return error_response(400, str(e))
+    except Exception as e:
+        logger.critical(f"Unexpected error while bulk deleting jobs: {str(e)}")
+        return error_response(500, "An unexpected error occurred")
+
+
+def _bulk_response(results, success_status, status_code, message):
+    succeeded = sum(1 for result in results if result["status"] == success_status)
+    failed = len(results) - succeeded
+    if failed:
+        status_code = 207
+    return success_response(status_code, f"{message}: {succeeded} succeeded, {failed} failed", {
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results
+    })
+
+
+@bp.route('/export', methods=['GET'])
+def export_jobs():
+    """
+    Stream the full job catalog as NDJSON or CSV.
+
+    Rows are streamed as they are read from the database, so the response
+    uses constant memory regardless of catalog size.
+
+    Args:
+        format (str, query): "ndjson" (default) or "csv".
+        since (str, query): ISO 8601 timestamp; only jobs updated after it are exported.
+
+    Returns:
+        Streaming response:
+            - 200 OK with one job per line.
+            - 400 Bad Request if the format or timestamp is invalid.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        return error_response(400, "format must be one of: ndjson, csv")
+
+    since = request.args.get('since')
+    if since is not None:
+        try:
+            since = datetime.fromisoformat(since)
+        except ValueError:
+            return error_response(400, "since must be an ISO 8601 timestamp")
+
+    jobs = JobService.export_jobs(since)
+    if export_format == 'csv':
+        body = to_csv(jobs, list(JobSchema().dump_fields))
+        mimetype = 'text/csv'
+    else:
+        body = to_ndjson(jobs)
+        mimetype = 'application/x-ndjson'
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=jobs.{export_format}'}
+    )
+
+
 @bp.route('/<int:job_id>', methods=['GET'])
 def get_job(job_id):
     """
     Get a specific job by ID.
 
-    Fetches a single job using its unique identifier.
+    Fetches a single job using its unique identifier. Responses carry an `ETag`
+    and `Last-Modified` derived from the job's `updated_at`, and conditional
+    requests for an unchanged job get a `304 Not Modified` with no body.
 
     Args:
         job_id (int): The unique ID of the job to retrieve.
+        fields (str, query): Comma-separated fields to return, e.g. `id,title,company`.
 
     Returns:
         JSON response:
             - 200 OK with the job data.
+            - 304 Not Modified if the client's copy is current.
+            - 400 Bad Request if `fields` names an unknown field.
             - 404 Not Found if the job does not exist.
             - 500 Internal Server Error for unexpected issues.
     """
     try:
-        job = JobService.get_job(job_id)
-        return success_response(200, "Job fetched successfully", job)
+        fields = _parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        logger.warning(f"Invalid fields while fetching job: {str(e)}")
+        return error_response(400, str(e))
+
+    def is_current(version, last_modified):
+        return is_not_modified(make_etag('job', version, fields), last_modified)
+
+    try:
+        job, version, last_modified = JobService.get_job_if_modified(job_id, is_current, fields=fields)
+        etag = make_etag('job', version, fields)
+        if job is None:
+            return not_modified_response(etag, last_modified)
+
+        return (*success_response(200, "Job fetched successfully", job),
+                cache_headers(etag, last_modified))
     except ValueError as e:
         logger.warning(f"Job not found: {str(e)}")
         return error_response(404, str(e))
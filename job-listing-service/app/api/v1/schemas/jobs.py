@@ -1,5 +1,9 @@
+from functools import lru_cache
+
 from marshmallow import Schema, fields
 
+from app.api.utils.serializer import compile_serializer
+
 class JobSchema(Schema):
     id = fields.Int(dump_only=True)
     title = fields.Str(required=True)
@@ -7,5 +11,34 @@ class JobSchema(Schema):
     company = fields.Str(required=True)
     location = fields.Str(required=True)
     salary = fields.Float()
-    date_created = fields.DateTime(dump_only=True)
-    date_updated = fields.DateTime(dump_only=True)
+    date_created = fields.DateTime(dump_only=True, attribute="created_at")
+    date_updated = fields.DateTime(dump_only=True, attribute="updated_at")
+
+
+# Output-compatible with `JobSchema().dump`, without per-field dispatch. Used on
+# read paths; `JobSchema` stays responsible for validating input.
+dump_job = compile_serializer(JobSchema())
+
+
+# Output field names in schema order, and the model attribute behind each one
+JOB_FIELDS = tuple(JobSchema().dump_fields)
+JOB_FIELD_ATTRIBUTES = {
+    name: field.attribute or name for name, field in JobSchema().dump_fields.items()
+}
+
+
+@lru_cache(maxsize=None)
+def job_serializer(only=None):
+    """
+    Return the compiled serializer for a field projection.
+
+    Args:
+        only (tuple, optional): Field names in `JOB_FIELDS` order. None means
+            every field.
+
+    Returns:
+        callable: Serializer equivalent to `JobSchema(only=only).dump`.
+    """
+    if only is None:
+        return dump_job
+    return compile_serializer(JobSchema(only=only))
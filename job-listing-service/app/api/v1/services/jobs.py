@@ -1,10 +1,20 @@
 import logging
+from datetime import datetime
+
+from sqlalchemy import (
+    Float, Integer, and_, cast, column, delete, func, insert, literal_column, or_, select, table, update
+)
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
 from marshmallow import ValidationError
 
+from app.api.cache.responses import create_response_cache
 from app.api.db import db
+from app.api.db.replica import read_replica, used_replica
+from app.api.utils.pagination import decode_cursor, decode_rank_cursor, encode_cursor, encode_rank_cursor
 from app.api.v1.models.jobs import Job
-from app.api.v1.schemas.jobs import JobSchema
+from app.api.v1.schemas.jobs import JOB_FIELD_ATTRIBUTES, JOB_FIELDS, JobSchema, dump_job, job_serializer
+from config import config
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +22,8 @@ logging.basicConfig(level=logging.INFO)
 job_schema = JobSchema()
 jobs_schema = JobSchema(many=True)
 
+response_cache = create_response_cache()
+
 class JobService:
     """
     Service class for managing job-related operations including creation,
@@ -39,7 +51,8 @@ class JobService:
             db.session.add(job)
             db.session.commit()
             logger.info(f"Created job with ID {job.id}")
-            return job_schema.dump(job)
+            response_cache.invalidate_lists()
+            return JobService._cache_job(job)
         except ValidationError as ve:
             logger.error(f"Validation error while creating job: {ve.messages}")
             raise
@@ -49,44 +62,319 @@ class JobService:
             raise Exception("Failed to create job")
 
     @staticmethod
-    def get_all_jobs():
+    @read_replica()
+    def get_all_jobs(limit=None, cursor=None, company=None, location=None,
+                     min_salary=None, max_salary=None, fields=None):
         """
-        Retrieve all job entries from the database.
+        Retrieve a page of job entries using keyset pagination on (created_at, id).
+
+        Jobs are returned newest first. Filters and the page boundary are applied
+        in SQL so only `limit` rows are loaded regardless of table size. The
+        page's version is computed from the same rows and cached with it, so
+        pages (and their validators) are served from the response cache until
+        a job is written. The version changes whenever a job on the page (or
+        the first job of the next page) is added, updated or removed.
+
+        Args:
+            limit (int, optional): Maximum number of jobs to return. Defaults to
+                `JOBS_DEFAULT_PAGE_SIZE` and is capped at `JOBS_MAX_PAGE_SIZE`.
+            cursor (str, optional): Cursor returned with the previous page.
+            company (str, optional): Only return jobs from this company.
+            location (str, optional): Only return jobs in this location.
+            min_salary (float, optional): Lower salary bound (inclusive).
+            max_salary (float, optional): Upper salary bound (inclusive).
+            fields (list, optional): Only select and return these fields.
 
         Returns:
-            list: A list of serialized job data.
+            tuple: (list of serialized job data, next page cursor or None,
+            version string).
 
         Raises:
+            ValueError: If the pagination, filter or field parameters are invalid.
             Exception: If a database error occurs while retrieving jobs.
         """
+        limit = JobService._page_size(limit)
+        fields = JobService._projection(fields)
+        params = dict(limit=limit, cursor=cursor, company=company, location=location,
+                      min_salary=min_salary, max_salary=max_salary, fields=fields)
+        cached, generation = response_cache.get_list("jobs", params)
+        if cached is not None:
+            return cached["jobs"], cached["next_cursor"], cached["version"]
+
+        query = JobService._page_query(limit, cursor, company, location, min_salary, max_salary)
+        if fields is not None:
+            query = query.options(JobService._load_only(fields))
         try:
-            jobs = Job.query.all()
-            logger.info(f"Retrieved {len(jobs)} jobs")
-            return jobs_schema.dump(jobs)
+            jobs = query.all()
         except SQLAlchemyError as e:
             logger.error(f"Database error while retrieving jobs: {str(e)}")
             raise Exception("Failed to fetch jobs")
 
+        # The extra row is part of the version so a change to the next page's first job shows up
+        version = ";".join(JobService._version(job.id, job.updated_at) for job in jobs)
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id)
+        logger.info(f"Retrieved {len(jobs)} jobs")
+        serialize = job_serializer(fields)
+        data = [serialize(job) for job in jobs]
+        response_cache.set_list("jobs", params, {
+            "jobs": data, "next_cursor": next_cursor, "version": version,
+        }, generation, ttl=JobService._fill_ttl(response_cache.ttl))
+        return data, next_cursor, version
+
+    @staticmethod
+    @read_replica()
+    def search_jobs(q, limit=None, cursor=None):
+        """
+        Full-text search over job title and description, best matches first.
+
+        Uses the GIN-indexed `search_vector` column on Postgres and the FTS5
+        `jobs_fts` table on SQLite. Title matches rank above description matches.
+        Results are keyset-paginated on (rank, id).
+
+        Args:
+            q (str): Search terms. On Postgres, web search syntax is supported
+                (quoted phrases, `or`, `-excluded`).
+            limit (int, optional): Maximum number of jobs to return.
+            cursor (str, optional): Cursor returned with the previous page.
+
+        Returns:
+            tuple: (list of serialized job data, next page cursor or None).
+
+        Raises:
+            ValueError: If the query, limit or cursor is invalid.
+            Exception: If a database error occurs while searching.
+        """
+        terms = (q or "").split()
+        if not terms:
+            raise ValueError("q is required")
+        limit = JobService._page_size(limit)
+
+        ranked = JobService._ranked_matches(db.session.get_bind().dialect.name, q, terms).subquery()
+
+        query = db.session.query(Job, ranked.c.rank).join(ranked, ranked.c.id == Job.id)
+        if cursor:
+            last_rank, last_id = decode_rank_cursor(cursor)
+            query = query.filter(or_(
+                ranked.c.rank < last_rank,
+                and_(ranked.c.rank == last_rank, Job.id < last_id)
+            ))
+
+        try:
+            rows = query.order_by(ranked.c.rank.desc(), Job.id.desc()).limit(limit + 1).all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last_job, last_rank = rows[-1]
+                next_cursor = encode_rank_cursor(last_rank, last_job.id)
+            logger.info(f"Search matched {len(rows)} jobs")
+            return [dump_job(job) for job, _ in rows], next_cursor
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while searching jobs: {str(e)}")
+            raise Exception("Failed to search jobs")
+
+    @staticmethod
+    @read_replica()
+    def get_facets(company=None, location=None, min_salary=None, max_salary=None):
+        """
+        Compute facet counts for the jobs matching the given filters.
+
+        Counts per company and location (top `JOBS_FACETS_LIMIT` values each) and
+        a salary histogram with `JOBS_SALARY_BUCKET_SIZE`-wide buckets are grouped
+        in SQL. Results are cached for `JOBS_FACETS_CACHE_TTL` seconds and
+        invalidated whenever jobs are created, updated or deleted.
+
+        Args:
+            company (str, optional): Only count jobs from this company.
+            location (str, optional): Only count jobs in this location.
+            min_salary (float, optional): Lower salary bound (inclusive).
+            max_salary (float, optional): Upper salary bound (inclusive).
+
+        Returns:
+            dict: Total count plus `companies`, `locations` and `salaries` buckets.
+
+        Raises:
+            ValueError: If the filter parameters are invalid.
+            Exception: If a database error occurs while aggregating.
+        """
+        params = dict(company=company, location=location, min_salary=min_salary, max_salary=max_salary)
+        facets, generation = response_cache.get_list("facets", params)
+        if facets is not None:
+            return facets
+
+        def grouped(column_, *where):
+            query = JobService._apply_filters(
+                select(column_, func.count()).where(*where), company, location, min_salary, max_salary
+            )
+            return db.session.execute(
+                query.group_by(column_).order_by(func.count().desc(), column_).limit(config.JOBS_FACETS_LIMIT)
+            ).all()
+
+        bucket_size = config.JOBS_SALARY_BUCKET_SIZE
+        bucket = JobService._salary_bucket(bucket_size).label('bucket')
+        try:
+            total = db.session.execute(JobService._apply_filters(
+                select(func.count()).select_from(Job), company, location, min_salary, max_salary
+            )).scalar_one()
+            companies = grouped(Job.company)
+            locations = grouped(Job.location, Job.location.isnot(None))
+            salaries = db.session.execute(JobService._apply_filters(
+                select(bucket, func.count()).where(Job.salary.isnot(None)),
+                company, location, min_salary, max_salary
+            ).group_by(bucket).order_by(bucket)).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while computing job facets: {str(e)}")
+            raise Exception("Failed to compute job facets")
+
+        facets = {
+            "total": total,
+            "companies": [{"value": value, "count": count} for value, count in companies],
+            "locations": [{"value": value, "count": count} for value, count in locations],
+            "salaries": [
+                {"min": index * bucket_size, "max": (index + 1) * bucket_size, "count": count}
+                for index, count in salaries
+            ],
+        }
+        response_cache.set_list("facets", params, facets, generation,
+                                ttl=JobService._fill_ttl(config.JOBS_FACETS_CACHE_TTL))
+        return facets
+
     @staticmethod
-    def get_job(job_id):
+    def get_job(job_id, fields=None):
         """
         Retrieve a single job entry by its ID.
 
+        Serialized jobs are kept in the response cache and refreshed whenever
+        the job is written through this service. With `fields`, a cached job is
+        projected; otherwise only those columns are selected.
+
         Args:
             job_id (int): ID of the job to retrieve.
+            fields (list, optional): Only select and return these fields.
 
         Returns:
             dict: Serialized job data.
 
         Raises:
-            ValueError: If no job with the specified ID exists.
+            ValueError: If no job with the specified ID exists or a field is unknown.
         """
-        job = Job.query.get(job_id)
+        return JobService.get_job_if_modified(job_id, fields=fields)[0]
+
+    @staticmethod
+    @read_replica()
+    def get_job_if_modified(job_id, is_current=None, fields=None):
+        """
+        Retrieve a single job and its version with at most one query.
+
+        The version comes from the cached entry or from the loaded row, so a
+        conditional request costs no extra round trip. When the client's copy
+        is current the job is not serialized.
+
+        Args:
+            job_id (int): ID of the job to retrieve.
+            is_current (callable, optional): Called with the job's version and
+                `updated_at`; returns True if the client already has that version.
+            fields (list, optional): Only select and return these fields.
+
+        Returns:
+            tuple: (serialized job data, or None if `is_current` returned True;
+            version string; `updated_at` of the job or None).
+
+        Raises:
+            ValueError: If no job with the specified ID exists or a field is unknown.
+        """
+        fields = JobService._projection(fields)
+        cached = response_cache.get_job(job_id)
+        if cached is not None:
+            version, updated_at = cached["version"], JobService._parse_timestamp(cached["updated_at"])
+            if is_current is not None and is_current(version, updated_at):
+                return None, version, updated_at
+            data = cached["data"]
+            return (data if fields is None else {name: data[name] for name in fields}), version, updated_at
+
+        # Captured before the read so a write racing with it keeps this job out of the cache
+        generation = response_cache.generation()
+        options = [] if fields is None else [JobService._load_only(fields)]
+        job = db.session.get(Job, job_id, options=options)
         if not job:
             logger.warning(f"Job ID {job_id} not found")
             raise ValueError("Job not found")
         logger.info(f"Retrieved job with ID {job_id}")
-        return job_schema.dump(job)
+        version = JobService._version(job.id, job.updated_at)
+        if is_current is not None and is_current(version, job.updated_at):
+            return None, version, job.updated_at
+        if fields is not None:
+            return job_serializer(fields)(job), version, job.updated_at
+        entry = JobService._cache_entry(job)
+        response_cache.fill_job(job_id, entry, generation, ttl=JobService._fill_ttl(response_cache.ttl))
+        return entry["data"], version, job.updated_at
+
+    @staticmethod
+    @read_replica()
+    def get_jobs_by_ids(job_ids):
+        """
+        Retrieve several jobs by ID with a single `IN` query.
+
+        Args:
+            job_ids (list): IDs of the jobs to retrieve. Duplicates are ignored.
+
+        Returns:
+            tuple: (serialized jobs in the order requested, list of IDs not found).
+
+        Raises:
+            ValueError: If no IDs or more than `JOBS_BATCH_MAX_IDS` IDs are given.
+            Exception: If a database error occurs while retrieving jobs.
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids:
+            raise ValueError("At least one job id is required")
+        if len(job_ids) > config.JOBS_BATCH_MAX_IDS:
+            raise ValueError(f"A maximum of {config.JOBS_BATCH_MAX_IDS} job ids can be requested at once")
+
+        try:
+            jobs_by_id = {job.id: job for job in Job.query.filter(Job.id.in_(job_ids)).all()}
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while retrieving jobs by id: {str(e)}")
+            raise Exception("Failed to fetch jobs")
+
+        found = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+        missing = [job_id for job_id in job_ids if job_id not in jobs_by_id]
+        logger.info(f"Retrieved {len(found)} of {len(job_ids)} requested jobs")
+        return [dump_job(job) for job in found], missing
+
+    @staticmethod
+    def export_jobs(since=None):
+        """
+        Stream every job, optionally only those updated after `since`.
+
+        Rows are read through a server-side cursor in batches of
+        `JOBS_EXPORT_BATCH_SIZE` and are plain rows rather than ORM objects, so
+        memory stays constant however large the catalog is.
+
+        Args:
+            since (datetime, optional): Only export jobs with `updated_at > since`.
+
+        Yields:
+            dict: Serialized job data, ordered by ID.
+        """
+        query = select(*Job.__table__.columns).order_by(Job.id)
+        if since is not None:
+            query = query.where(Job.updated_at > since)
+
+        with read_replica():
+            result = db.session.execute(
+                query.execution_options(stream_results=True, yield_per=config.JOBS_EXPORT_BATCH_SIZE)
+            )
+        exported = 0
+        try:
+            for row in result:
+                exported += 1
+                yield dump_job(row)
+        finally:
+            result.close()
+            logger.info(f"Exported {exported} jobs")
 
     @staticmethod
     def update_job(job_id, data):
@@ -116,7 +404,10 @@ class JobService:
                 setattr(job, key, value)
             db.session.commit()
             logger.info(f"Updated job with ID {job_id}")
-            return job_schema.dump(job)
+            # Not written through: a concurrent update or delete could land first and be overwritten.
+            # The next read fills the cache through `fill_job`, which checks for such races.
+            response_cache.invalidate_jobs(job_id)
+            return dump_job(job)
         except ValidationError as ve:
             logger.error(f"Validation error while updating job: {ve.messages}")
             raise
@@ -145,8 +436,283 @@ class JobService:
         try:
             db.session.delete(job)
             db.session.commit()
+            response_cache.invalidate_jobs(job_id)
             logger.info(f"Deleted job with ID {job_id}")
         except SQLAlchemyError as e:
             db.session.rollback()
             logger.error(f"Database error while deleting job: {str(e)}")
             raise Exception("Failed to delete job")
+
+    @staticmethod
+    def bulk_create_jobs(items):
+        """
+        Create many jobs at once.
+
+        Items are validated with `JobSchema(many=True)`; valid items are written
+        with multi-row INSERT statements, one transaction per
+        `JOBS_BULK_CHUNK_SIZE` rows. A failed chunk is rolled back without
+        affecting the others.
+
+        Args:
+            items (list): Job payloads to create.
+
+        Returns:
+            list: One result per item, in input order, with `index`, `status`
+            ("created", "invalid" or "failed") and the new `id` or `errors`.
+
+        Raises:
+            ValueError: If `items` is empty or exceeds `JOBS_BULK_MAX_ITEMS`.
+        """
+        JobService._check_bulk_size(items)
+        results = [None] * len(items)
+
+        try:
+            valid = list(enumerate(jobs_schema.load(items)))
+        except ValidationError:
+            # Validate item by item so every error is reported against its own index
+            valid = []
+            for index, item in enumerate(items):
+                try:
+                    valid.append((index, job_schema.load(item)))
+                except ValidationError as ve:
+                    errors = ve.messages if isinstance(ve.messages, dict) else {"_schema": ["Invalid job."]}
+                    results[index] = {"index": index, "status": "invalid", "errors": errors}
+
+        for chunk in JobService._chunks(valid):
+            try:
+                ids = db.session.scalars(
+                    insert(Job).returning(Job.id, sort_by_parameter_order=True),
+                    [job_data for _, job_data in chunk]
+                ).all()
+                db.session.commit()
+                response_cache.invalidate_lists()
+                for (index, _), job_id in zip(chunk, ids):
+                    results[index] = {"index": index, "status": "created", "id": job_id}
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                logger.error(f"Database error while bulk creating jobs: {str(e)}")
+                for index, _ in chunk:
+                    results[index] = {"index": index, "status": "failed", "errors": "Failed to create job"}
+
+        logger.info(f"Bulk created {JobService._count(results, 'created')} of {len(items)} jobs")
+        return results
+
+    @staticmethod
+    def bulk_update_jobs(items):
+        """
+        Partially update many jobs at once.
+
+        Each item must contain the job `id` plus the fields to change. Existing
+        IDs are looked up once per chunk and updated with a single executemany
+        UPDATE inside that chunk's transaction.
+
+        Args:
+            items (list): Payloads of the form {"id": 1, "salary": 90000, ...}.
+
+        Returns:
+            list: One result per item, in input order, with `index`, `id`,
+            `status` ("updated", "invalid", "not_found" or "failed") and `errors`.
+
+        Raises:
+            ValueError: If `items` is empty or exceeds `JOBS_BULK_MAX_ITEMS`.
+        """
+        JobService._check_bulk_size(items)
+        results = [None] * len(items)
+        valid = []
+
+        for index, item in enumerate(items):
+            job_id = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(job_id, int) or isinstance(job_id, bool):
+                results[index] = {"index": index, "status": "invalid", "errors": {"id": ["Missing or invalid id."]}}
+                continue
+            fields = {key: value for key, value in item.items() if key != "id"}
+            try:
+                job_data = job_schema.load(fields, partial=True)
+            except ValidationError as ve:
+                errors = ve.messages if isinstance(ve.messages, dict) else {"_schema": ["Invalid job."]}
+                results[index] = {"index": index, "id": job_id, "status": "invalid", "errors": errors}
+                continue
+            valid.append((index, {"id": job_id, **job_data}))
+
+        for chunk in JobService._chunks(valid):
+            try:
+                chunk_ids = [row["id"] for _, row in chunk]
+                existing = set(db.session.scalars(select(Job.id).where(Job.id.in_(chunk_ids))).all())
+                rows = [{**row, "updated_at": datetime.utcnow()} for _, row in chunk if row["id"] in existing]
+                if rows:
+                    db.session.execute(update(Job), rows)
+                db.session.commit()
+                response_cache.invalidate_jobs(*existing)
+                for index, row in chunk:
+                    status = "updated" if row["id"] in existing else "not_found"
+                    results[index] = {"index": index, "id": row["id"], "status": status}
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                logger.error(f"Database error while bulk updating jobs: {str(e)}")
+                for index, row in chunk:
+                    results[index] = {"index": index, "id": row["id"], "status": "failed",
+                                      "errors": "Failed to update job"}
+
+        logger.info(f"Bulk updated {JobService._count(results, 'updated')} of {len(items)} jobs")
+        return results
+
+    @staticmethod
+    def bulk_delete_jobs(job_ids):
+        """
+        Delete many jobs by ID, one `DELETE ... WHERE id IN (...)` per chunk.
+
+        Args:
+            job_ids (list): IDs of the jobs to delete.
+
+        Returns:
+            list: One result per ID, in input order, with `index`, `id` and
+            `status` ("deleted", "not_found" or "failed").
+
+        Raises:
+            ValueError: If `job_ids` is empty or exceeds `JOBS_BULK_MAX_ITEMS`.
+        """
+        JobService._check_bulk_size(job_ids)
+        results = [None] * len(job_ids)
+
+        for chunk in JobService._chunks(list(enumerate(job_ids))):
+            try:
+                deleted = set(db.session.scalars(
+                    delete(Job).where(Job.id.in_([job_id for _, job_id in chunk])).returning(Job.id)
+                ).all())
+                db.session.commit()
+                response_cache.invalidate_jobs(*deleted)
+                for index, job_id in chunk:
+                    status = "deleted" if job_id in deleted else "not_found"
+                    results[index] = {"index": index, "id": job_id, "status": status}
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                logger.error(f"Database error while bulk deleting jobs: {str(e)}")
+                for index, job_id in chunk:
+                    results[index] = {"index": index, "id": job_id, "status": "failed",
+                                      "errors": "Failed to delete job"}
+
+        logger.info(f"Bulk deleted {JobService._count(results, 'deleted')} of {len(job_ids)} jobs")
+        return results
+
+    @staticmethod
+    def _apply_filters(query, company, location, min_salary, max_salary):
+        if min_salary is not None and max_salary is not None and min_salary > max_salary:
+            raise ValueError("min_salary cannot be greater than max_salary")
+        if company:
+            query = query.filter(Job.company == company)
+        if location:
+            query = query.filter(Job.location == location)
+        if min_salary is not None:
+            query = query.filter(Job.salary >= min_salary)
+        if max_salary is not None:
+            query = query.filter(Job.salary <= max_salary)
+        return query
+
+    @staticmethod
+    def _salary_bucket(bucket_size):
+        # Casting to integer truncates on SQLite but rounds on Postgres; floor first so a
+        # 95k salary lands in the 90k-100k bucket everywhere
+        return cast(func.floor(Job.salary / bucket_size), Integer)
+
+    @staticmethod
+    def _ranked_matches(dialect_name, q, terms):
+        if dialect_name == 'postgresql':
+            tsquery = func.websearch_to_tsquery('english', q)
+            vector = literal_column('jobs.search_vector')
+            # ts_rank returns real; compare and hand out cursors in double precision so the
+            # rank in a cursor equals the one the next page's `rank < :last_rank` sees
+            return select(
+                Job.id.label('id'),
+                cast(func.ts_rank(vector, tsquery), Float(53)).label('rank')
+            ).where(vector.op('@@')(tsquery))
+
+        fts = table('jobs_fts', column('rowid'))
+        match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        return select(
+            fts.c.rowid.label('id'),
+            (-func.bm25(literal_column('jobs_fts'), 10.0, 1.0)).label('rank')
+        ).select_from(fts).where(literal_column('jobs_fts').op('MATCH')(match))
+
+    @staticmethod
+    def _projection(fields):
+        if not fields:
+            return None
+        unknown = sorted(set(fields) - set(JOB_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return tuple(name for name in JOB_FIELDS if name in fields)
+
+    @staticmethod
+    def _load_only(fields):
+        # id, created_at and updated_at are always needed for identity, the page cursor and the version
+        attributes = {'id', 'created_at', 'updated_at'} | {JOB_FIELD_ATTRIBUTES[name] for name in fields}
+        return load_only(*(getattr(Job, attribute) for attribute in sorted(attributes)))
+
+    @staticmethod
+    def _page_query(limit, cursor, company, location, min_salary, max_salary):
+        query = JobService._apply_filters(Job.query, company, location, min_salary, max_salary)
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                Job.created_at < created_at,
+                and_(Job.created_at == created_at, Job.id < last_id)
+            ))
+        # Fetch one extra row to know whether another page exists
+        return query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1)
+
+    @staticmethod
+    def _cache_job(job):
+        entry = JobService._cache_entry(job)
+        response_cache.set_job(job.id, entry)
+        return entry["data"]
+
+    @staticmethod
+    def _cache_entry(job):
+        return {
+            "data": dump_job(job),
+            "version": JobService._version(job.id, job.updated_at),
+            "updated_at": JobService._timestamp(job.updated_at),
+        }
+
+    @staticmethod
+    def _version(job_id, updated_at):
+        return f"{job_id}:{JobService._timestamp(updated_at)}"
+
+    @staticmethod
+    def _fill_ttl(ttl):
+        # A replica read may predate a write whose invalidation already ran, so it
+        # is only cached for as long as the replica is allowed to lag anyway
+        return min(ttl, config.DB_REPLICA_MAX_LAG) if used_replica() else ttl
+
+    @staticmethod
+    def _timestamp(value):
+        return value.isoformat() if value else ""
+
+    @staticmethod
+    def _parse_timestamp(value):
+        return datetime.fromisoformat(value) if value else None
+
+    @staticmethod
+    def _page_size(limit):
+        if limit is None:
+            return config.JOBS_DEFAULT_PAGE_SIZE
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        return min(limit, config.JOBS_MAX_PAGE_SIZE)
+
+    @staticmethod
+    def _check_bulk_size(items):
+        if not items:
+            raise ValueError("At least one item is required")
+        if len(items) > config.JOBS_BULK_MAX_ITEMS:
+            raise ValueError(f"A maximum of {config.JOBS_BULK_MAX_ITEMS} items can be processed at once")
+
+    @staticmethod
+    def _chunks(rows):
+        size = config.JOBS_BULK_CHUNK_SIZE
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+    @staticmethod
+    def _count(results, status):
+        return sum(1 for result in results if result["status"] == status)
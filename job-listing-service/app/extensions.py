@@ -1,7 +1,9 @@
+from flask_compress import Compress
 from flask_mail import Mail
 from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
 
+compress = Compress()
 mail = Mail()
 ma = Marshmallow()
 migrate = Migrate()
\ No newline at end of file
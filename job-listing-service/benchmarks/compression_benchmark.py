@@ -0,0 +1,65 @@
+"""
+Measure bytes saved vs CPU time for gzip and brotli on job listing payloads.
+
+Encodes listing envelopes of various page sizes with orjson, then compresses
+them at the levels the services can be configured with:
+
+    python -m benchmarks.compression_benchmark --jobs 20 100 1000
+"""
+import argparse
+import gzip
+import time
+
+import brotli
+import orjson
+
+from benchmarks.serializer_benchmark import make_jobs
+from app.api.v1.schemas.jobs import dump_job
+
+
+CODECS = [
+    ("gzip-1", lambda body: gzip.compress(body, compresslevel=1)),
+    ("gzip-6", lambda body: gzip.compress(body, compresslevel=6)),
+    ("gzip-9", lambda body: gzip.compress(body, compresslevel=9)),
+    ("br-1", lambda body: brotli.compress(body, quality=1)),
+    ("br-4", lambda body: brotli.compress(body, quality=4)),
+    ("br-11", lambda body: brotli.compress(body, quality=11)),
+]
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>6} {'codec':>7} {'bytes':>10} {'saved':>7} {'time':>9} {'MB/s':>7}")
+    for count in args.jobs:
+        envelope = {
+            "status_code": 200,
+            "success": True,
+            "message": "Jobs fetched successfully",
+            "data": [dump_job(job) for job in make_jobs(count)],
+            "pagination": {"next_cursor": None, "has_more": False},
+        }
+        body = orjson.dumps(envelope)
+        print(f"{count:>6} {'none':>7} {len(body):>10} {'':>7} {'':>9} {'':>7}")
+        for name, compress in CODECS:
+            size = len(compress(body))
+            elapsed = best_of(args.repeat, lambda: compress(body))
+            saved = 1 - size / len(body)
+            print(f"{count:>6} {name:>7} {size:>10} {saved:>6.1%} {elapsed * 1000:>7.2f}ms "
+                  f"{len(body) / elapsed / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare JobSchema.dump + json with the compiled serializer + orjson.
+
+Builds transient `Job` objects in memory, so no database is needed:
+
+    python -m benchmarks.serializer_benchmark --rows 10000 100000
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+import orjson
+
+from app.api.v1.models.jobs import Job
+from app.api.v1.schemas.jobs import JobSchema, dump_job
+
+
+def make_jobs(count):
+    base = datetime(2025, 1, 1)
+    return [
+        Job(
+            id=i,
+            title=f"Engineer {i}",
+            description="Build and run the job listing platform",
+            company=f"Company {i % 50}",
+            location="Remote" if i % 3 else "New York",
+            salary=50000 + i % 100 * 1000,
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs_schema = JobSchema(many=True)
+    print(f"{'rows':>8} {'marshmallow+json':>18} {'compiled+orjson':>17} {'speedup':>8}")
+    for count in args.rows:
+        jobs = make_jobs(count)
+        assert [dump_job(job) for job in jobs[:100]] == jobs_schema.dump(jobs[:100])
+
+        baseline = best_of(args.repeat, lambda: json.dumps(jobs_schema.dump(jobs)))
+        fast = best_of(args.repeat, lambda: orjson.dumps([dump_job(job) for job in jobs]))
+        print(f"{count:>8} {baseline * 1000:>16.1f}ms {fast * 1000:>15.1f}ms {baseline / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
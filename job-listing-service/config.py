@@ -22,6 +22,74 @@ class Config:
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool per worker process; pre-ping replaces connections dropped by a Postgres restart.
+    # Set DB_PGBOUNCER when connecting through PgBouncer in transaction mode to let it do the pooling.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() in ("true", "1", "yes")
+    DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "False").lower() in ("true", "1", "yes")
+
+    # Optional read replica for job reads. Reads fall back to the primary while the replica
+    # is more than DB_REPLICA_MAX_LAG seconds behind, and a client that wrote within
+    # DB_READ_YOUR_WRITES_WINDOW seconds keeps reading from the primary. Response cache entries
+    # filled from replica reads expire after at most DB_REPLICA_MAX_LAG seconds.
+    DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST", "")
+    DB_REPLICA_PORT = os.getenv("DB_REPLICA_PORT", DB_PORT)
+    SQLALCHEMY_REPLICA_URI = (
+        f"{DB_TYPE}://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_REPLICA_HOST}:{DB_REPLICA_PORT}/{POSTGRES_DB}"
+        if DB_REPLICA_HOST else None
+    )
+    DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", 5))
+    DB_REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", 5))
+    DB_READ_YOUR_WRITES_WINDOW = float(os.getenv("DB_READ_YOUR_WRITES_WINDOW", 10))
+
+    # Keyset pagination for job listings
+    JOBS_DEFAULT_PAGE_SIZE = int(os.getenv("JOBS_DEFAULT_PAGE_SIZE", 20))
+    JOBS_MAX_PAGE_SIZE = int(os.getenv("JOBS_MAX_PAGE_SIZE", 100))
+
+    # Maximum number of ids accepted by a batch job lookup
+    JOBS_BATCH_MAX_IDS = int(os.getenv("JOBS_BATCH_MAX_IDS", 100))
+
+    # Bulk create/update/delete: items per request and rows per transaction
+    JOBS_BULK_MAX_ITEMS = int(os.getenv("JOBS_BULK_MAX_ITEMS", 10000))
+    JOBS_BULK_CHUNK_SIZE = int(os.getenv("JOBS_BULK_CHUNK_SIZE", 1000))
+
+    # Read cache for jobs, pages and facets ("memory" per worker, or "redis" shared); TTL 0 disables
+    JOBS_CACHE_BACKEND = os.getenv("JOBS_CACHE_BACKEND", "memory")
+    JOBS_CACHE_MAX_SIZE = int(os.getenv("JOBS_CACHE_MAX_SIZE", 1024))
+    JOBS_CACHE_TTL = int(os.getenv("JOBS_CACHE_TTL", 60))
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Facet counts: top values per facet, salary histogram width and cache TTL (0 disables)
+    JOBS_FACETS_LIMIT = int(os.getenv("JOBS_FACETS_LIMIT", 20))
+    JOBS_SALARY_BUCKET_SIZE = int(os.getenv("JOBS_SALARY_BUCKET_SIZE", 10000))
+    JOBS_FACETS_CACHE_TTL = int(os.getenv("JOBS_FACETS_CACHE_TTL", 30))
+
+    # Rows fetched per round-trip by the streaming catalog export
+    JOBS_EXPORT_BATCH_SIZE = int(os.getenv("JOBS_EXPORT_BATCH_SIZE", 1000))
+
+    # Response compression (Flask-Compress): algorithms by preference, bodies below
+    # COMPRESS_MIN_SIZE bytes are sent as is. Streamed exports use br/deflate.
+    COMPRESS_ALGORITHM = os.getenv("COMPRESS_ALGORITHM", "br,gzip").split(",")
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 500))
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", 6))
+    COMPRESS_BR_LEVEL = int(os.getenv("COMPRESS_BR_LEVEL", 4))
+    COMPRESS_ALGORITHM_STREAMING = ["br", "deflate"]
+    COMPRESS_MIMETYPES = ["application/json", "application/x-ndjson", "text/csv", "text/html"]
+
+    # Opt-in per-request SQL profiling: query count, DB time and slowest statements in response
+    # headers and a log line; statements run SQL_PROFILING_REPEAT_THRESHOLD+ times are flagged as N+1
+    SQL_PROFILING = os.getenv("SQL_PROFILING", "False").lower() in ("true", "1", "yes")
+    SQL_PROFILING_SLOWEST = int(os.getenv("SQL_PROFILING_SLOWEST", 3))
+    SQL_PROFILING_REPEAT_THRESHOLD = int(os.getenv("SQL_PROFILING_REPEAT_THRESHOLD", 5))
+
+    # Distributed tracing: "none", "console", "file" (JSON lines in TRACING_FILE) or "otlp"
+    TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none")
+    TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+    TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", 1.0))
+
     # Threshold for low stock alerts
     LOW_STOCK_THRESHOLD=int(10)
 
@@ -0,0 +1,82 @@
+"""
+Gunicorn settings for running the job listing service in production.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Workers are sized from the container's CPU and memory limits, which Kubernetes
+passes in as CONTAINER_CPU_LIMIT and CONTAINER_MEMORY_LIMIT (downward API),
+falling back to the CPUs the process may run on. Every value can be
+overridden through the environment.
+"""
+import os
+import shutil
+
+
+def worker_count(cpus, memory_bytes, worker_memory_mb, per_cpu, extra=0):
+    """
+    Size the worker pool from CPU, then cap it so the workers fit in memory.
+
+    Leaves 20% of the memory limit as headroom for the master and page cache.
+    """
+    workers = cpus * per_cpu + extra
+    if memory_bytes:
+        workers = min(workers, int(memory_bytes * 0.8 // (worker_memory_mb * 1024 * 1024)))
+    return max(1, workers)
+
+
+def available_cpus():
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Limits of the container (whole CPUs, bytes); unset outside Kubernetes
+cpu_limit = available_cpus()
+cpu_limit = min(cpu_limit, int(os.getenv("CONTAINER_CPU_LIMIT") or 0) or cpu_limit)
+memory_limit = int(os.getenv("CONTAINER_MEMORY_LIMIT") or 0) or None
+
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# Classic (2 x CPU) + 1
+workers = int(os.getenv("WEB_CONCURRENCY", 0)) or worker_count(
+    cpu_limit,
+    memory_limit,
+    worker_memory_mb=int(os.getenv("GUNICORN_WORKER_MEMORY_MB", 128)),
+    per_cpu=2,
+    extra=1,
+)
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', 5000)}")
+
+# Recycle workers periodically (with jitter so they do not restart together)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+# Give in-flight requests time to finish on SIGTERM before workers are killed
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Heartbeat files on tmpfs so a slow container disk cannot stall workers
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+# Only trust X-Forwarded-* headers from these addresses (set to the ingress proxy's)
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1,::1")
+
+# Workers share Prometheus samples through this directory so /metrics reports all of them
+prometheus_multiproc_dir = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus")
+
+
+def on_starting(server):
+    shutil.rmtree(prometheus_multiproc_dir, ignore_errors=True)
+    os.makedirs(prometheus_multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
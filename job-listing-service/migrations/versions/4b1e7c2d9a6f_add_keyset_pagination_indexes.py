@@ -0,0 +1,38 @@
+"""add keyset pagination indexes
+
+Revision ID: 4b1e7c2d9a6f
+Revises: 98f3d9bbb244
+Create Date: 2026-10-17 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1e7c2d9a6f'
+down_revision: Union[str, None] = '98f3d9bbb244'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial migration created date_created/date_updated while the Job
+    # model maps created_at/updated_at; align them before indexing.
+    op.alter_column('jobs', 'date_created', new_column_name='created_at')
+    op.alter_column('jobs', 'date_updated', new_column_name='updated_at')
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_jobs_company'), 'jobs', ['company'], unique=False)
+    op.create_index(op.f('ix_jobs_location'), 'jobs', ['location'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_location'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_company'), table_name='jobs')
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
+    op.alter_column('jobs', 'updated_at', new_column_name='date_updated')
+    op.alter_column('jobs', 'created_at', new_column_name='date_created')
@@ -1,8 +1,16 @@
 import pytest
 from flask import Flask
 from app.api.db import db
+from app.api.v1.services.jobs import response_cache
 from flask_marshmallow import Marshmallow
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty job response cache"""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
 @pytest.fixture
 def app():
     """Create Flask app for testing"""
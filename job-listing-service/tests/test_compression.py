@@ -0,0 +1,77 @@
+import gzip
+import json
+from unittest.mock import patch
+
+import brotli
+import pytest
+
+from app.api.v1.routes.jobs import bp
+from app.api.v1.services.jobs import JobService
+from app.extensions import compress
+from config import Config
+
+
+class TestResponseCompression:
+    """Test cases for response compression on job routes"""
+
+    @pytest.fixture
+    def client(self, app):
+        """Create a test client with compression configured as in create_app"""
+        for key in dir(Config):
+            if key.startswith("COMPRESS_"):
+                app.config[key] = getattr(Config, key)
+        compress.init_app(app)
+        app.register_blueprint(bp)
+        return app.test_client()
+
+    @pytest.fixture
+    def jobs(self):
+        return [
+            {"id": i, "title": f"Engineer {i}", "description": "Python developer position " * 5,
+             "company": "Tech Corp", "location": "Remote", "salary": 100000.0}
+            for i in range(50)
+        ]
+
+    def test_prefers_brotli(self, client, jobs):
+        """Test br is chosen when accepted and the body round-trips"""
+        with patch.object(JobService, 'get_all_jobs', return_value=(jobs, None, "v")):
+            response = client.get('/api/v1/jobs', headers={'Accept-Encoding': 'gzip, br'})
+
+            assert response.headers['Content-Encoding'] == 'br'
+            assert 'Accept-Encoding' in response.headers['Vary']
+            assert json.loads(brotli.decompress(response.data))['data'] == jobs
+
+    def test_falls_back_to_gzip(self, client, jobs):
+        """Test gzip is used when br is not accepted"""
+        with patch.object(JobService, 'get_all_jobs', return_value=(jobs, None, "v")):
+            response = client.get('/api/v1/jobs', headers={'Accept-Encoding': 'gzip'})
+
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert json.loads(gzip.decompress(response.data))['data'] == jobs
+
+    def test_skips_small_bodies(self, client):
+        """Test responses under COMPRESS_MIN_SIZE are sent uncompressed"""
+        with patch.object(JobService, 'get_job_if_modified', return_value=({"id": 1}, "v", None)):
+            response = client.get('/api/v1/jobs/1', headers={'Accept-Encoding': 'gzip, br'})
+
+            assert 'Content-Encoding' not in response.headers
+            assert json.loads(response.data)['data'] == {"id": 1}
+
+    def test_compressed_etag_still_revalidates(self, client, jobs):
+        """Test the encoding suffix added to the ETag does not defeat If-None-Match"""
+        with patch.object(JobService, 'get_all_jobs', return_value=(jobs, None, "v")):
+            etag = client.get('/api/v1/jobs', headers={'Accept-Encoding': 'br'}).headers['ETag']
+            assert etag.endswith(':br"')
+
+            response = client.get('/api/v1/jobs', headers={'Accept-Encoding': 'br', 'If-None-Match': etag})
+
+            assert response.status_code == 304
+
+    def test_streams_export_with_brotli(self, client, jobs):
+        """Test streamed exports are compressed chunk by chunk"""
+        with patch.object(JobService, 'export_jobs', return_value=iter(jobs)):
+            response = client.get('/api/v1/jobs/export', headers={'Accept-Encoding': 'br'})
+
+            assert response.headers['Content-Encoding'] == 'br'
+            lines = brotli.decompress(response.data).decode().splitlines()
+            assert [json.loads(line) for line in lines] == jobs
@@ -0,0 +1,94 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.api.db.pool import PoolMetrics, engine_options, timed_pool_class
+from config import Config
+
+
+class TestEngineOptions:
+    """Test cases for building engine options from config"""
+
+    @pytest.fixture
+    def config(self):
+        config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+        config["SQLALCHEMY_DATABASE_URI"] = "postgresql://user:secret@db:5432/jobs"
+        return config
+
+    def test_queue_pool_settings(self, config):
+        """Test pool size, overflow, timeout, recycle and pre-ping come from config"""
+        config.update(DB_POOL_SIZE=8, DB_MAX_OVERFLOW=4, DB_POOL_TIMEOUT=2.5, DB_POOL_RECYCLE=600)
+
+        options = engine_options(config)
+
+        assert issubclass(options.pop("poolclass"), QueuePool)
+        assert options == {
+            "pool_size": 8,
+            "max_overflow": 4,
+            "pool_timeout": 2.5,
+            "pool_recycle": 600,
+            "pool_pre_ping": True,
+        }
+
+    def test_pgbouncer_disables_local_pool(self, config):
+        """Test PgBouncer mode opens a connection per checkout"""
+        config["DB_PGBOUNCER"] = True
+
+        options = engine_options(config)
+
+        assert list(options) == ["poolclass"]
+        assert issubclass(options["poolclass"], NullPool)
+
+    def test_sqlite_keeps_default_pool(self, config):
+        """Test SQLite URLs are left to SQLAlchemy's defaults"""
+        config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+
+        assert engine_options(config) == {}
+
+
+class TestPoolMetrics:
+    """Test cases for connection checkout metrics"""
+
+    @pytest.fixture
+    def metrics(self):
+        return PoolMetrics()
+
+    @pytest.fixture
+    def pool(self, metrics):
+        pool_class = timed_pool_class(QueuePool, metrics)
+        return pool_class(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.01)
+
+    def test_records_checkouts(self, pool, metrics):
+        """Test each checkout is counted and the pool usage is reported"""
+        connection = pool.connect()
+
+        stats = metrics.stats(pool)
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 0
+        assert stats["checked_out"] == 1
+        assert stats["size"] == 1
+
+        connection.close()
+        pool.connect().close()
+        assert metrics.stats(pool)["checkouts"] == 2
+        assert metrics.stats(pool)["checked_out"] == 0
+
+    def test_records_timeouts(self, pool, metrics):
+        """Test a checkout that times out waiting for a connection is counted"""
+        connection = pool.connect()
+
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+
+        stats = metrics.stats()
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_ms"] >= 10
+        connection.close()
+
+    def test_recreated_pool_keeps_metrics(self, pool, metrics):
+        """Test pools recreated by engine.dispose() report to the same counters"""
+        pool.recreate().connect().close()
+
+        assert metrics.stats()["checkouts"] == 1
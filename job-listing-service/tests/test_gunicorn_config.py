@@ -0,0 +1,70 @@
+import os
+import runpy
+from unittest.mock import patch
+
+import pytest
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gunicorn.conf.py")
+
+
+def load_config(**env):
+    with patch.dict(os.environ, env):
+        return runpy.run_path(CONFIG_PATH)
+
+
+class TestGunicornConfig:
+    """Test cases for the production gunicorn settings"""
+
+    @pytest.fixture
+    def config(self):
+        return load_config()
+
+    def test_container_limits(self):
+        """Test workers are sized from the CPU and memory limits passed in by the deployment"""
+        with patch("os.sched_getaffinity", return_value=set(range(8))):
+            config = load_config(CONTAINER_CPU_LIMIT="2", CONTAINER_MEMORY_LIMIT=str(512 * 1024 * 1024))
+
+        assert config["cpu_limit"] == 2
+        assert config["memory_limit"] == 512 * 1024 * 1024
+        assert config["workers"] == 3
+
+    def test_without_limits_uses_available_cpus(self):
+        """Test every CPU the process may run on is used when no limit is passed in"""
+        with patch("os.sched_getaffinity", return_value=set(range(4))):
+            config = load_config(CONTAINER_CPU_LIMIT="", CONTAINER_MEMORY_LIMIT="")
+
+        assert config["cpu_limit"] == 4
+        assert config["memory_limit"] is None
+        assert config["workers"] == 9
+
+    def test_worker_count_capped_by_memory(self, config):
+        """Test the CPU-based worker count is reduced to fit the memory limit"""
+        worker_count = config["worker_count"]
+
+        assert worker_count(2, None, 128, per_cpu=2, extra=1) == 5
+        assert worker_count(2, 512 * 1024 * 1024, 128, per_cpu=2, extra=1) == 3
+        assert worker_count(4, 64 * 1024 * 1024, 128, per_cpu=2, extra=1) == 1
+
+    def test_environment_overrides(self):
+        """Test WEB_CONCURRENCY and GUNICORN_* variables override the defaults"""
+        config = load_config(
+            WEB_CONCURRENCY="7",
+            GUNICORN_WORKER_CLASS="sync",
+            GUNICORN_MAX_REQUESTS="500",
+            PORT="8080",
+        )
+
+        assert config["workers"] == 7
+        assert config["worker_class"] == "sync"
+        assert config["max_requests"] == 500
+        assert config["bind"] == "0.0.0.0:8080"
+
+    def test_defaults(self, config):
+        """Test recycling and graceful shutdown are enabled by default"""
+        assert config["workers"] >= 1
+        assert config["worker_class"] == "gthread"
+        assert config["max_requests"] == 1000
+        assert config["max_requests_jitter"] == 100
+        assert config["graceful_timeout"] == 30
+        assert config["bind"] == "0.0.0.0:5000"
+        assert config["forwarded_allow_ips"] == "127.0.0.1,::1"
@@ -1,5 +1,6 @@
 import pytest
 import json
+from datetime import datetime
 from unittest.mock import patch
 
 from marshmallow import ValidationError
@@ -8,6 +9,15 @@ from app.api.v1.routes.jobs import bp
 from app.api.v1.services.jobs import JobService
 
 
+def job_lookup(data, version, updated_at=None):
+    """Stand-in for JobService.get_job_if_modified that honours `is_current`"""
+    def lookup(job_id, is_current=None, fields=None):
+        if is_current is not None and is_current(version, updated_at):
+            return None, version, updated_at
+        return data, version, updated_at
+    return lookup
+
+
 class TestJobRoutes:
     """Test cases for job routes"""
 
@@ -99,13 +109,93 @@ class TestJobRoutes:
     def test_list_jobs_success(self, client, sample_job_response):
         """Test successful job listing"""
         jobs_list = [sample_job_response]
-        with patch.object(JobService, 'get_all_jobs', return_value=jobs_list):
+        with patch.object(JobService, 'get_all_jobs', return_value=(jobs_list, None, "v1")):
             response = client.get('/api/v1/jobs')
 
             assert response.status_code == 200
             data = json.loads(response.data)
             assert data['message'] == "Jobs fetched successfully"
             assert data['data'] == jobs_list
+            assert data['pagination'] == {"next_cursor": None, "has_more": False}
+
+    def test_list_jobs_passes_query_params(self, client, sample_job_response):
+        """Test pagination and filter params are forwarded to the service"""
+        with patch.object(JobService, 'get_all_jobs',
+                          return_value=([sample_job_response], "abc", "v1")) as mock_get:
+            response = client.get('/api/v1/jobs?limit=5&cursor=xyz&company=Tech%20Corp'
+                                  '&location=New%20York&min_salary=1000&max_salary=200000')
+
+            assert response.status_code == 200
+            expected = dict(
+                limit=5, cursor="xyz", company="Tech Corp", location="New York",
+                min_salary=1000.0, max_salary=200000.0
+            )
+            mock_get.assert_called_once_with(**expected, fields=None)
+            data = json.loads(response.data)
+            assert data['pagination'] == {"next_cursor": "abc", "has_more": True}
+
+    def test_list_jobs_sends_validators(self, client, sample_job_response):
+        """Test the listing returns an ETag but no Last-Modified"""
+        with patch.object(JobService, 'get_all_jobs',
+                          return_value=([sample_job_response], None, "1:v")):
+            response = client.get('/api/v1/jobs')
+
+            assert response.status_code == 200
+            assert response.headers['ETag'].startswith('"')
+            assert 'Last-Modified' not in response.headers
+            assert response.headers['Cache-Control'] == "no-cache"
+
+    def test_list_jobs_ignores_if_modified_since(self, client):
+        """Test If-Modified-Since alone never yields a 304 for the listing"""
+        with patch.object(JobService, 'get_all_jobs', return_value=([{"id": 1}], None, "1:v")):
+            response = client.get('/api/v1/jobs',
+                                  headers={'If-Modified-Since': "Fri, 01 Jan 2100 00:00:00 GMT"})
+
+            assert response.status_code == 200
+            assert json.loads(response.data)['data'] == [{"id": 1}]
+
+    def test_list_jobs_not_modified(self, client):
+        """Test a matching If-None-Match returns an empty 304"""
+        with patch.object(JobService, 'get_all_jobs', return_value=([{"id": 1}], None, "1:v")):
+            etag = client.get('/api/v1/jobs').headers['ETag']
+
+            response = client.get('/api/v1/jobs', headers={'If-None-Match': etag})
+
+            assert response.status_code == 304
+            assert response.data == b""
+            assert response.headers['ETag'] == etag
+
+    def test_list_jobs_with_fields(self, client):
+        """Test fields are normalized and vary the ETag"""
+        with patch.object(JobService, 'get_all_jobs', return_value=([{"id": 1}], None, "1:v")) as mock_get:
+            response = client.get('/api/v1/jobs?fields=id,%20title')
+            reordered = client.get('/api/v1/jobs?fields=title,id,title')
+            full = client.get('/api/v1/jobs')
+
+            assert response.status_code == 200
+            assert mock_get.call_args_list[0].kwargs['fields'] == ("id", "title")
+            assert mock_get.call_args_list[1].kwargs['fields'] == ("id", "title")
+            assert reordered.headers['ETag'] == response.headers['ETag']
+            assert response.headers['ETag'] != full.headers['ETag']
+
+    def test_list_jobs_unknown_fields(self, client):
+        """Test unknown fields are rejected before querying"""
+        with patch.object(JobService, 'get_all_jobs') as mock_get:
+            response = client.get('/api/v1/jobs?fields=id,secret')
+
+            assert response.status_code == 400
+            assert json.loads(response.data)['message'] == "Unknown fields: secret"
+            mock_get.assert_not_called()
+
+    def test_list_jobs_invalid_query(self, client):
+        """Test job listing with an invalid cursor"""
+        with patch.object(JobService, 'get_all_jobs',
+                          side_effect=ValueError("Invalid cursor")):
+            response = client.get('/api/v1/jobs?cursor=bad')
+
+            assert response.status_code == 400
+            data = json.loads(response.data)
+            assert "Invalid cursor" in data['message']
 
     def test_list_jobs_error(self, client):
         """Test job listing with error"""
@@ -117,19 +207,236 @@ class TestJobRoutes:
             data = json.loads(response.data)
             assert 'error' in data or 'message' in data
 
+    def test_list_jobs_with_ids_batch_lookup(self, client, sample_job_response):
+        """Test ?ids= switches the listing to a batch lookup"""
+        with patch.object(JobService, 'get_jobs_by_ids',
+                          return_value=([sample_job_response], [7])) as mock_batch:
+            response = client.get('/api/v1/jobs?ids=1,7')
+
+            assert response.status_code == 200
+            mock_batch.assert_called_once_with([1, 7])
+            data = json.loads(response.data)
+            assert data['data'] == {"jobs": [sample_job_response], "missing_ids": [7]}
+
+    def test_list_jobs_with_invalid_ids(self, client):
+        """Test ?ids= with non-integer values"""
+        response = client.get('/api/v1/jobs?ids=1,abc')
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert "ids must be a list of integers" in data['message']
+
+    def test_batch_get_jobs_success(self, client, sample_job_response):
+        """Test POST batch lookup"""
+        with patch.object(JobService, 'get_jobs_by_ids',
+                          return_value=([sample_job_response], [])) as mock_batch:
+            response = client.post('/api/v1/jobs/batch',
+                                   data=json.dumps({"ids": [1]}),
+                                   content_type='application/json')
+
+            assert response.status_code == 200
+            mock_batch.assert_called_once_with([1])
+            data = json.loads(response.data)
+            assert data['data'] == {"jobs": [sample_job_response], "missing_ids": []}
+
+    def test_batch_get_jobs_too_many_ids(self, client):
+        """Test POST batch lookup rejected by the service"""
+        with patch.object(JobService, 'get_jobs_by_ids',
+                          side_effect=ValueError("A maximum of 100 job ids can be requested at once")):
+            response = client.post('/api/v1/jobs/batch',
+                                   data=json.dumps({"ids": list(range(101))}),
+                                   content_type='application/json')
+
+            assert response.status_code == 400
+
+    def test_batch_get_jobs_missing_body(self, client):
+        """Test POST batch lookup without an ids list"""
+        response = client.post('/api/v1/jobs/batch',
+                               data=json.dumps({}),
+                               content_type='application/json')
+
+        assert response.status_code == 400
+
+    def test_bulk_create_jobs_all_created(self, client, sample_job_data):
+        """Test bulk create returns 201 when every item is created"""
+        results = [{"index": 0, "status": "created", "id": 1}]
+        with patch.object(JobService, 'bulk_create_jobs', return_value=results) as mock_bulk:
+            response = client.post('/api/v1/jobs/bulk',
+                                   data=json.dumps([sample_job_data]),
+                                   content_type='application/json')
+
+            assert response.status_code == 201
+            mock_bulk.assert_called_once_with([sample_job_data])
+            data = json.loads(response.data)
+            assert data['data'] == {"succeeded": 1, "failed": 0, "results": results}
+
+    def test_bulk_create_jobs_partial_failure(self, client, sample_job_data):
+        """Test bulk create returns 207 when some items fail"""
+        results = [
+            {"index": 0, "status": "created", "id": 1},
+            {"index": 1, "status": "invalid", "errors": {"title": ["Missing data for required field."]}}
+        ]
+        with patch.object(JobService, 'bulk_create_jobs', return_value=results):
+            response = client.post('/api/v1/jobs/bulk',
+                                   data=json.dumps([sample_job_data, {}]),
+                                   content_type='application/json')
+
+            assert response.status_code == 207
+            data = json.loads(response.data)
+            assert data['data']['failed'] == 1
+
+    def test_bulk_create_jobs_requires_list(self, client, sample_job_data):
+        """Test bulk create rejects a non-list body"""
+        response = client.post('/api/v1/jobs/bulk',
+                               data=json.dumps(sample_job_data),
+                               content_type='application/json')
+
+        assert response.status_code == 400
+
+    def test_bulk_update_jobs_success(self, client):
+        """Test bulk update"""
+        results = [{"index": 0, "id": 1, "status": "updated"}]
+        with patch.object(JobService, 'bulk_update_jobs', return_value=results):
+            response = client.patch('/api/v1/jobs/bulk',
+                                    data=json.dumps([{"id": 1, "salary": 1.0}]),
+                                    content_type='application/json')
+
+            assert response.status_code == 200
+
+    def test_bulk_delete_jobs_success(self, client):
+        """Test bulk delete"""
+        results = [{"index": 0, "id": 1, "status": "deleted"}, {"index": 1, "id": 2, "status": "not_found"}]
+        with patch.object(JobService, 'bulk_delete_jobs', return_value=results) as mock_bulk:
+            response = client.delete('/api/v1/jobs/bulk',
+                                     data=json.dumps({"ids": [1, 2]}),
+                                     content_type='application/json')
+
+            assert response.status_code == 207
+            mock_bulk.assert_called_once_with([1, 2])
+
+    def test_bulk_delete_jobs_invalid_ids(self, client):
+        """Test bulk delete rejects non-integer ids"""
+        for ids in (["a"], [1, True]):
+            response = client.delete('/api/v1/jobs/bulk',
+                                     data=json.dumps({"ids": ids}),
+                                     content_type='application/json')
+
+            assert response.status_code == 400
+
+    def test_export_jobs_ndjson(self, client, sample_job_response):
+        """Test NDJSON export streams one job per line"""
+        with patch.object(JobService, 'export_jobs',
+                          return_value=iter([sample_job_response, sample_job_response])) as mock_export:
+            response = client.get('/api/v1/jobs/export')
+
+            assert response.status_code == 200
+            assert response.mimetype == 'application/x-ndjson'
+            mock_export.assert_called_once_with(None)
+            lines = response.get_data(as_text=True).splitlines()
+            assert [json.loads(line) for line in lines] == [sample_job_response, sample_job_response]
+
+    def test_export_jobs_csv_since(self, client, sample_job_response):
+        """Test CSV export with a since filter"""
+        with patch.object(JobService, 'export_jobs',
+                          return_value=iter([sample_job_response])) as mock_export:
+            response = client.get('/api/v1/jobs/export?format=csv&since=2025-01-01T00:00:00')
+
+            assert response.status_code == 200
+            assert response.mimetype == 'text/csv'
+            mock_export.assert_called_once_with(datetime(2025, 1, 1))
+            lines = response.get_data(as_text=True).splitlines()
+            assert lines[0].split(',')[:2] == ["id", "title"]
+            assert lines[1].startswith("1,Software Engineer,")
+
+    def test_export_jobs_invalid_params(self, client):
+        """Test export rejects unknown formats and bad timestamps"""
+        assert client.get('/api/v1/jobs/export?format=xml').status_code == 400
+        assert client.get('/api/v1/jobs/export?since=yesterday').status_code == 400
+
+    def test_search_jobs_success(self, client, sample_job_response):
+        """Test search forwards params and returns pagination"""
+        with patch.object(JobService, 'search_jobs',
+                          return_value=([sample_job_response], "next")) as mock_search:
+            response = client.get('/api/v1/jobs/search?q=python&limit=5')
+
+            assert response.status_code == 200
+            mock_search.assert_called_once_with("python", limit=5, cursor=None)
+            data = json.loads(response.data)
+            assert data['data'] == [sample_job_response]
+            assert data['pagination'] == {"next_cursor": "next", "has_more": True}
+
+    def test_search_jobs_missing_query(self, client):
+        """Test search without q"""
+        with patch.object(JobService, 'search_jobs', side_effect=ValueError("q is required")):
+            response = client.get('/api/v1/jobs/search')
+
+            assert response.status_code == 400
+
+    def test_job_facets_success(self, client):
+        """Test facets forwards filters and returns the aggregates"""
+        facets = {"total": 1, "companies": [{"value": "Tech Corp", "count": 1}], "locations": [], "salaries": []}
+        with patch.object(JobService, 'get_facets', return_value=facets) as mock_facets:
+            response = client.get('/api/v1/jobs/facets?company=Tech%20Corp&min_salary=1000')
+
+            assert response.status_code == 200
+            mock_facets.assert_called_once_with(
+                company="Tech Corp", location=None, min_salary=1000.0, max_salary=None
+            )
+            assert json.loads(response.data)['data'] == facets
+
+    def test_job_facets_invalid_filters(self, client):
+        """Test facets with an invalid salary range"""
+        with patch.object(JobService, 'get_facets',
+                          side_effect=ValueError("min_salary cannot be greater than max_salary")):
+            response = client.get('/api/v1/jobs/facets?min_salary=10&max_salary=1')
+
+            assert response.status_code == 400
+
     def test_get_job_success(self, client, sample_job_response):
         """Test successful job retrieval"""
-        with patch.object(JobService, 'get_job', return_value=sample_job_response):
+        with patch.object(JobService, 'get_job_if_modified',
+                          side_effect=job_lookup(sample_job_response, "1:v", datetime(2024, 1, 1))):
             response = client.get('/api/v1/jobs/1')
 
             assert response.status_code == 200
             data = json.loads(response.data)
             assert data['message'] == "Job fetched successfully"
             assert data['data'] == sample_job_response
+            assert response.headers['ETag']
+            assert response.headers['Last-Modified'] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_get_job_not_modified(self, client):
+        """Test conditional job requests return 304 until the job changes"""
+        updated_at = datetime(2024, 1, 1, 12, 0, 0, 500)
+        with patch.object(JobService, 'get_job_if_modified', side_effect=job_lookup({"id": 1}, "1:v1", updated_at)):
+            etag = client.get('/api/v1/jobs/1').headers['ETag']
+
+            response = client.get('/api/v1/jobs/1', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            assert response.headers['ETag'] == etag
+            assert client.get('/api/v1/jobs/1', headers={
+                'If-Modified-Since': "Mon, 01 Jan 2024 12:00:00 GMT"
+            }).status_code == 304
+
+        with patch.object(JobService, 'get_job_if_modified', side_effect=job_lookup({"id": 1}, "1:v2", updated_at)):
+            response = client.get('/api/v1/jobs/1', headers={'If-None-Match': etag})
+
+            assert response.status_code == 200
+            assert response.headers['ETag'] != etag
+
+    def test_get_job_with_fields(self, client):
+        """Test fields are forwarded to the service and validated"""
+        with patch.object(JobService, 'get_job_if_modified',
+                          side_effect=job_lookup({"title": "Engineer"}, "1:v")) as mock_get:
+            response = client.get('/api/v1/jobs/1?fields=title')
+
+            assert response.status_code == 200
+            assert mock_get.call_args.kwargs == {"fields": ("title",)}
+            assert client.get('/api/v1/jobs/1?fields=nope').status_code == 400
 
     def test_get_job_not_found(self, client):
         """Test job retrieval when job not found"""
-        with patch.object(JobService, 'get_job',
+        with patch.object(JobService, 'get_job_if_modified',
                           side_effect=ValueError("Job not found")):
             response = client.get('/api/v1/jobs/999')
 
@@ -140,7 +447,7 @@ class TestJobRoutes:
 
     def test_get_job_unexpected_error(self, client):
         """Test job retrieval with unexpected error"""
-        with patch.object(JobService, 'get_job',
+        with patch.object(JobService, 'get_job_if_modified',
                           side_effect=Exception("Database error")):
             response = client.get('/api/v1/jobs/1')
 
@@ -0,0 +1,490 @@
+import struct
+
+import pytest
+from datetime import datetime, timedelta
+
+from sqlalchemy import Float, event
+from sqlalchemy.dialects import postgresql
+
+from app.api.db import db
+from app.api.v1.models.jobs import Job
+from app.api.utils.pagination import decode_rank_cursor, encode_rank_cursor
+from app.api.v1.services.jobs import JobService, response_cache
+
+
+class TestJobService:
+    """Test cases for JobService against an in-memory database"""
+
+    @pytest.fixture
+    def jobs(self, app):
+        """Seed jobs with distinct creation times, oldest first"""
+        base = datetime(2025, 1, 1)
+        rows = []
+        for i in range(5):
+            rows.append(Job(
+                title=f"Engineer {i}",
+                description="Python developer position",
+                company="Tech Corp" if i % 2 == 0 else "Other Inc",
+                location="New York" if i < 3 else "Remote",
+                salary=50000 + i * 10000,
+                created_at=base + timedelta(days=i)
+            ))
+        db.session.add_all(rows)
+        db.session.commit()
+        return rows
+
+    def test_get_all_jobs_paginates_newest_first(self, jobs):
+        """Test keyset pagination walks all jobs without gaps or duplicates"""
+        first_page, cursor, *_ = JobService.get_all_jobs(limit=2)
+        assert [job['title'] for job in first_page] == ["Engineer 4", "Engineer 3"]
+        assert cursor is not None
+
+        second_page, cursor, *_ = JobService.get_all_jobs(limit=2, cursor=cursor)
+        assert [job['title'] for job in second_page] == ["Engineer 2", "Engineer 1"]
+
+        last_page, cursor, *_ = JobService.get_all_jobs(limit=2, cursor=cursor)
+        assert [job['title'] for job in last_page] == ["Engineer 0"]
+        assert cursor is None
+
+    def test_get_all_jobs_breaks_created_at_ties_by_id(self, app):
+        """Test jobs sharing a timestamp are not skipped across pages"""
+        created_at = datetime(2025, 1, 1)
+        db.session.add_all([
+            Job(title=f"Job {i}", company="Tech Corp", created_at=created_at)
+            for i in range(3)
+        ])
+        db.session.commit()
+
+        first_page, cursor, *_ = JobService.get_all_jobs(limit=2)
+        second_page, cursor, *_ = JobService.get_all_jobs(limit=2, cursor=cursor)
+
+        ids = [job['id'] for job in first_page + second_page]
+        assert ids == [3, 2, 1]
+        assert cursor is None
+
+    def test_get_all_jobs_filters(self, jobs):
+        """Test company, location and salary filters"""
+        results, _, *_ = JobService.get_all_jobs(company="Tech Corp", location="New York")
+        assert [job['title'] for job in results] == ["Engineer 2", "Engineer 0"]
+
+        results, _, *_ = JobService.get_all_jobs(min_salary=60000, max_salary=80000)
+        assert [job['title'] for job in results] == ["Engineer 3", "Engineer 2", "Engineer 1"]
+
+    def test_get_all_jobs_caps_limit(self, jobs, monkeypatch):
+        """Test limit is capped at the configured maximum"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_MAX_PAGE_SIZE", 3)
+        results, cursor, *_ = JobService.get_all_jobs(limit=50)
+        assert len(results) == 3
+        assert cursor is not None
+
+    def test_get_all_jobs_invalid_params(self, jobs):
+        """Test invalid pagination and filter parameters"""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            JobService.get_all_jobs(cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="limit"):
+            JobService.get_all_jobs(limit=0)
+        with pytest.raises(ValueError, match="min_salary"):
+            JobService.get_all_jobs(min_salary=10, max_salary=5)
+
+    def test_get_jobs_by_ids_preserves_order_and_reports_missing(self, jobs):
+        """Test batch lookup returns jobs in request order with missing ids"""
+        results, missing = JobService.get_jobs_by_ids([3, 99, 1, 3])
+
+        assert [job['id'] for job in results] == [3, 1]
+        assert missing == [99]
+
+    def test_get_jobs_by_ids_limits(self, jobs, monkeypatch):
+        """Test batch lookup rejects empty and oversized requests"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_BATCH_MAX_IDS", 2)
+        with pytest.raises(ValueError, match="At least one"):
+            JobService.get_jobs_by_ids([])
+        with pytest.raises(ValueError, match="maximum of 2"):
+            JobService.get_jobs_by_ids([1, 2, 3])
+
+    def test_bulk_create_jobs_reports_per_item_results(self, app, monkeypatch):
+        """Test valid items are inserted in chunks and invalid ones reported"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_BULK_CHUNK_SIZE", 2)
+        items = [
+            {"title": f"Job {i}", "description": "desc", "company": "Tech Corp", "location": "Remote"}
+            for i in range(4)
+        ]
+        items.insert(2, {"title": "Missing company", "description": "desc", "location": "Remote"})
+        items.append("not a job")
+
+        results = JobService.bulk_create_jobs(items)
+
+        assert [result["status"] for result in results] == [
+            "created", "created", "invalid", "created", "created", "invalid"
+        ]
+        assert "company" in results[2]["errors"]
+        assert results[5]["errors"]
+        created_ids = [result["id"] for result in results if result["status"] == "created"]
+        assert sorted(created_ids) == [job.id for job in Job.query.order_by(Job.id).all()]
+        assert db.session.get(Job, results[0]["id"]).title == "Job 0"
+        assert db.session.get(Job, results[0]["id"]).created_at is not None
+
+    def test_bulk_update_jobs(self, jobs, monkeypatch):
+        """Test bulk update applies fields and reports missing and invalid items"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_BULK_CHUNK_SIZE", 2)
+        results = JobService.bulk_update_jobs([
+            {"id": jobs[0].id, "salary": 1.0},
+            {"id": 999, "salary": 2.0},
+            {"id": jobs[1].id, "salary": "lots"},
+            {"salary": 3.0},
+            {"id": jobs[2].id, "title": "Renamed"},
+            {"id": True, "salary": 4.0},
+        ])
+
+        assert [result["status"] for result in results] == [
+            "updated", "not_found", "invalid", "invalid", "updated", "invalid"
+        ]
+        db.session.expire_all()
+        assert db.session.get(Job, jobs[0].id).salary == 1.0
+        assert db.session.get(Job, jobs[2].id).title == "Renamed"
+        assert db.session.get(Job, jobs[1].id).salary == 60000
+
+    def test_bulk_delete_jobs(self, jobs, monkeypatch):
+        """Test bulk delete removes existing jobs and reports missing ids"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_BULK_CHUNK_SIZE", 2)
+        results = JobService.bulk_delete_jobs([jobs[0].id, 999, jobs[1].id])
+
+        assert [result["status"] for result in results] == ["deleted", "not_found", "deleted"]
+        assert Job.query.count() == 3
+
+    def test_bulk_limits(self, app, monkeypatch):
+        """Test bulk operations reject empty and oversized requests"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_BULK_MAX_ITEMS", 1)
+        with pytest.raises(ValueError, match="At least one"):
+            JobService.bulk_delete_jobs([])
+        with pytest.raises(ValueError, match="maximum of 1"):
+            JobService.bulk_create_jobs([{}, {}])
+
+    def test_export_jobs_streams_all_rows(self, jobs, monkeypatch):
+        """Test export yields every job in id order across batches"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_EXPORT_BATCH_SIZE", 2)
+        exported = list(JobService.export_jobs())
+
+        assert [job['id'] for job in exported] == [job.id for job in jobs]
+        assert exported[0]['title'] == "Engineer 0"
+        assert exported[0]['date_created'] == "2025-01-01T00:00:00"
+
+    def test_export_jobs_since(self, jobs):
+        """Test export only yields jobs updated after `since`"""
+        jobs[3].updated_at = datetime(2030, 1, 1)
+        db.session.commit()
+
+        exported = list(JobService.export_jobs(since=datetime(2029, 1, 1)))
+
+        assert [job['id'] for job in exported] == [jobs[3].id]
+
+    def test_search_jobs_ranks_title_matches_first(self, app):
+        """Test full-text search ranks title matches above description matches"""
+        db.session.add_all([
+            Job(title="Java Developer", description="Some python scripting", company="A"),
+            Job(title="Python Engineer", description="Backend services", company="B"),
+            Job(title="Designer", description="Figma and sketches", company="C"),
+        ])
+        db.session.commit()
+
+        results, cursor = JobService.search_jobs("python")
+
+        assert [job['title'] for job in results] == ["Python Engineer", "Java Developer"]
+        assert cursor is None
+
+    def test_search_jobs_paginates_and_tracks_updates(self, app):
+        """Test search pagination and that updates and deletes reach the index"""
+        db.session.add_all([
+            Job(title=f"Python Engineer {i}", description="python", company="A") for i in range(3)
+        ])
+        db.session.commit()
+
+        first_page, cursor = JobService.search_jobs("python engineer", limit=2)
+        second_page, cursor = JobService.search_jobs("python engineer", limit=2, cursor=cursor)
+        ids = [job['id'] for job in first_page + second_page]
+        assert sorted(ids) == [1, 2, 3]
+        assert len(set(ids)) == 3
+        assert cursor is None
+
+        job = db.session.get(Job, 1)
+        job.title = "Rust Engineer"
+        job.description = "systems"
+        db.session.delete(db.session.get(Job, 2))
+        db.session.commit()
+
+        results, _ = JobService.search_jobs("python")
+        assert [job['id'] for job in results] == [3]
+
+    def test_search_jobs_pages_through_rank_ties(self, app):
+        """Test a tie group larger than the page is walked once without repeats"""
+        db.session.add_all([Job(title="Python Engineer", description="python", company="A") for _ in range(5)])
+        db.session.commit()
+
+        ids, cursor = [], None
+        for _ in range(5):
+            page, cursor = JobService.search_jobs("python", limit=2, cursor=cursor)
+            ids += [job['id'] for job in page]
+            if cursor is None:
+                break
+
+        assert ids == [5, 4, 3, 2, 1]
+        assert cursor is None
+
+    def test_search_rank_is_double_precision_on_postgres(self):
+        """Test ts_rank (real) is cast to double precision so cursors round-trip exactly"""
+        ranked = JobService._ranked_matches("postgresql", "python", ["python"])
+
+        rank_type = ranked.selected_columns.rank.type
+        assert isinstance(rank_type, Float) and rank_type.precision == 53
+        sql = str(ranked.compile(dialect=postgresql.dialect()))
+        assert "CAST(ts_rank(jobs.search_vector, websearch_to_tsquery(" in sql
+        assert "AS FLOAT(53))" in sql
+
+        # A real widened to double has an exact binary value; the cursor must keep all of it,
+        # otherwise `rank < :last_rank` is true for the boundary row and it repeats
+        rank = struct.unpack("f", struct.pack("f", 0.0607927))[0]
+        assert decode_rank_cursor(encode_rank_cursor(rank, 7)) == (rank, 7)
+
+    def test_search_jobs_escapes_query_syntax(self, app):
+        """Test user input is matched as plain terms"""
+        db.session.add(Job(title="C++ Developer", description="AND OR NOT", company="A"))
+        db.session.commit()
+
+        # FTS5 operators and stray quotes/parentheses must not raise syntax errors
+        results, _ = JobService.search_jobs('"developer" NOT (')
+        assert len(results) == 1
+
+        results, _ = JobService.search_jobs('developer NOT python')
+        assert results == []
+
+    def test_search_jobs_requires_query(self, app):
+        """Test an empty query is rejected"""
+        with pytest.raises(ValueError, match="q is required"):
+            JobService.search_jobs("   ")
+
+    def test_get_facets_counts_in_sql(self, jobs, monkeypatch):
+        """Test company, location and salary facet counts"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_SALARY_BUCKET_SIZE", 20000)
+        facets = JobService.get_facets()
+
+        assert facets["total"] == 5
+        assert facets["companies"] == [
+            {"value": "Tech Corp", "count": 3},
+            {"value": "Other Inc", "count": 2},
+        ]
+        assert facets["locations"] == [
+            {"value": "New York", "count": 3},
+            {"value": "Remote", "count": 2},
+        ]
+        # Salaries are 50k, 60k, 70k, 80k, 90k
+        assert facets["salaries"] == [
+            {"min": 40000, "max": 60000, "count": 1},
+            {"min": 60000, "max": 80000, "count": 2},
+            {"min": 80000, "max": 100000, "count": 2},
+        ]
+
+    def test_get_facets_salary_buckets_floor(self, app, monkeypatch):
+        """Test salaries at and past a bucket's midpoint stay in that bucket"""
+        monkeypatch.setattr("app.api.v1.services.jobs.config.JOBS_SALARY_BUCKET_SIZE", 10000)
+        db.session.add_all([
+            Job(title=f"Job {salary}", company="A", salary=salary) for salary in (90000, 95000, 99999, 100000)
+        ])
+        db.session.commit()
+
+        assert JobService.get_facets()["salaries"] == [
+            {"min": 90000, "max": 100000, "count": 3},
+            {"min": 100000, "max": 110000, "count": 1},
+        ]
+        sql = str(JobService._salary_bucket(10000).compile(dialect=postgresql.dialect()))
+        assert sql.startswith("CAST(floor(jobs.salary /")
+
+    def test_get_facets_applies_filters(self, jobs):
+        """Test facets only count jobs matching the filters"""
+        facets = JobService.get_facets(location="Remote")
+
+        assert facets["total"] == 2
+        assert facets["locations"] == [{"value": "Remote", "count": 2}]
+
+    def test_get_facets_cache_is_invalidated_by_writes(self, jobs):
+        """Test cached facets are reused until a job is written"""
+        assert JobService.get_facets()["total"] == 5
+
+        db.session.add(Job(title="Uncounted", company="Tech Corp"))
+        db.session.commit()
+        assert JobService.get_facets()["total"] == 5
+
+        JobService.create_job({
+            "title": "Counted", "description": "desc", "company": "Tech Corp", "location": "Remote"
+        })
+        assert JobService.get_facets()["total"] == 7
+
+    def test_get_job_if_modified_version_changes_on_update(self, jobs):
+        """Test the job version follows updated_at"""
+        job = jobs[0]
+        data, version, last_modified = JobService.get_job_if_modified(job.id)
+        assert data["title"] == "Engineer 0"
+        assert last_modified == job.updated_at
+
+        job.updated_at = job.updated_at + timedelta(seconds=1)
+        db.session.commit()
+        response_cache.invalidate_jobs(job.id)
+        assert JobService.get_job_if_modified(job.id)[1] != version
+
+    def test_get_job_if_modified_loads_the_row_once(self, jobs):
+        """Test a cache miss costs one query and a current client copy skips serialization"""
+        job_id = jobs[0].id
+        db.session.expire_all()
+        response_cache.backend.clear()
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            data, version, _ = JobService.get_job_if_modified(job_id, is_current=lambda *_: True)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        assert data is None
+        assert version.startswith(f"{job_id}:")
+        assert len(statements) == 1
+        assert response_cache.get_job(job_id) is None
+
+    def test_get_job_if_modified_uses_cached_version(self, jobs):
+        """Test a cached job answers a conditional lookup without a query"""
+        job_id = jobs[0].id
+        _, version, updated_at = JobService.get_job_if_modified(job_id)
+        seen = []
+
+        def is_current(*validators):
+            seen.append(validators)
+            return True
+
+        assert JobService.get_job_if_modified(job_id, is_current)[0] is None
+        assert seen == [(version, updated_at)]
+
+    def test_get_job_if_modified_not_found(self, app_context):
+        """Test the lookup of a missing job"""
+        with pytest.raises(ValueError, match="Job not found"):
+            JobService.get_job_if_modified(999)
+
+    def test_get_all_jobs_version_tracks_page(self, jobs):
+        """Test the page version comes from the page query and changes when a job on the page changes"""
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            _, _, version = JobService.get_all_jobs(limit=2, fields=["title"])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        assert JobService.get_all_jobs(limit=2)[2] == version
+
+        JobService.delete_job(jobs[-1].id)
+        assert JobService.get_all_jobs(limit=2)[2] != version
+
+    def test_get_job_is_served_from_cache(self, jobs):
+        """Test a cached job is returned without reading the row again"""
+        job = jobs[0]
+        assert JobService.get_job(job.id)["title"] == "Engineer 0"
+        hits = response_cache.hits
+
+        db.session.execute(Job.__table__.update().where(Job.id == job.id).values(title="Changed"))
+        db.session.commit()
+
+        assert JobService.get_job(job.id)["title"] == "Engineer 0"
+        assert response_cache.hits == hits + 1
+
+    def test_job_writes_refresh_the_cache(self, jobs):
+        """Test update and delete evict the job and both invalidate cached pages"""
+        job_id = jobs[0].id
+        JobService.get_job(job_id)
+        first_page, _, *_ = JobService.get_all_jobs(limit=5)
+
+        JobService.update_job(job_id, {"title": "Staff Engineer"})
+        assert response_cache.get_job(job_id) is None
+        assert JobService.get_job(job_id)["title"] == "Staff Engineer"
+        assert response_cache.get_job(job_id)["data"]["title"] == "Staff Engineer"
+        assert "Staff Engineer" in [job["title"] for job in JobService.get_all_jobs(limit=5)[0]]
+
+        JobService.delete_job(job_id)
+        with pytest.raises(ValueError, match="Job not found"):
+            JobService.get_job(job_id)
+        assert len(JobService.get_all_jobs(limit=5)[0]) == len(first_page) - 1
+
+    def test_get_job_read_racing_an_update_is_not_cached(self, jobs, monkeypatch):
+        """Test a job read that started before an update is not cached"""
+        job_id = jobs[0].id
+        get = db.session.get
+
+        def get_then_update(*args, **kwargs):
+            job = get(*args, **kwargs)
+            # Snapshot the row as read, before the concurrent update lands
+            snapshot = Job(**{column.name: getattr(job, column.name) for column in Job.__table__.columns})
+            monkeypatch.setattr(db.session, "get", get)
+            JobService.update_job(job_id, {"title": "Staff Engineer"})
+            return snapshot
+
+        response_cache.backend.clear()
+        monkeypatch.setattr(db.session, "get", get_then_update)
+        assert JobService.get_job(job_id)["title"] == "Engineer 0"
+
+        assert response_cache.get_job(job_id) is None
+        assert JobService.get_job(job_id)["title"] == "Staff Engineer"
+
+    def test_update_racing_a_delete_does_not_cache_the_deleted_job(self, jobs, monkeypatch):
+        """Test an update whose cache step runs after a concurrent delete leaves the job uncached"""
+        job_id = jobs[0].id
+        JobService.get_job(job_id)
+        incr = response_cache.backend.incr
+
+        def delete_then_incr(key, amount=1):
+            # The delete commits and invalidates between the update's commit and its cache step
+            monkeypatch.setattr(response_cache.backend, "incr", incr)
+            JobService.delete_job(job_id)
+            return incr(key, amount)
+
+        monkeypatch.setattr(response_cache.backend, "incr", delete_then_incr)
+        JobService.update_job(job_id, {"title": "Staff Engineer"})
+
+        assert response_cache.get_job(job_id) is None
+        with pytest.raises(ValueError, match="Job not found"):
+            JobService.get_job(job_id)
+
+    def test_get_all_jobs_is_cached_until_a_job_is_created(self, jobs):
+        """Test cached pages are reused until a write through the service"""
+        first, _, *_ = JobService.get_all_jobs(limit=2)
+        db.session.add(Job(title="Direct insert", company="Tech Corp", created_at=datetime(2030, 1, 1)))
+        db.session.commit()
+        assert JobService.get_all_jobs(limit=2)[0] == first
+
+        JobService.bulk_create_jobs([
+            {"title": "Bulk", "description": "desc", "company": "Tech Corp", "location": "Remote"}
+        ])
+        assert JobService.get_all_jobs(limit=2)[0][0]["title"] == "Direct insert"
+
+    def test_get_all_jobs_with_fields_selects_only_those_columns(self, jobs):
+        """Test fields narrow both the SELECT and the output"""
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            page, cursor, *_ = JobService.get_all_jobs(limit=2, fields=["title", "id"])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        assert page == [{"id": 5, "title": "Engineer 4"}, {"id": 4, "title": "Engineer 3"}]
+        assert cursor is not None
+        assert "description" not in statements[-1]
+        assert JobService.get_all_jobs(limit=2, fields=["title", "id"])[0] == page
+
+    def test_get_job_with_fields(self, jobs):
+        """Test a job can be projected whether or not it is cached"""
+        job_id = jobs[0].id
+        assert JobService.get_job(job_id, fields=["company"]) == {"company": "Tech Corp"}
+
+        JobService.get_job(job_id)
+        assert JobService.get_job(job_id, fields=["salary", "title"]) == {"title": "Engineer 0", "salary": 50000.0}
+
+    def test_unknown_fields_are_rejected(self, jobs):
+        """Test unknown fields raise ValueError"""
+        with pytest.raises(ValueError, match="Unknown fields: secret"):
+            JobService.get_all_jobs(fields=["title", "secret"])
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.utils.metrics import init_metrics
+from app.api.v1.routes.jobs import bp
+from app.api.v1.services.jobs import JobService
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetrics:
+    """Test cases for the Prometheus metrics endpoint"""
+
+    @pytest.fixture
+    def client(self, app):
+        app.register_blueprint(bp)
+        init_metrics(app)
+        return app.test_client()
+
+    def test_request_latency_is_labelled_by_route_and_status(self, client):
+        """Test requests are counted under their URL rule, not the raw path"""
+        labels = dict(method="GET", route="/api/v1/jobs/<int:job_id>", status="404")
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        client.get('/api/v1/jobs/12345')
+        client.get('/api/v1/jobs/67890')
+
+        assert sample("http_request_duration_seconds_count", **labels) == before + 2
+        assert sample("http_requests_in_progress", method="GET") == 0
+
+    def test_database_queries_and_cache_lookups_are_recorded(self, client):
+        """Test SQL statements and response cache lookups are counted"""
+        queries = sample("db_query_duration_seconds_count", operation="SELECT")
+        misses = sample("cache_lookups_total", cache="jobs", result="miss")
+        hits = sample("cache_lookups_total", cache="jobs", result="hit")
+
+        client.get('/api/v1/jobs')
+        client.get('/api/v1/jobs')
+
+        assert sample("db_query_duration_seconds_count", operation="SELECT") > queries
+        assert sample("cache_lookups_total", cache="jobs", result="miss") > misses
+        assert sample("cache_lookups_total", cache="jobs", result="hit") > hits
+
+    def test_metrics_endpoint(self, client):
+        """Test /metrics serves the Prometheus text format"""
+        with patch.object(JobService, 'get_job', side_effect=ValueError("Job not found")):
+            client.get('/api/v1/jobs/1')
+
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain')
+        body = response.get_data(as_text=True)
+        assert 'http_request_duration_seconds_bucket' in body
+        assert 'db_query_duration_seconds' in body
@@ -0,0 +1,158 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from flask_marshmallow import Marshmallow
+
+from app.api.db import db
+from app.api.db.replica import LAST_WRITE_COOKIE, REPLICA_BIND, ReplicaRouter, replica_router, set_last_write_cookie
+from app.api.v1.models.jobs import Job
+from app.api.v1.routes.jobs import bp
+from app.api.v1.services.jobs import JobService, response_cache
+from config import config
+
+JOB = {"title": "Backend Engineer", "description": "desc", "company": "Tech Corp", "location": "Remote"}
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Flask app with separate primary and replica SQLite databases"""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config['SQLALCHEMY_BINDS'] = {REPLICA_BIND: f"sqlite:///{tmp_path / 'replica.db'}"}
+    db.init_app(app)
+    Marshmallow(app)
+    app.register_blueprint(bp)
+    app.after_request(set_last_write_cookie)
+    replica_router.reset()
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[REPLICA_BIND])
+        yield app
+        db.session.remove()
+        db.drop_all()
+        db.metadata.drop_all(db.engines[REPLICA_BIND])
+    # init_app registers a metadata per bind on the shared `db`; later apps have no replica bind
+    db.metadatas.pop(REPLICA_BIND, None)
+    replica_router.reset()
+
+
+class TestReadReplicaRouting:
+    """Test cases for routing job reads to the read replica"""
+
+    def test_reads_use_replica_and_writes_use_primary(self, app):
+        """Test a job written to the primary is not visible through replica reads"""
+        job = JobService.create_job(JOB)
+        response_cache.clear()
+
+        with pytest.raises(ValueError, match="Job not found"):
+            JobService.get_job(job["id"])
+        assert JobService.get_all_jobs() == ([], None, "")
+        assert replica_router.stats()["replica_reads"] >= 2
+
+    def test_falls_back_to_primary_when_replica_lags(self, app):
+        """Test reads go to the primary while the replica is unusable"""
+        job = JobService.create_job(JOB)
+        response_cache.clear()
+
+        with patch.object(replica_router, "usable", return_value=False):
+            assert JobService.get_job(job["id"])["title"] == "Backend Engineer"
+        assert replica_router.stats()["primary_reads"] == 1
+
+    def test_replica_reads_are_cached_for_at_most_the_max_lag(self, app, monkeypatch):
+        """Test results read from the replica expire from the cache within DB_REPLICA_MAX_LAG"""
+        now = [1000.0]
+        monkeypatch.setattr("app.api.cache.backends.time.monotonic", lambda: now[0])
+        monkeypatch.setattr(config, "DB_REPLICA_MAX_LAG", 5)
+        job = JobService.create_job(JOB)
+        db.session.execute(db.insert(Job).values(id=job["id"], title="Outdated", company="Tech Corp"),
+                           bind_arguments={"bind": db.engines[REPLICA_BIND]})
+        response_cache.clear()
+
+        assert JobService.get_job(job["id"])["title"] == "Outdated"
+        assert JobService.get_all_jobs()[0][0]["title"] == "Outdated"
+        assert JobService.get_facets()["total"] == 1
+        hits = response_cache.stats()["hits"]
+        now[0] += 4
+        assert response_cache.get_job(job["id"])["data"]["title"] == "Outdated"
+        JobService.get_all_jobs()
+        JobService.get_facets()
+        assert response_cache.stats()["hits"] == hits + 3
+
+        now[0] += 2
+        assert response_cache.get_job(job["id"]) is None
+        with patch.object(replica_router, "usable", return_value=False):
+            assert JobService.get_job(job["id"])["title"] == "Backend Engineer"
+        now[0] += 30
+        assert response_cache.get_job(job["id"])["data"]["title"] == "Backend Engineer"
+
+    def test_replica_reads_are_not_cached_without_lag_allowance(self, app, monkeypatch):
+        """Test DB_REPLICA_MAX_LAG=0 keeps replica reads out of the cache"""
+        monkeypatch.setattr(config, "DB_REPLICA_MAX_LAG", 0)
+        job = JobService.create_job(JOB)
+        response_cache.clear()
+
+        with pytest.raises(ValueError):
+            JobService.get_job(job["id"])
+        JobService.get_all_jobs()
+        JobService.get_facets()
+
+        assert len(response_cache.backend) == 0
+
+    def test_client_reads_its_own_writes(self, app):
+        """Test a client that just wrote reads from the primary"""
+        client = app.test_client()
+
+        response = client.post('/api/v1/jobs', data=json.dumps(JOB), content_type='application/json')
+        assert response.status_code == 201
+        assert client.get_cookie(LAST_WRITE_COOKIE) is not None
+        assert len(json.loads(client.get('/api/v1/jobs').data)['data']) == 1
+
+        response_cache.clear()
+        # Requests reuse the fixture's app context (and its `g`), so give the other client its own
+        with app.app_context():
+            other_client = app.test_client()
+            assert json.loads(other_client.get('/api/v1/jobs').data)['data'] == []
+
+
+class TestReplicaRouter:
+    """Test cases for replica lag checks"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        return engine
+
+    def lag_is(self, engine, seconds):
+        engine.connect.return_value.__enter__.return_value.execute.return_value.scalar_one.return_value = seconds
+
+    def test_lag_threshold(self, engine):
+        """Test the replica is unusable while lag exceeds the threshold"""
+        router = ReplicaRouter(max_lag=5, check_interval=0)
+
+        self.lag_is(engine, 1.5)
+        assert router.usable(engine) is True
+        self.lag_is(engine, 12)
+        assert router.usable(engine) is False
+        assert router.stats()["lag_seconds"] == 12
+
+    def test_failed_check_marks_replica_unusable(self, engine):
+        """Test an unreachable replica falls back to the primary"""
+        router = ReplicaRouter(max_lag=5, check_interval=0)
+        engine.connect.side_effect = Exception("connection refused")
+
+        assert router.usable(engine) is False
+        assert router.stats()["lag_seconds"] is None
+
+    def test_lag_is_checked_at_most_once_per_interval(self, engine):
+        """Test repeated reads reuse the last lag measurement"""
+        router = ReplicaRouter(max_lag=5, check_interval=60)
+        self.lag_is(engine, 0)
+
+        router.usable(engine)
+        router.usable(engine)
+
+        assert engine.connect.call_count == 1
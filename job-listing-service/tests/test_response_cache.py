@@ -0,0 +1,237 @@
+import pytest
+from unittest.mock import Mock
+
+from app.api.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.api.cache.responses import JobResponseCache
+
+
+class FakeRedis:
+    """Minimal stand-in for redis.Redis"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        self.ttls[key] = px
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def incr(self, key, amount=1):
+        self.store[key] = int(self.store.get(key, 0)) + amount
+        return self.store[key]
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*")
+        return [key for key in self.store if key.startswith(prefix)]
+
+
+class TestInMemoryCacheBackend:
+    """Test cases for the in-process LRU + TTL backend"""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full"""
+        backend = InMemoryCacheBackend(max_size=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")
+        backend.set("c", 3, ttl=60)
+
+        assert backend.get("a") == 1
+        assert backend.get("b") is None
+        assert backend.get("c") == 3
+        assert backend.evictions == 1
+        assert len(backend) == 2
+
+    def test_expires_entries(self, monkeypatch):
+        """Test entries are dropped after their TTL"""
+        now = [100.0]
+        monkeypatch.setattr("app.api.cache.backends.time.monotonic", lambda: now[0])
+        backend = InMemoryCacheBackend()
+        backend.set("a", 1, ttl=5)
+
+        assert backend.get("a") == 1
+        now[0] = 105.0
+        assert backend.get("a") is None
+        assert backend.evictions == 1
+
+    def test_counters_are_not_evicted(self):
+        """Test counters survive LRU pressure"""
+        backend = InMemoryCacheBackend(max_size=1)
+        backend.incr("generation")
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+
+        assert backend.incr("generation", 0) == 1
+
+    def test_add_only_stores_missing_or_expired_keys(self, monkeypatch):
+        """Test add never replaces a live entry"""
+        now = [100.0]
+        monkeypatch.setattr("app.api.cache.backends.time.monotonic", lambda: now[0])
+        backend = InMemoryCacheBackend()
+
+        assert backend.add("a", 1, ttl=5) is True
+        assert backend.add("a", 2, ttl=5) is False
+        assert backend.get("a") == 1
+        now[0] = 105.0
+        assert backend.add("a", 3, ttl=5) is True
+        assert backend.get("a") == 3
+
+
+class TestRedisCacheBackend:
+    """Test cases for the Redis backend"""
+
+    def test_round_trips_json_with_ttl(self):
+        """Test values are stored as JSON under the prefix with a millisecond TTL"""
+        client = FakeRedis()
+        backend = RedisCacheBackend(client, key_prefix="test:")
+        backend.set("job:1", {"data": {"id": 1}}, ttl=1.5)
+
+        assert client.ttls["test:job:1"] == 1500
+        assert backend.get("job:1") == {"data": {"id": 1}}
+
+        backend.delete("job:1")
+        assert backend.get("job:1") is None
+
+    def test_add_uses_set_if_absent(self):
+        """Test add does not replace an existing key"""
+        backend = RedisCacheBackend(FakeRedis(), key_prefix="test:")
+
+        assert backend.add("job:1", {"id": 1}, ttl=60) is True
+        assert backend.add("job:1", {"id": 2}, ttl=60) is False
+        assert backend.get("job:1") == {"id": 1}
+
+    def test_clear_only_removes_prefixed_keys(self):
+        """Test clear leaves keys owned by other services alone"""
+        client = FakeRedis()
+        client.store["other:key"] = "1"
+        backend = RedisCacheBackend(client, key_prefix="test:")
+        backend.set("job:1", {"id": 1}, ttl=60)
+        backend.incr("jobs:generation")
+
+        backend.clear()
+
+        assert list(client.store) == ["other:key"]
+
+
+class TestJobResponseCache:
+    """Test cases for JobResponseCache"""
+
+    @pytest.fixture
+    def cache(self):
+        return JobResponseCache(InMemoryCacheBackend(max_size=10), ttl=60)
+
+    def test_hit_ratio(self, cache):
+        """Test hits, misses and hit ratio are reported"""
+        assert cache.get_job(1) is None
+        cache.set_job(1, {"data": {"id": 1}})
+        assert cache.get_job(1) == {"data": {"id": 1}}
+        assert cache.get_job(1) == {"data": {"id": 1}}
+
+        assert cache.stats() == {"hits": 2, "misses": 1, "hit_ratio": 0.6667, "evictions": 0}
+
+    def test_list_keys_are_normalized(self, cache):
+        """Test equivalent queries share one entry regardless of argument order"""
+        _, generation = cache.get_list("jobs", {"limit": 20, "company": "Tech Corp"})
+        cache.set_list("jobs", {"limit": 20, "company": "Tech Corp"}, ["page"], generation)
+
+        assert cache.get_list("jobs", {"company": "Tech Corp", "limit": 20}) == (["page"], generation)
+        assert cache.get_list("jobs", {"company": "Other Inc", "limit": 20}) == (None, generation)
+        assert cache.get_list("facets", {"limit": 20, "company": "Tech Corp"}) == (None, generation)
+
+    def test_invalidate_jobs_drops_job_and_lists(self, cache):
+        """Test a job write drops that job and every cached list, but not other jobs"""
+        cache.set_job(1, {"data": {"id": 1}})
+        cache.set_job(2, {"data": {"id": 2}})
+        cache.set_list("jobs", {"limit": 20}, ["page"], cache.generation())
+
+        cache.invalidate_jobs(1)
+
+        assert cache.get_job(1) is None
+        assert cache.get_job(2) == {"data": {"id": 2}}
+        assert cache.get_list("jobs", {"limit": 20})[0] is None
+
+    def test_list_computed_before_a_write_is_not_stored(self, cache):
+        """Test a page read before a write is not cached under the new generation"""
+        _, generation = cache.get_list("jobs", {"limit": 20})
+        cache.invalidate_lists()
+        cache.set_list("jobs", {"limit": 20}, ["stale page"], generation)
+
+        assert cache.get_list("jobs", {"limit": 20})[0] is None
+
+    def test_fill_job_does_not_overwrite_write_through(self, cache):
+        """Test a read fill that raced with a write keeps the written entry"""
+        generation = cache.generation()
+        cache.invalidate_lists()
+        cache.set_job(1, {"data": {"id": 1, "title": "new"}})
+        cache.fill_job(1, {"data": {"id": 1, "title": "old"}}, generation)
+
+        assert cache.get_job(1) == {"data": {"id": 1, "title": "new"}}
+
+    def test_fill_job_skips_reads_older_than_a_delete(self, cache):
+        """Test a job read before it was deleted is not cached"""
+        generation = cache.generation()
+        cache.invalidate_jobs(1)
+        cache.fill_job(1, {"data": {"id": 1}}, generation)
+
+        assert cache.get_job(1) is None
+
+    def test_fill_job_drops_entry_added_during_a_write(self, cache, monkeypatch):
+        """Test an entry added while a write bumps the generation is removed again"""
+        generation = cache.generation()
+        add = cache.backend.add
+
+        def add_then_write(key, value, ttl):
+            stored = add(key, value, ttl)
+            cache.invalidate_jobs(1)
+            return stored
+
+        monkeypatch.setattr(cache.backend, "add", add_then_write)
+        cache.fill_job(1, {"data": {"id": 1}}, generation)
+
+        assert cache.get_job(1) is None
+
+    def test_fill_job_stores_when_nothing_changed(self, cache):
+        """Test a read fill is cached when no write happened"""
+        cache.fill_job(1, {"data": {"id": 1}}, cache.generation())
+
+        assert cache.get_job(1) == {"data": {"id": 1}}
+
+    def test_zero_ttl_disables_caching(self):
+        """Test nothing is stored when the TTL is 0"""
+        cache = JobResponseCache(InMemoryCacheBackend(), ttl=0)
+        cache.set_job(1, {"data": {"id": 1}})
+        cache.fill_job(2, {"data": {"id": 2}}, cache.generation())
+        cache.set_list("facets", {}, {"total": 1}, cache.generation(), ttl=30)
+
+        assert cache.get_job(1) is None
+        assert cache.get_job(2) is None
+        assert cache.get_list("facets", {})[0] == {"total": 1}
+
+    def test_backend_errors_are_misses(self):
+        """Test backend failures do not propagate"""
+        backend = Mock(spec=CacheBackend)
+        backend.evictions = 0
+        backend.get.side_effect = ConnectionError("redis down")
+        backend.set.side_effect = ConnectionError("redis down")
+        backend.incr.side_effect = ConnectionError("redis down")
+        cache = JobResponseCache(backend, ttl=60)
+
+        cache.set_job(1, {"data": {"id": 1}})
+        cache.fill_job(1, {"data": {"id": 1}}, cache.generation())
+        cache.set_list("jobs", {}, ["page"], 1)
+        cache.invalidate_jobs(1)
+        assert cache.get_job(1) is None
+        assert cache.get_list("jobs", {}) == (None, None)
+        backend.add.assert_not_called()
+        backend.set.assert_called_once()
+        assert cache.misses == 2
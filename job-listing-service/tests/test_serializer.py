@@ -0,0 +1,69 @@
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from marshmallow import Schema, fields
+from sqlalchemy import select
+
+from app.api.db import db
+from app.api.utils.json_provider import OrjsonProvider
+from app.api.utils.serializer import compile_serializer
+from app.api.v1.models.jobs import Job
+from app.api.v1.schemas.jobs import JobSchema, dump_job
+
+
+class TestCompiledSerializer:
+    """Test cases for the compiled job serializer"""
+
+    @pytest.fixture
+    def job(self, app):
+        job = Job(
+            title="Engineer", description=None, company="Tech Corp", location="Remote",
+            salary=95000, created_at=datetime(2025, 1, 2, 3, 4, 5, 6)
+        )
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def test_matches_marshmallow_for_orm_objects(self, job):
+        """Test output is identical to JobSchema.dump, including None and float coercion"""
+        assert dump_job(job) == JobSchema().dump(job)
+        assert list(dump_job(job)) == list(JobSchema().dump(job))
+        assert dump_job(job)["salary"] == 95000.0
+
+    def test_matches_marshmallow_for_rows(self, job):
+        """Test plain rows from a Core select serialize the same way"""
+        row = db.session.execute(select(*Job.__table__.columns)).first()
+
+        assert dump_job(row) == JobSchema().dump(row)
+
+    def test_falls_back_to_field_serialize(self):
+        """Test fields without a fast path still use marshmallow"""
+        class EventSchema(Schema):
+            name = fields.Str(data_key="title")
+            when = fields.DateTime(format="%Y-%m-%d")
+            count = fields.Int(as_string=True)
+
+        class Event:
+            name = "launch"
+            when = datetime(2025, 5, 6)
+            count = 3
+
+        assert compile_serializer(EventSchema())(Event()) == EventSchema().dump(Event())
+
+
+class TestOrjsonProvider:
+    """Test cases for the orjson JSON provider"""
+
+    def test_jsonify_round_trip(self):
+        """Test responses are encoded with orjson and decode to the same data"""
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+        payload = {"data": [{"id": 1, "title": "Engineer"}], 1: "non-str key"}
+
+        with app.app_context():
+            response = app.json.response(payload)
+
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data) == {"data": [{"id": 1, "title": "Engineer"}], "1": "non-str key"}
@@ -0,0 +1,85 @@
+import json
+import logging
+
+import pytest
+from sqlalchemy import select
+
+from app.api.db import db
+from app.api.utils.sql_profiler import QueryProfile, init_sql_profiler
+from app.api.v1.models.jobs import Job
+from app.api.v1.routes.jobs import bp
+
+
+class TestSqlProfiler:
+    """Test cases for per-request SQL profiling"""
+
+    @pytest.fixture
+    def client(self, app):
+        app.config['SQL_PROFILING'] = True
+        app.config['SQL_PROFILING_SLOWEST'] = 3
+        app.config['SQL_PROFILING_REPEAT_THRESHOLD'] = 5
+        app.register_blueprint(bp)
+        init_sql_profiler(app)
+
+        @app.route('/n-plus-one')
+        def n_plus_one():
+            for job_id in range(1, 7):
+                db.session.execute(select(Job).where(Job.id == job_id)).first()
+            return {}, 200
+
+        return app.test_client()
+
+    def test_headers_report_query_count_and_time(self, client):
+        """Test the response carries the number of queries and DB time"""
+        response = client.get('/api/v1/jobs')
+
+        assert response.status_code == 200
+        assert int(response.headers['X-DB-Query-Count']) >= 1
+        assert response.headers['Server-Timing'].startswith('db;dur=')
+        assert 'X-DB-Repeated-Queries' not in response.headers
+
+    def test_repeated_statements_are_flagged(self, client, caplog):
+        """Test a statement run once per row is reported as N+1"""
+        with caplog.at_level(logging.INFO, logger='app.api.utils.sql_profiler'):
+            response = client.get('/n-plus-one')
+
+        assert response.headers['X-DB-Query-Count'] == '6'
+        assert response.headers['X-DB-Repeated-Queries'] == '1'
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        summary = json.loads(record.getMessage().removeprefix('SQL profile '))
+        assert summary['path'] == '/n-plus-one'
+        assert summary['queries'] == 6
+        assert summary['repeated'][0]['count'] == 6
+
+    def test_thresholds_come_from_app_config(self, client, app):
+        """Test the repeat threshold is read from the app's config"""
+        app.config['SQL_PROFILING_REPEAT_THRESHOLD'] = 7
+
+        response = client.get('/n-plus-one')
+
+        assert response.headers['X-DB-Query-Count'] == '6'
+        assert 'X-DB-Repeated-Queries' not in response.headers
+
+    def test_disabled_by_default(self, app):
+        """Test no profiling headers are added unless SQL_PROFILING is set"""
+        app.register_blueprint(bp)
+        init_sql_profiler(app)
+
+        response = app.test_client().get('/api/v1/jobs')
+
+        assert 'X-DB-Query-Count' not in response.headers
+
+
+class TestQueryProfile:
+    """Test cases for the query profile"""
+
+    def test_keeps_slowest_statements(self):
+        """Test only the slowest statements are kept, slowest first"""
+        profile = QueryProfile(slowest=2, repeat_threshold=3)
+        for statement, duration in [("a", 0.01), ("b", 0.05), ("c", 0.02), ("d", 0.001)]:
+            profile.record(statement, duration)
+
+        assert [statement for statement, _ in profile.slowest] == ["b", "c"]
+        assert profile.count == 4
+        assert profile.repeated() == []
@@ -0,0 +1,56 @@
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind
+
+from app.api.utils import tracing
+from app.api.v1.routes.jobs import bp
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class TestTracing:
+    """Test cases for request and SQL tracing"""
+
+    @pytest.fixture
+    def exporter(self, monkeypatch):
+        """Record spans with a local provider instead of installing a global one"""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        monkeypatch.setattr(tracing, "tracer", provider.get_tracer(tracing.SERVICE_NAME))
+        return exporter
+
+    @pytest.fixture
+    def client(self, app, exporter):
+        app.register_blueprint(bp)
+        tracing.instrument_app(app)
+        return app.test_client()
+
+    def test_continues_incoming_traceparent(self, client, exporter):
+        """Test the request span joins the caller's trace and SQL spans are its children"""
+        response = client.get('/api/v1/jobs', headers={'traceparent': f"00-{TRACE_ID}-{PARENT_ID}-01"})
+
+        assert response.status_code == 200
+        spans = exporter.get_finished_spans()
+        server = next(span for span in spans if span.kind == SpanKind.SERVER)
+        assert server.name == "GET /api/v1/jobs"
+        assert format(server.context.trace_id, "032x") == TRACE_ID
+        assert format(server.parent.span_id, "016x") == PARENT_ID
+        assert server.attributes["http.response.status_code"] == 200
+
+        queries = [span for span in spans if span.kind == SpanKind.CLIENT]
+        assert queries
+        assert all(span.parent.span_id == server.context.span_id for span in queries)
+        assert queries[0].name == "SELECT"
+
+    def test_starts_new_trace_without_traceparent(self, client, exporter):
+        """Test requests without a traceparent get a root span"""
+        client.get('/api/v1/jobs/12345')
+
+        server = next(span for span in exporter.get_finished_spans() if span.kind == SpanKind.SERVER)
+        assert server.parent is None
+        assert server.name == "GET /api/v1/jobs/<int:job_id>"
+        assert server.attributes["http.response.status_code"] == 404